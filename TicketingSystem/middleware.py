@@ -0,0 +1,64 @@
+"""
+Project-wide middleware.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise's static file middleware, able to run natively in an async
+    middleware chain.
+
+    WhiteNoise is synchronous only, so under ASGI Django would run every
+    request through it on a worker thread, holding the thread until the
+    view returns. This subclass looks static files up on the event loop
+    (an in-memory lookup), serves them from a thread, and awaits the rest
+    of the chain directly.
+
+    Attributes:
+        sync_capable (bool): The middleware runs in sync chains.
+        async_capable (bool): The middleware runs in async chains.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        """
+        Initializes the middleware, switching to async mode when the next
+        handler in the chain is async.
+
+        Args:
+            get_response (callable): The next handler in the chain.
+        """
+        super().__init__(get_response, *args, **kwargs)
+        if asyncio.iscoroutinefunction(get_response):
+            # Like MiddlewareMixin: tells Django the instance is async.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+        else:
+            self._is_coroutine = None
+
+    def __call__(self, request):
+        """
+        Serves a static file or passes the request on.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            HttpResponse: The response, or a coroutine in async mode.
+        """
+        if self._is_coroutine:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
@@ -47,12 +47,14 @@ INSTALLED_APPS = [
     # Local apps
     'authentication',
     'event_portal',
+    'monitoring',
 ]
 
 # Middleware configuration
 MIDDLEWARE = [
+    'monitoring.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'TicketingSystem.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,11 +95,112 @@ DATABASES = {
     }
 }
 
+# Cache configuration
+# The "api" cache holds serialized responses of the public event and
+# category endpoints. Any Django cache backend can be plugged in through the
+# environment; the default local-memory backend evicts least recently used
+# entries once MAX_ENTRIES is reached.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ticketing-default',
+    },
+    'api': {
+        'BACKEND': config('API_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('API_CACHE_LOCATION', default='ticketing-api'),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('API_CACHE_MAX_ENTRIES', default=5000, cast=int),
+        },
+    },
+    # Must be shared by every worker process (e.g. Redis or Memcached) when
+    # the site runs more than one process, so they all see the same queue.
+    'waiting_room': {
+        'BACKEND': config('WAITING_ROOM_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('WAITING_ROOM_CACHE_LOCATION', default='ticketing-waiting-room'),
+        'TIMEOUT': None,
+    },
+    # Revoked tokens and recently changed users. Must be shared by every
+    # worker process too, or a logout or deactivation only applies to the
+    # process that handled it; `manage.py check --deploy` warns otherwise.
+    'tokens': {
+        'BACKEND': config('TOKEN_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('TOKEN_CACHE_LOCATION', default='ticketing-tokens'),
+    },
+}
+
+API_CACHE_ALIAS = 'api'
+API_CACHE_TIMEOUT = config('API_CACHE_TIMEOUT', default=300, cast=int)
+
+# Ticket inventory settings
+# How long a ticket hold lasts before unconfirmed tickets return to stock,
+# and the maximum number of tickets in a single order.
+TICKET_HOLD_DURATION = timedelta(minutes=config('TICKET_HOLD_MINUTES', default=10, cast=int))
+TICKET_MAX_PER_ORDER = config('TICKET_MAX_PER_ORDER', default=10, cast=int)
+# For ticket types with sharded stock, the number of random shards a buyer
+# tries before locking all shards to rebalance the remaining stock.
+TICKET_SHARD_ATTEMPTS = config('TICKET_SHARD_ATTEMPTS', default=3, cast=int)
+
+# Waiting room settings
+# Events with an admission rate queue buyers before they can hold tickets.
+# The burst is how many buyers are admitted at once when the queue is empty,
+# and queue tokens stop being accepted after the maximum age in seconds.
+WAITING_ROOM_CACHE_ALIAS = 'waiting_room'
+WAITING_ROOM_BURST = config('WAITING_ROOM_BURST', default=50, cast=int)
+WAITING_ROOM_TOKEN_MAX_AGE = config('WAITING_ROOM_TOKEN_MAX_AGE', default=3600, cast=int)
+
+# Change feed settings
+# Changes newer than this many seconds are held back from the change feed
+# until write transactions stamped just before them have committed. It
+# should exceed the duration of the longest write transaction.
+CHANGE_FEED_SETTLE_SECONDS = config('CHANGE_FEED_SETTLE_SECONDS', default=2, cast=float)
+
+# Performance monitoring settings
+# When on, every request is timed: the timings are sent in a Server-Timing
+# header and summarized per URL name at api/monitoring/performance/. The
+# header discloses query counts and timings to every client, so it is off
+# unless turned on here or by the dev settings.
+PERFORMANCE_MONITORING = config('PERFORMANCE_MONITORING', default=False, cast=bool)
+
+# Queries taking at least this many milliseconds are written, with their
+# plans, to a log file rotated after the given size with the given number
+# of old files kept. `python manage.py top_queries` summarizes it.
+SLOW_QUERY_MS = config('SLOW_QUERY_MS', default=100, cast=float)
+SLOW_QUERY_LOG_FILE = config('SLOW_QUERY_LOG_FILE', default=str(BASE_DIR / 'slow_queries.log'))
+SLOW_QUERY_LOG_MAX_BYTES = config('SLOW_QUERY_LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int)
+SLOW_QUERY_LOG_BACKUPS = config('SLOW_QUERY_LOG_BACKUPS', default=5, cast=int)
+
+# Logging configuration
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'slow_queries': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': SLOW_QUERY_LOG_FILE,
+            'maxBytes': SLOW_QUERY_LOG_MAX_BYTES,
+            'backupCount': SLOW_QUERY_LOG_BACKUPS,
+            'delay': True,
+            'formatter': 'message',
+        },
+    },
+    'loggers': {
+        'monitoring.slow_queries': {
+            'handlers': ['slow_queries'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 # Django Rest Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    ]
+        'authentication.api.authentication.StatelessJWTAuthentication',
+    ],
+    'EXCEPTION_HANDLER': 'authentication.api.exceptions.exception_handler',
 }
 
 # Simple JWT settings
@@ -105,8 +208,14 @@ SIMPLE_JWT = {
     # "ROTATE_REFRESH_TOKENS": True,
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=120),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=14),
+    'TOKEN_OBTAIN_SERIALIZER': 'authentication.api.serializers.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'authentication.api.serializers.ClaimsTokenRefreshSerializer',
 }
 
+# The cache holding revoked tokens and recently changed users. It must be
+# shared by every worker process when the site runs more than one.
+TOKEN_DENYLIST_CACHE_ALIAS = 'tokens'
+
 # Swagger UI settings
 SWAGGER_SETTINGS = {
     "SECURITY_DEFINITIONS": {
@@ -141,6 +250,26 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# New and rehashed passwords use PBKDF2 with PASSWORD_HASH_ITERATIONS
+# iterations (0 keeps Django's default); users are rehashed on their next
+# login when it changes. Hashing runs on a pool of PASSWORD_HASH_WORKERS
+# threads per process with room for PASSWORD_HASH_QUEUE waiting hashes;
+# requests that cannot queue within the timeout (seconds) get a 503.
+PASSWORD_HASHERS = [
+    # Replaces Django's PBKDF2PasswordHasher, which uses the same algorithm name.
+    'authentication.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=0, cast=int)
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=2, cast=int)
+PASSWORD_HASH_QUEUE = config('PASSWORD_HASH_QUEUE', default=8, cast=int)
+PASSWORD_HASH_QUEUE_TIMEOUT = config('PASSWORD_HASH_QUEUE_TIMEOUT', default=0.5, cast=float)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
 
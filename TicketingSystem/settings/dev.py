@@ -4,6 +4,8 @@ DEBUG = True
 
 ALLOWED_HOSTS = ["127.0.0.1"]
 
+PERFORMANCE_MONITORING = config('PERFORMANCE_MONITORING', default=True, cast=bool)
+
 
 
 
@@ -43,6 +43,8 @@ urlpatterns = [
     # API endpoints
     path("api/auth/", include("authentication.api.urls")),
     path("api/events/", include("event_portal.api.urls")),
+    path("api/async/events/", include("event_portal.api.async_urls")),
+    path("api/monitoring/", include("monitoring.api.urls")),
 
     # API documentation
     path("", schema_view.with_ui("swagger", cache_timeout=0), name="schema-swagger-ui"),
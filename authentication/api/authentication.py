@@ -0,0 +1,34 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from .. import tokens
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that takes the user from the token's claims instead
+    of loading it from the database on every request.
+
+    Tokens without the user claims (issued before they were added), and
+    tokens issued before the user last changed, fall back to loading the
+    user, as `JWTAuthentication` does. Revoked tokens are rejected.
+    """
+
+    def get_user(self, validated_token):
+        """
+        Returns the user for a validated token.
+
+        Args:
+            validated_token (Token): The validated token.
+
+        Returns:
+            ClaimsUser: The user built from the claims, or the full user.
+
+        Raises:
+            InvalidToken: If the token has been revoked.
+        """
+        if tokens.is_revoked(validated_token):
+            raise InvalidToken({"detail": "Token has been revoked", "code": "token_revoked"})
+        if not tokens.has_user_claims(validated_token) or tokens.claims_are_stale(validated_token):
+            return super().get_user(validated_token)
+        return tokens.ClaimsUser(validated_token)
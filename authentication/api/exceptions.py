@@ -0,0 +1,51 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from ..hashers import HashingPoolSaturated
+
+
+class ServiceBusy(APIException):
+    """
+    Raised when the server is too busy to handle a request now.
+
+    Attributes:
+        status_code (int): The HTTP status code of the error response.
+        default_detail (str): The error message.
+        default_code (str): The error code.
+        wait (int): The number of seconds sent in the Retry-After header.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The server is busy, please try again shortly."
+    default_code = "password_hashing_saturated"
+
+    def __init__(self, detail=None, code=None, wait=None):
+        """
+        Creates the exception.
+
+        Args:
+            detail (str, optional): The error message.
+            code (str, optional): The error code.
+            wait (int, optional): The number of seconds after which the
+                                  client may retry.
+        """
+        super().__init__(detail, code)
+        self.wait = wait
+
+
+def exception_handler(exc, context):
+    """
+    Handles the exceptions raised by API views, answering a full password
+    hashing pool with a 503 and a Retry-After header, and everything else
+    as DRF does.
+
+    Args:
+        exc (Exception): The exception raised by the view.
+        context (dict): The view and request that raised it.
+
+    Returns:
+        Response: The error response, or None to let the exception propagate.
+    """
+    if isinstance(exc, HashingPoolSaturated):
+        exc = ServiceBusy(wait=exc.retry_after)
+    return drf_exception_handler(exc, context)
@@ -1,5 +1,9 @@
 from ..models import CustomUser, HostUserProfile
+from .. import tokens
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 
 class AccountSerializer(serializers.ModelSerializer):
@@ -94,4 +98,84 @@ class HostUserProfileSerializer(serializers.ModelSerializer):
         """
         model = HostUserProfile
         fields = "__all__"
-        
\ No newline at end of file
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Login serializer issuing tokens that carry the user claims.
+
+    Attributes:
+        token_class (Token): The refresh token class.
+    """
+    token_class = tokens.ClaimsRefreshToken
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that rejects revoked refresh tokens and reloads the
+    user, so new access tokens carry up to date claims and inactive users
+    cannot refresh.
+
+    Attributes:
+        token_class (Token): The refresh token class.
+    """
+    token_class = tokens.ClaimsRefreshToken
+
+    def validate(self, attrs):
+        """
+        Validates the refresh token and issues a new access token.
+
+        Args:
+            attrs (dict): The data to be validated.
+
+        Returns:
+            dict: The new access token, and the new refresh token when
+                  refresh tokens are rotated.
+
+        Raises:
+            InvalidToken: If the token is revoked or its user is inactive.
+        """
+        refresh = self.token_class(attrs["refresh"])
+        if tokens.is_revoked(refresh):
+            raise InvalidToken({"detail": "Token has been revoked", "code": "token_revoked"})
+        user = CustomUser.objects.filter(pk=refresh[api_settings.USER_ID_CLAIM], is_active=True).first()
+        if user is None:
+            raise InvalidToken({"detail": "User not found or inactive", "code": "user_inactive"})
+        tokens.add_user_claims(refresh, user)
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            tokens.revoke(self.token_class(attrs["refresh"]))
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
+class LogoutSerializer(serializers.Serializer):
+    """
+    Serializer validating a logout request.
+
+    Attributes:
+        refresh (CharField): The refresh token to revoke.
+    """
+    refresh = serializers.CharField()
+
+    def validate_refresh(self, value):
+        """
+        Checks that the refresh token is valid.
+
+        Args:
+            value (str): The refresh token.
+
+        Returns:
+            ClaimsRefreshToken: The validated token.
+
+        Raises:
+            ValidationError: If the token is not valid.
+        """
+        try:
+            return tokens.ClaimsRefreshToken(value)
+        except TokenError:
+            raise serializers.ValidationError("Invalid or expired refresh token")
+
@@ -2,7 +2,7 @@
 URL patterns for the authentication API.
 
 This module defines the API endpoints for user authentication, including
-user registration, token-based login, and host profile creation.
+user registration, token-based login and logout, and host profile creation.
 """
 from django.urls import path
 from . import views
@@ -15,6 +15,7 @@ urlpatterns = [
     # Endpoints for JWT token authentication
     path("login/", TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path("login/refresh/", TokenRefreshView.as_view(), name='token_refresh'),
+    path("logout/", views.LogoutView.as_view(), name='logout'),
 
     # Endpoint for creating a host profile
     path("event-profile/create/", views.HostProfileCreateView.as_view(), name="create-event-host-profile")
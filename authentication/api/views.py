@@ -1,12 +1,13 @@
 from rest_framework.response import Response 
 from rest_framework import status 
-from rest_framework.generics import CreateAPIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.generics import CreateAPIView, GenericAPIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.validators import ValidationError
 from django.db import IntegrityError
 
-from .serializers import AccountSerializer, HostUserProfileSerializer
+from .authentication import StatelessJWTAuthentication
+from .serializers import AccountSerializer, HostUserProfileSerializer, LogoutSerializer
+from .. import tokens
 from event_portal.api.renderers import CustomRenderer
 from django.contrib.auth import get_user_model
 from ..models import HostUserProfile
@@ -42,7 +43,7 @@ class HostProfileCreateView(CreateAPIView):
         renderer_classes (list): The renderers for the response.
     """
     serializer_class = HostUserProfileSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
     renderer_classes = [CustomRenderer]
 
@@ -56,15 +57,47 @@ class HostProfileCreateView(CreateAPIView):
         Raises:
             ValidationError: If the user already has a host profile.
         """
-        instance = self.request.user
         try:
-            serializer.save(user=instance)
+            serializer.save(user_id=self.request.user.pk)
         except IntegrityError:
             raise ValidationError(
                 {
                     "detail": "This user already has an event host profile"
                 }
             )
-      
-        
+
+
+class LogoutView(GenericAPIView):
+    """
+    API endpoint for logging out.
+
+    Revokes the given refresh token and, when the request is authenticated,
+    the access token it was made with. Revoked tokens are rejected until
+    they would have expired.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for the logout request.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    serializer_class = LogoutSerializer
+    permission_classes = [AllowAny]
+    renderer_classes = [CustomRenderer]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Revokes the tokens.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: A confirmation message.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        tokens.revoke(serializer.validated_data["refresh"])
+        if request.auth is not None:
+            tokens.revoke(request.auth)
+        return Response({"detail": "Logged out"}, status=status.HTTP_200_OK)
 
@@ -7,7 +7,7 @@ class AuthenticationConfig(AppConfig):
 
     This class sets up the configuration for the authentication app, such as
     the default auto field for models and the app name. It also imports the
-    app's signals when the app is ready.
+    app's signals and system checks when the app is ready.
 
     Attributes:
         default_auto_field (str): The default primary key type for models.
@@ -18,11 +18,11 @@ class AuthenticationConfig(AppConfig):
 
     def ready(self) -> None:
         """
-        Imports the signals for the authentication app.
+        Imports the signals and checks for the authentication app.
 
         This method is called by Django when the application is ready. It
         imports the signals module to ensure that the signal handlers are
-
-        connected.
+        connected, and the checks module to register the system checks.
         """
+        import authentication.checks
         import authentication.signals
\ No newline at end of file
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Cache backends whose entries are private to one process.
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_token_cache(app_configs, **kwargs):
+    """
+    Warns when revoked tokens and user changes are kept in a cache private
+    to each process, where a logout, a password change or a deactivation
+    would only apply to the process that handled it.
+
+    Args:
+        app_configs (list): The app configs to check, or None for all.
+        **kwargs: Wildcard keyword arguments.
+
+    Returns:
+        list: The warnings.
+    """
+    alias = settings.TOKEN_DENYLIST_CACHE_ALIAS
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_BACKENDS:
+        return []
+    return [Warning(
+        f"The token deny-list cache '{alias}' uses {backend}, which is not shared between processes.",
+        hint="Set TOKEN_CACHE_BACKEND to a shared cache such as Redis or Memcached when running "
+             "more than one process.",
+        id="authentication.W001",
+    )]
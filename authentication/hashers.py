@@ -0,0 +1,139 @@
+"""
+Password hashing with a tunable cost and bounded concurrency.
+
+`TunablePBKDF2PasswordHasher` takes its iteration count from the
+`PASSWORD_HASH_ITERATIONS` setting. It keeps Django's `pbkdf2_sha256`
+algorithm name, so existing hashes keep verifying, and Django rehashes a
+user's password on their next successful login whenever the stored
+iteration count differs from the setting.
+
+Every hash runs on a small shared thread pool (`hashlib.pbkdf2_hmac`
+releases the GIL, so the pool's threads hash in parallel). At most
+`PASSWORD_HASH_WORKERS` passwords are hashed at once per process and at
+most `PASSWORD_HASH_QUEUE` more wait for a worker; a request that cannot
+get a place within `PASSWORD_HASH_QUEUE_TIMEOUT` seconds fails fast with
+`HashingPoolSaturated` instead of piling more CPU work onto a saturated
+server. The API turns it into a 503 (see
+`authentication.api.exceptions.exception_handler`).
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class HashingPoolSaturated(Exception):
+    """
+    Raised when the password hashing pool is full.
+
+    Attributes:
+        retry_after (int): The number of seconds after which the pool is
+                           likely to have room again.
+    """
+    retry_after = 1
+
+
+class HashingPool:
+    """
+    A thread pool running password hashes with a bounded queue.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The threads running the hashes.
+        slots (BoundedSemaphore): One slot per running or queued hash.
+        timeout (float): How long to wait for a slot, in seconds.
+    """
+
+    def __init__(self, workers, queue_size, timeout):
+        """
+        Initializes the pool.
+
+        Args:
+            workers (int): The number of hashes run at once.
+            queue_size (int): The number of hashes allowed to wait.
+            timeout (float): How long to wait for a slot, in seconds.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.timeout = timeout
+
+    def run(self, func, *args):
+        """
+        Runs a function on the pool and waits for its result.
+
+        Args:
+            func (callable): The function to run.
+            *args: The arguments of the function.
+
+        Returns:
+            object: The result of the function.
+
+        Raises:
+            HashingPoolSaturated: If no slot is freed within the timeout.
+        """
+        if not self.slots.acquire(timeout=self.timeout):
+            raise HashingPoolSaturated()
+        try:
+            return self.executor.submit(func, *args).result()
+        finally:
+            self.slots.release()
+
+
+_pool = None
+_pool_config = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Returns the process-wide hashing pool, rebuilding it if its settings
+    changed.
+
+    Returns:
+        HashingPool: The hashing pool.
+    """
+    global _pool, _pool_config
+    config = (
+        settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE,
+        settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+    )
+    with _pool_lock:
+        if config != _pool_config:
+            if _pool is not None:
+                _pool.executor.shutdown(wait=False)
+            _pool, _pool_config = HashingPool(*config), config
+        return _pool
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count set by `PASSWORD_HASH_ITERATIONS`
+    (Django's default when it is 0), hashed on the bounded hashing pool.
+    """
+
+    @property
+    def iterations(self):
+        """
+        Returns the configured iteration count.
+
+        Returns:
+            int: The number of PBKDF2 iterations.
+        """
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+    def encode(self, password, salt, iterations=None):
+        """
+        Hashes a password on the hashing pool.
+
+        Args:
+            password (str): The password.
+            salt (str): The salt.
+            iterations (int, optional): The iteration count.
+
+        Returns:
+            str: The encoded password hash.
+
+        Raises:
+            HashingPoolSaturated: If the hashing pool is full.
+        """
+        return get_pool().run(super().encode, password, salt, iterations)
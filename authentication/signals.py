@@ -1,7 +1,9 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
 from django.contrib.auth import get_user_model
-from authentication.models import HostUserProfile
+from authentication.models import CustomUser, HostUserProfile
+from authentication import tokens
 
 @receiver(post_save, sender=HostUserProfile)
 def update_user_instance(sender, instance, created, **kwargs) -> None:
@@ -21,4 +23,54 @@ def update_user_instance(sender, instance, created, **kwargs) -> None:
     if created:
         user = instance.user
         user.event_hoster = True
-        user.save()
\ No newline at end of file
+        user.save()
+
+
+@receiver(pre_save, sender=CustomUser)
+def remember_auth_fields(sender, instance, update_fields=None, **kwargs) -> None:
+    """
+    Records the stored claims and active flag of a user before a save, so
+    the save can tell whether they changed. Saves limited to other fields,
+    like the `last_login` update at login, skip the lookup.
+
+    Args:
+        sender (Model): The model class that sent the signal (CustomUser).
+        instance (CustomUser): The user being saved.
+        update_fields (frozenset): The fields being saved, or None for all.
+        **kwargs: Wildcard keyword arguments.
+    """
+    instance._previous_auth_fields = None
+    if instance._state.adding or (update_fields is not None and not update_fields & set(tokens.AUTH_FIELDS)):
+        return
+    instance._previous_auth_fields = sender.objects.filter(pk=instance.pk).values_list(
+        *tokens.AUTH_FIELDS
+    ).first()
+
+
+@receiver(post_save, sender=CustomUser)
+def expire_user_claims(sender, instance, created, **kwargs) -> None:
+    """
+    Stops trusting the claims of the user's existing access tokens when the
+    user's password, claims or active flag change, so permission changes,
+    password changes and deactivation apply at once. Rehashing the password
+    at login keeps the password and does not count as a change.
+
+    The change is recorded again once the transaction commits, so tokens
+    issued from the old row while the write was in flight are not trusted
+    either.
+
+    Args:
+        sender (Model): The model class that sent the signal (CustomUser).
+        instance (CustomUser): The saved user.
+        created (bool): Whether the user was created.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if created:
+        return
+    previous = getattr(instance, "_previous_auth_fields", None)
+    current = tuple(getattr(instance, field) for field in tokens.AUTH_FIELDS)
+    # `set_password` keeps the raw password until the save completes.
+    password_changed = instance._password is not None
+    if password_changed or (previous is not None and previous != current):
+        tokens.mark_user_changed(instance.pk)
+        transaction.on_commit(lambda: tokens.mark_user_changed(instance.pk))
@@ -0,0 +1,202 @@
+"""
+JWT tokens carrying the user claims the API checks on every request.
+
+Tokens issued at login carry the user's id, email, staff and host flags,
+so authenticated requests can be served from the token alone: the
+`ClaimsUser` built from them only loads the user row when a view needs an
+attribute the token does not carry.
+
+Because nothing is read from the database, revocation goes through a
+deny-list kept in the cache configured by `TOKEN_DENYLIST_CACHE_ALIAS`.
+Logged out tokens are denied until they would have expired anyway, and
+when the password, the claims or the active flag of a user change, tokens
+whose claims were read before the change fall back to loading the user,
+which also rejects deactivated users. The cache must be shared between
+processes when the site runs more than one (see the
+`authentication.W001` system check).
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+USER_CLAIMS = ("email", "is_staff", "is_superuser", "event_hoster")
+
+# The user fields whose change makes existing tokens' claims stale, on top
+# of the password.
+AUTH_FIELDS = USER_CLAIMS + ("is_active",)
+
+# The claim holding when the user claims were read, with sub-second
+# precision, unlike `iat`.
+CLAIMS_TIME_CLAIM = "claims_at"
+
+
+def add_user_claims(token, user):
+    """
+    Copies the user's claims into a token, with the time they were read.
+
+    Args:
+        token (Token): The token.
+        user (CustomUser): The user the token is issued for.
+    """
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[CLAIMS_TIME_CLAIM] = time.time()
+
+
+def has_user_claims(token):
+    """
+    Checks whether a token carries every user claim.
+
+    Args:
+        token (Token): The validated token.
+
+    Returns:
+        bool: True if the token carries the claims.
+    """
+    return all(claim in token for claim in USER_CLAIMS)
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """
+    A refresh token carrying the user claims, which it copies into the
+    access tokens made from it.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Returns a refresh token for the user with the user claims added.
+
+        Args:
+            user (CustomUser): The user.
+
+        Returns:
+            ClaimsRefreshToken: The token.
+        """
+        token = super().for_user(user)
+        add_user_claims(token, user)
+        return token
+
+
+class ClaimsUser(TokenUser):
+    """
+    A user built from the claims of a validated token.
+
+    The claims answer the checks made by the API permissions. Any other
+    attribute is read from the full user, which is loaded on first use.
+    """
+
+    @cached_property
+    def id(self):
+        """
+        Returns the user's primary key.
+
+        Returns:
+            UUID: The primary key.
+        """
+        return get_user_model()._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def email(self):
+        """
+        Returns the user's email address.
+
+        Returns:
+            str: The email address.
+        """
+        return self.token["email"]
+
+    @cached_property
+    def event_hoster(self):
+        """
+        Returns whether the user is an event host.
+
+        Returns:
+            bool: The host flag.
+        """
+        return self.token["event_hoster"]
+
+    @cached_property
+    def user(self):
+        """
+        Loads the full user from the database.
+
+        Returns:
+            CustomUser: The user.
+        """
+        return get_user_model().objects.get(pk=self.id)
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.user, attr)
+
+    def __eq__(self, other):
+        return self.pk == getattr(other, "pk", None)
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return self.email
+
+
+def _cache():
+    return caches[settings.TOKEN_DENYLIST_CACHE_ALIAS]
+
+
+def revoke(token):
+    """
+    Denies a token until it expires.
+
+    Args:
+        token (Token): The validated token.
+    """
+    remaining = token["exp"] - int(time.time())
+    if remaining > 0:
+        _cache().set(f"jwt-denied:{token[api_settings.JTI_CLAIM]}", True, remaining)
+
+
+def is_revoked(token):
+    """
+    Checks whether a token has been denied.
+
+    Args:
+        token (Token): The validated token.
+
+    Returns:
+        bool: True if the token was revoked.
+    """
+    return _cache().get(f"jwt-denied:{token[api_settings.JTI_CLAIM]}", False)
+
+
+def mark_user_changed(user_id):
+    """
+    Records that a user changed, so access tokens whose claims were read
+    before now stop being trusted for the user's claims.
+
+    Args:
+        user_id (UUID): The primary key of the user.
+    """
+    lifetime = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    _cache().set(f"jwt-user-changed:{user_id}", time.time(), lifetime)
+
+
+def claims_are_stale(token):
+    """
+    Checks whether the user changed after a token's claims were read.
+
+    Args:
+        token (Token): The validated token.
+
+    Returns:
+        bool: True if the token's claims may be out of date.
+    """
+    changed = _cache().get(f"jwt-user-changed:{token[api_settings.USER_ID_CLAIM]}")
+    return changed is not None and token.get(CLAIMS_TIME_CLAIM, token.get("iat", 0)) <= changed
@@ -0,0 +1,10 @@
+"""
+Benchmarks for the ticketing API.
+
+Each benchmark is a runnable module, for example:
+
+    python -m benchmarks.renderer
+
+Benchmarks use the settings module named by DJANGO_SETTINGS_MODULE, which
+defaults to the development settings.
+"""
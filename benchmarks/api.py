@@ -0,0 +1,383 @@
+"""
+Benchmark suite covering every route of the event and authentication APIs.
+
+By default each route is driven in process, through the full middleware
+and DRF stack, on a fresh test database seeded by `benchmarks.seed`. Write
+requests run inside a transaction that is rolled back afterwards, so every
+iteration sees the same data. With `--http`, the read routes (and logins)
+are instead loaded over HTTP by concurrent clients, against a running
+server whose database was seeded with `python -m benchmarks.seed`; the
+queries per request are then read from its `Server-Timing` header, so
+the server must run with `PERFORMANCE_MONITORING` on.
+
+Every route is reported with its requests per second, latency percentiles
+and database queries per request. `--save` stores the results as a JSON
+baseline, and `--compare` fails (exit status 1) when a route's p95 latency
+grew by more than `--tolerance` or it runs more queries than the baseline:
+
+    python -m benchmarks.api --events 100000 --save baseline.json
+    python -m benchmarks.api --events 100000 --compare baseline.json
+    python -m benchmarks.api --http http://127.0.0.1:8000 --clients 16 --duration 10
+"""
+import argparse
+import http.client
+import json
+import platform
+import re
+import statistics
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import urlencode, urlsplit
+
+from benchmarks.seed import PASSWORD, TITLE_PREFIX, seed
+from benchmarks.utils import setup_django, test_database
+
+QUERIES_RE = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+class Case:
+    """
+    A request pattern for one route.
+
+    `build(n)` returns the method, path, body and extra headers of the
+    n-th request. For write requests it may create the fixtures the
+    request needs; those, like the request's own writes, are rolled back.
+    """
+
+    def __init__(self, name, build, user=None, write=False, http=False, expected=200):
+        self.name = name
+        self.build = build
+        self.user = user
+        self.write = write
+        self.http = http
+        self.expected = expected
+
+
+class Dataset:
+    """
+    The objects the requests are made about, read from the seeded database.
+    """
+
+    def __init__(self):
+        from authentication.models import CustomUser
+        from event_portal import inventory
+        from event_portal.models import Category, Event, Ticket
+
+        events = Event.objects.filter(expired=False, title__startswith=TITLE_PREFIX).order_by("slug")
+        self.slugs = list(events.values_list("slug", flat=True)[:100])
+        self.host = CustomUser.objects.get(event__slug=self.slugs[0])
+        self.buyer = CustomUser.objects.filter(email__startswith="host-").exclude(pk=self.host.pk).earliest("email")
+        self.admin = None
+        self.own_slugs = list(events.filter(host=self.host).values_list("slug", flat=True)[:20])
+        self.categories = list(Category.objects.order_by("name"))
+        self.tickets = list(Ticket.objects.filter(event__slug__in=self.slugs).values_list("pk", flat=True))
+        self.queued_slug = self.slugs[-1]
+        self.queue_token = None
+        self.inventory = inventory
+
+    def prepare(self):
+        """
+        Creates the state the in-process cases share: an admin, a waiting
+        room and some confirmed orders for the buyer.
+        """
+        from authentication.models import CustomUser
+        from event_portal import waiting_room
+        from event_portal.models import Event, Ticket
+
+        self.admin = CustomUser.objects.create_superuser(email="admin@benchmark.example.com", password=PASSWORD)
+        Event.objects.filter(slug=self.queued_slug).update(admission_rate=60)
+        waiting_room.forget_admission_rate(self.queued_slug)
+        self.queue_token = waiting_room.join(self.queued_slug, 60)["token"]
+        for pk in self.tickets[:20]:
+            self.inventory.confirm_order(self.inventory.hold_tickets(Ticket.objects.get(pk=pk), self.buyer, 1))
+
+    def token(self, user):
+        from authentication.tokens import ClaimsRefreshToken
+        return ClaimsRefreshToken.for_user(user)
+
+    def hold(self, n):
+        from event_portal.models import Ticket
+        ticket = Ticket.objects.get(pk=self.tickets[n % len(self.tickets)])
+        return self.inventory.hold_tickets(ticket, self.buyer, 1)
+
+
+def event_body(title, categories):
+    return {
+        "title": title, "event_start_date": "2031-05-01", "event_start_time": "10:00:00",
+        "event_end_date": "2031-05-02", "event_end_time": "18:00:00", "location": "Lagos",
+        "address": "1 Benchmark Street", "about": "Created by the benchmark", "category": categories,
+    }
+
+
+def cases(data):
+    from django.urls import reverse
+
+    def get(name, *args, **params):
+        path = reverse(name, args=args)
+        return lambda n: ("GET", path + (f"?{urlencode(params)}" if params else ""), None, {})
+
+    def cycle(values):
+        return lambda n: values[n % len(values)]
+
+    today = date.today()
+    slug, own_slug, category = cycle(data.slugs), cycle(data.own_slugs), cycle(data.categories)
+    intervals = cycle(("day", "week", "month", "year"))
+    list_params = [{}, {"page": 2}, {"location": "Lagos"}, {"search": "benchmark"}, {"ordering": "event_start_date"}]
+
+    def create_category(n):
+        removed = data.categories[n % len(data.categories)]
+        type(removed).objects.filter(pk=removed.pk).delete()
+        return "POST", reverse("create-category"), {"name": removed.name}, {}
+
+    def import_events(n):
+        rows = [event_body(f"Benchmark import {n} {row}", [category(row).slug]) for row in range(100)]
+        return "POST", reverse("import-events"), "\n".join(json.dumps(row) for row in rows), {
+            "CONTENT_TYPE": "application/x-ndjson",
+        }
+
+    def order_action(name):
+        return lambda n: ("POST", reverse(name, args=[data.hold(n).pk]), {}, {})
+
+    def logout(n):
+        return "POST", reverse("logout"), {"refresh": str(data.token(data.buyer))}, {}
+
+    def host_profile(n):
+        return "POST", reverse("create-event-host-profile"), {"company_name": f"Benchmark {n}"}, {}
+
+    return [
+        Case("category-list", get("category-list"), http=True),
+        Case("category-detail", lambda n: get("category-detail", category(n).slug)(n), http=True),
+        Case("create-category", create_category, user="admin", write=True, expected=201),
+        Case("create-event", lambda n: ("POST", reverse("create-event"), event_body(
+            f"Benchmark new {n}", [str(category(n).pk)]), {}), user="host", write=True, expected=201),
+        Case("import-events", import_events, user="host", write=True, expected=201),
+        Case("changes", get("changes", limit=100), http=True),
+        Case("host-dashboard", lambda n: get("host-dashboard", interval=intervals(n))(n), user="host"),
+        Case("export-events", get("export-events", location="Lagos", event_start_date_after=today.isoformat(),
+                                  event_start_date_before=(today + timedelta(days=7)).isoformat()), http=True),
+        Case("events-list", lambda n: get("events-list", **list_params[n % len(list_params)])(n), http=True),
+        Case("event-detail", lambda n: get("event-detail", slug(n))(n), http=True),
+        Case("event-update", lambda n: ("PATCH", reverse("event-detail", args=[own_slug(n)]),
+                                        {"about": f"Updated {n}"}, {}), user="host", write=True),
+        Case("event-delete", lambda n: ("DELETE", reverse("event-detail", args=[own_slug(n)]), None, {}),
+             user="host", write=True, expected=204),
+        Case("events-by-category", lambda n: get("events-by-category", category(n).slug)(n), http=True),
+        Case("event-tickets", lambda n: get("event-tickets", slug(n))(n), http=True),
+        Case("create-ticket", lambda n: ("POST", reverse("event-tickets", args=[own_slug(n)]), {
+            "ticket_type": "Early bird", "ticket_price": 2500, "capacity": 100}, {}),
+             user="host", write=True, expected=201),
+        Case("waiting-room-join", lambda n: ("POST", reverse("waiting-room-join", args=[data.queued_slug]), None, {}),
+             expected=201),
+        Case("waiting-room-status", lambda n: ("GET", reverse("waiting-room-status"), None, {
+            "HTTP_X_QUEUE_TOKEN": data.queue_token})),
+        Case("hold-ticket", lambda n: ("POST", reverse("hold-ticket", args=[data.tickets[n % len(data.tickets)]]),
+                                       {"quantity": 1}, {}), user="buyer", write=True, expected=201),
+        Case("confirm-order", order_action("confirm-order"), user="buyer", write=True),
+        Case("cancel-order", order_action("cancel-order"), user="buyer", write=True),
+        Case("my-orders", get("my-orders"), user="buyer"),
+        Case("sign-up", lambda n: ("POST", reverse("create-account"), {
+            "email": f"new-{n}@benchmark.example.com", "password": PASSWORD, "password2": PASSWORD}, {}),
+             write=True, expected=201),
+        Case("login", lambda n: ("POST", reverse("token_obtain_pair"), {
+            "email": data.buyer.email, "password": PASSWORD}, {}), http=True),
+        Case("login-refresh", lambda n: ("POST", reverse("token_refresh"), {
+            "refresh": str(data.token(data.buyer))}, {}), http=True),
+        # Unauthenticated, or it would revoke the access token of later requests.
+        Case("logout", logout),
+        Case("create-host-profile", host_profile, user="buyer", write=True, expected=201),
+    ]
+
+
+def summarize(latencies, queries, errors, elapsed):
+    if not latencies:
+        return {"requests": 0, "errors": errors}
+    ordered = sorted(latencies)
+
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1e3
+
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(ordered) * 1e3,
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "queries": statistics.mean(queries) if queries else None,
+        "errors": errors,
+    }
+
+
+def run_in_process(case, data, iterations, warmup, cold):
+    from django.core.cache import caches
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    user = getattr(data, case.user) if case.user else None
+    if user is not None:
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {data.token(user).access_token}")
+    latencies, queries, errors = [], [], 0
+    elapsed = 0.0
+    for n in range(warmup + iterations):
+        if cold:
+            caches["api"].clear()
+        with transaction.atomic():
+            method, path, body, headers = case.build(n)
+            if isinstance(body, str):
+                kwargs = {"data": body, "content_type": headers.pop("CONTENT_TYPE")}
+            else:
+                kwargs = {"data": json.dumps(body) if body is not None else "", "content_type": "application/json"}
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = client.generic(method, path, **kwargs, **headers)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                duration = time.perf_counter() - start
+            transaction.set_rollback(case.write)
+        if n < warmup:
+            continue
+        if response.status_code != case.expected:
+            errors += 1
+            continue
+        elapsed += duration
+        latencies.append(duration)
+        queries.append(len(captured.captured_queries))
+    return summarize(latencies, queries, errors, elapsed)
+
+
+def run_http(case, data, base_url, clients, duration):
+    parts = urlsplit(base_url)
+    latencies, queries, errors = [], [], []
+    deadline = time.perf_counter() + duration
+
+    def client(slot):
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        n = slot
+        while time.perf_counter() < deadline:
+            method, path, body, meta = case.build(n)
+            n += clients
+            headers = {"Content-Type": "application/json"}
+            headers.update({key[5:].replace("_", "-").title(): value for key, value in meta.items()})
+            start = time.perf_counter()
+            try:
+                connection.request(method, parts.path.rstrip("/") + path,
+                                   json.dumps(body) if body is not None else None, headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                errors.append(None)
+                connection.close()
+                continue
+            if response.status != case.expected:
+                errors.append(response.status)
+                continue
+            latencies.append(time.perf_counter() - start)
+            match = QUERIES_RE.search(response.getheader("Server-Timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(slot,)) for slot in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, queries, len(errors), duration)
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("requests") or not result.get("requests"):
+            continue
+        if result["p95"] > base["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95']:.1f} ms, baseline {base['p95']:.1f} ms")
+        if result["queries"] is not None and base["queries"] is not None and result["queries"] > base["queries"] + 0.5:
+            regressions.append(f"{name}: {result['queries']:.1f} queries per request, baseline {base['queries']:.1f}")
+    return regressions
+
+
+def print_results(results, baseline):
+    print(f"{'route':<22} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+    for name, result in results.items():
+        if not result["requests"]:
+            print(f"{name:<22} {'-':>8} {'-':>8} {'-':>8} {'-':>8} {'-':>8} {result['errors']:>7}")
+            continue
+        queries = "-" if result["queries"] is None else f"{result['queries']:.1f}"
+        line = (f"{name:<22} {result['rps']:>8.1f} {result['p50']:>8.1f} {result['p95']:>8.1f}"
+                f" {result['p99']:>8.1f} {queries:>8} {result['errors']:>7}")
+        base = baseline.get(name)
+        if base and base.get("requests"):
+            line += f"   p95 x{result['p95'] / base['p95']:.2f} vs baseline"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=50, help="Measured requests per route, in process.")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per route, in process.")
+    parser.add_argument("--cold", action="store_true", help="Clear the response cache before every request.")
+    parser.add_argument("--only", action="append", default=[], metavar="ROUTE", help="Only run these routes.")
+    parser.add_argument("--http", metavar="URL", help="Load a running server instead, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent HTTP clients.")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds each route is loaded over HTTP.")
+    parser.add_argument("--save", metavar="FILE", help="Store the results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="FILE", help="Fail on regressions against a JSON baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 latency growth (0.25 = 25%%).")
+    args = parser.parse_args()
+
+    setup_django()
+    import django
+    from django.conf import settings
+    from django.db import connection
+
+    # Like the test runner: no query logging, and no static file routes.
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ["*"]
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    if args.http:
+        data = Dataset()
+        for case in cases(data):
+            if case.http and (not args.only or case.name in args.only):
+                results[case.name] = run_http(case, data, args.http, args.clients, args.duration)
+    else:
+        with test_database():
+            seed(args.hosts, args.events, log=lambda line: print(line, file=sys.stderr))
+            data = Dataset()
+            data.prepare()
+            for case in cases(data):
+                if not args.only or case.name in args.only:
+                    results[case.name] = run_in_process(case, data, args.iterations, args.warmup, args.cold)
+
+    print_results(results, baseline)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({
+                "meta": {
+                    "mode": "http" if args.http else "in-process", "events": args.events, "hosts": args.hosts,
+                    "cold": args.cold, "database": connection.vendor, "django": django.get_version(),
+                    "python": platform.python_version(), "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                },
+                "results": results,
+            }, file, indent=2)
+    if args.compare:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Load test comparing the event list served by gunicorn (WSGI) and by an ASGI
+server, with many concurrent slow clients.
+
+Each simulated client sends the request line, waits `--slow` seconds as a
+client on a poor connection would, then sends the rest of the request and
+reads the response. Start both servers against the same database, then
+point the script at them:
+
+    gunicorn TicketingSystem.wsgi --workers 1 --threads 4 --bind 127.0.0.1:8001
+    uvicorn TicketingSystem.asgi:application --workers 1 --port 8002
+    python -m benchmarks.async_reads \\
+        --target wsgi=http://127.0.0.1:8001/api/events/event-list/ \\
+        --target asgi=http://127.0.0.1:8002/api/async/events/event-list/ \\
+        --clients 200 --slow 0.5 --duration 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def request(url, slow, timeout):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or 80), timeout
+    )
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\n".encode("ascii"))
+        await writer.drain()
+        if slow:
+            await asyncio.sleep(slow)
+        writer.write(f"Host: {parts.netloc}\r\nConnection: close\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        await asyncio.wait_for(reader.read(), timeout)
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def client(url, slow, timeout, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            status = await request(url, slow, timeout)
+        except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+            status = None
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors.append(status)
+
+
+async def run(url, clients, slow, timeout, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(client(url, slow, timeout, deadline, latencies, errors) for _ in range(clients)))
+    return latencies, errors
+
+
+def percentile(values, fraction):
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", action="append", required=True, metavar="NAME=URL",
+                        help="A server to load, e.g. asgi=http://127.0.0.1:8002/api/async/events/event-list/")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent clients.")
+    parser.add_argument("--slow", type=float, default=0.5, help="Seconds each client stalls mid-request.")
+    parser.add_argument("--timeout", type=float, default=30, help="Seconds before a request is abandoned.")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds each target is loaded for.")
+    args = parser.parse_args()
+
+    print(f"{'target':<8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for target in args.target:
+        name, _, url = target.partition("=")
+        latencies, errors = asyncio.run(run(url, args.clients, args.slow, args.timeout, args.duration))
+        if not latencies:
+            print(f"{name:<8} {'-':>8} {'-':>8} {'-':>8} {'-':>8} {len(errors):>7}")
+            continue
+        print(
+            f"{name:<8} {len(latencies) / args.duration:>8.1f} {statistics.median(latencies) * 1e3:>8.0f}"
+            f" {percentile(latencies, 0.95) * 1e3:>8.0f} {percentile(latencies, 0.99) * 1e3:>8.0f}"
+            f" {len(errors):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Throughput of creating events one request at a time through
+`create-event/` compared with the bulk `import-events/` endpoint.
+
+Both paths go through the full API stack (authentication, parsing,
+validation, signals or their bulk equivalents) on a fresh test database.
+
+    python -m benchmarks.event_import --events 500
+"""
+import argparse
+import json
+import time
+
+from benchmarks.utils import setup_django, test_database
+
+
+def rows(prefix, count, category_id):
+    for number in range(count):
+        yield {
+            "title": f"{prefix} {number}", "event_start_date": "2030-05-01",
+            "event_start_time": "10:00:00", "event_end_date": "2030-05-02",
+            "event_end_time": "18:00:00", "location": "Lagos",
+            "about": "An imported event", "category": [category_id],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+    from authentication.models import CustomUser
+    from event_portal.models import Category, Event
+
+    # Like the test runner: no query logging, and no static file routes.
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ["*"]
+    with test_database():
+        host = CustomUser.objects.create_user(email="host@example.com", password="benchmark-password")
+        category_id = str(Category.objects.create(name="Technology").pk)
+        client = APIClient()
+        client.force_authenticate(host)
+
+        start = time.perf_counter()
+        for row in rows("Single", args.events, category_id):
+            response = client.post(reverse("create-event"), row, format="json")
+            assert response.status_code == 201, response.content
+        single = time.perf_counter() - start
+
+        body = "\n".join(json.dumps(row) for row in rows("Bulk", args.events, category_id))
+        start = time.perf_counter()
+        response = client.generic("POST", reverse("import-events"), body, content_type="application/x-ndjson")
+        bulk = time.perf_counter() - start
+        assert response.status_code == 201 and not response.json()["data"]["errors"], response.content
+        assert Event.objects.count() == 2 * args.events
+
+        print(f"{'path':<28} {'seconds':>8} {'events/s':>10}")
+        print(f"{'create-event/ per request':<28} {single:>8.2f} {args.events / single:>10.0f}")
+        print(f"{'import-events/ NDJSON':<28} {bulk:>8.2f} {args.events / bulk:>10.0f}   x{single / bulk:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Throughput of ticket allocation for a single hot ticket type, unsharded and
+with its stock spread over an increasing number of shards.
+
+Each worker thread repeatedly takes one ticket until the ticket type sells
+out. On databases with row-level locking (Postgres), throughput grows with
+the shard count because buyers stop queueing on one row. SQLite locks the
+whole database for every write, so there the numbers mostly show the cost
+of the extra shard bookkeeping.
+
+    python -m benchmarks.inventory_shards --threads 16 --capacity 2000
+"""
+import argparse
+import threading
+import time
+
+from benchmarks.utils import setup_django, test_database
+
+
+def run(ticket, threads):
+    from django.db import OperationalError, connection
+    from event_portal import inventory
+
+    barrier = threading.Barrier(threads + 1)
+    sold = [0] * threads
+    conflicts = [0] * threads
+
+    def worker(slot):
+        barrier.wait()
+        try:
+            while True:
+                try:
+                    if not inventory.allocate(ticket, 1):
+                        return
+                    sold[slot] += 1
+                except OperationalError:
+                    conflicts[slot] += 1
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return sum(sold), sum(conflicts), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--capacity", type=int, default=2000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[0, 1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    setup_django()
+    from event_portal import inventory
+    from event_portal.models import Ticket
+    from tests.utils.setup import create_test_event
+
+    with test_database():
+        event = create_test_event("Benchmark Drop")
+        print(f"{'shards':>6} {'sold':>6} {'conflicts':>9} {'seconds':>8} {'tickets/s':>10}")
+        for shard_count in args.shards:
+            ticket = Ticket.objects.create(
+                ticket_type=f"Shards {shard_count}", ticket_price=10,
+                event=event, capacity=args.capacity,
+            )
+            ticket = inventory.shard_inventory(ticket, shard_count)
+            sold, conflicts, seconds = run(ticket, args.threads)
+            assert sold == args.capacity, f"sold {sold} of {args.capacity} tickets"
+            print(f"{shard_count:>6} {sold:>6} {conflicts:>9} {seconds:>8.2f} {sold / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
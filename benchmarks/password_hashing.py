@@ -0,0 +1,80 @@
+"""
+Password verification throughput of the configured hasher.
+
+Reports logins per second on one core for each iteration count (one login
+costs one password verification), then runs a burst of concurrent logins
+through the bounded hashing pool and reports the overall rate and how many
+logins were turned away with a 503.
+
+    python -m benchmarks.password_hashing --iterations 390000 100000 --threads 32
+"""
+import argparse
+import os
+import threading
+import time
+
+from benchmarks.utils import setup_django
+
+
+def burst(encoded, threads, logins_per_thread):
+    from django.contrib.auth.hashers import check_password
+    from authentication.hashers import HashingPoolSaturated
+
+    barrier = threading.Barrier(threads + 1)
+    accepted = [0] * threads
+    rejected = [0] * threads
+
+    def worker(slot):
+        barrier.wait()
+        for _ in range(logins_per_thread):
+            try:
+                assert check_password("correct horse battery staple", encoded)
+                accepted[slot] += 1
+            except HashingPoolSaturated:
+                rejected[slot] += 1
+
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return sum(accepted), sum(rejected), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, nargs="+", default=None,
+                        help="Iteration counts to measure (default: the configured one).")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent logins in the burst.")
+    parser.add_argument("--logins", type=int, default=5, help="Logins per thread in the burst.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import check_password, get_hasher, make_password
+    from django.test import override_settings
+
+    configured = get_hasher().iterations
+    print(f"hasher {settings.PASSWORD_HASHERS[0]}, {os.cpu_count()} cores, "
+          f"pool of {settings.PASSWORD_HASH_WORKERS} workers + {settings.PASSWORD_HASH_QUEUE} queued")
+    print(f"{'iterations':>10} {'ms/login':>9} {'logins/s/core':>14}")
+    for iterations in args.iterations or [configured]:
+        with override_settings(PASSWORD_HASH_ITERATIONS=iterations):
+            encoded = make_password("correct horse battery staple")
+            count, start = 0, time.perf_counter()
+            while time.perf_counter() - start < 1 or count < 3:
+                check_password("correct horse battery staple", encoded)
+                count += 1
+            seconds = (time.perf_counter() - start) / count
+            print(f"{iterations:>10} {seconds * 1000:>9.1f} {1 / seconds:>14.1f}")
+
+    encoded = make_password("correct horse battery staple")
+    accepted, rejected, seconds = burst(encoded, args.threads, args.logins)
+    print(f"burst of {args.threads} threads: {accepted} logins in {seconds:.2f}s "
+          f"({accepted / seconds:.1f}/s), {rejected} rejected with 503")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Micro-benchmark of CustomRenderer on a full page of events.
+
+Compares the current renderer with the previous implementation, which
+formatted the whole payload with str() to look for "ErrorDetail" before
+encoding it with json.dumps and DjangoJSONEncoder.
+
+    python -m benchmarks.renderer
+"""
+import datetime
+import json
+import uuid
+from collections import OrderedDict
+
+from benchmarks.utils import best_of, report, setup_django
+
+
+def legacy_render(data):
+    if "ErrorDetail" in str(data):
+        return json.dumps({"status": "Error", "data": data})
+    from django.core.serializers.json import DjangoJSONEncoder
+    return json.dumps({"status": "Successful", "data": data}, cls=DjangoJSONEncoder)
+
+
+def make_page(size=15):
+    start = datetime.date.today()
+    results = []
+    for i in range(size):
+        results.append(OrderedDict([
+            ("title", f"Event number {i}"),
+            ("event_start_date", (start + datetime.timedelta(days=i)).isoformat()),
+            ("event_start_time", "12:00:00"),
+            ("event_end_date", (start + datetime.timedelta(days=i + 1)).isoformat()),
+            ("event_end_time", "18:00:00"),
+            ("location", "Lagos"),
+            ("address", "16, Fawobi Street, Allen Avenue, Ikeja"),
+            ("date_created", "2023-10-26T11:43:00.123456Z"),
+            ("category", [uuid.uuid4(), uuid.uuid4()]),
+            ("last_updated", "2023-10-26T11:43:00.123456Z"),
+            ("about", "A long description of the event. " * 20),
+            ("expired", False),
+            ("host", f"host{i}@example.com"),
+            ("slug", f"event-number-{i}"),
+        ]))
+    return OrderedDict([("count", 1000), ("next", None), ("previous", None), ("results", results)])
+
+
+def main():
+    setup_django()
+    from rest_framework.response import Response
+    from event_portal.api.renderers import CustomRenderer
+
+    data = make_page()
+    renderer = CustomRenderer()
+    context = {"response": Response(data)}
+
+    new = renderer.render(data, renderer_context=context)
+    assert new == legacy_render(data).encode("utf-8"), "renderer output changed"
+
+    baseline = best_of(lambda: legacy_render(data).encode("utf-8"))
+    report("legacy str() sniffing + json.dumps", baseline)
+    report("CustomRenderer", best_of(lambda: renderer.render(data, renderer_context=context)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Seeds a database with realistic volumes of hosts, events and tickets, for
+the API benchmarks and for load testing a running server.
+
+Every category in `Category.EVENT_CATEGORIES` is created, and events are
+spread over them (one to three each), over several cities and over the
+coming year, with a few already expired. Rows are written with
+`bulk_create`, so the search documents, category summaries and cached
+responses are refreshed explicitly afterwards.
+
+`python -m benchmarks.api` seeds its own test database. To load test a
+server, seed the database it uses (this writes to the configured
+database):
+
+    python -m benchmarks.seed --hosts 2000 --events 100000
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from benchmarks.utils import setup_django
+
+LOCATIONS = ("Lagos", "Abuja", "Port Harcourt", "Ibadan", "Kano", "Enugu", "Accra", "Nairobi")
+TICKET_TYPES = (("Regular", 5000.0, 500), ("VIP", 25000.0, 50), ("Table", 100000.0, 10))
+PASSWORD = "benchmark-password"
+EMAIL_DOMAIN = "benchmark.example.com"
+TITLE_PREFIX = "Benchmark event"
+
+
+def host_email(number):
+    return f"host-{number}@{EMAIL_DOMAIN}"
+
+
+def seed(hosts=2000, events=100000, tickets=2, batch_size=5000, seed_value=0, log=print):
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+    from django.utils.text import slugify
+    from authentication.models import CustomUser
+    from event_portal.api import cache
+    from event_portal.models import Category, Event, Ticket
+    from event_portal.search import index_events
+    from event_portal.summaries import refresh_summaries
+
+    randomizer = random.Random(seed_value)
+    started = time.perf_counter()
+
+    categories = []
+    for name, _ in Category.EVENT_CATEGORIES:
+        category, _ = Category.objects.get_or_create(name=name)
+        categories.append(category.pk)
+
+    # One hash for every host: hashing each password would dominate seeding.
+    password = make_password(PASSWORD)
+    users = [
+        CustomUser(email=host_email(number), password=password, event_hoster=True)
+        for number in range(hosts)
+    ]
+    CustomUser.objects.bulk_create(users, batch_size=batch_size)
+    host_ids = list(
+        CustomUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").values_list("pk", flat=True)
+    )
+    log(f"{len(host_ids)} hosts, {len(categories)} categories")
+
+    today = date.today()
+    Link = Event.category.through
+    for offset in range(0, events, batch_size):
+        with transaction.atomic():
+            batch = []
+            for number in range(offset, min(offset + batch_size, events)):
+                title = f"{TITLE_PREFIX} {number}"
+                expired = randomizer.random() < 0.05
+                start = today + timedelta(days=randomizer.randint(-60, -2) if expired else randomizer.randint(0, 365))
+                batch.append(Event(
+                    title=title, slug=slugify(title), host_id=randomizer.choice(host_ids),
+                    event_start_date=start, event_end_date=start + timedelta(days=randomizer.randint(0, 2)),
+                    event_start_time="10:00:00", event_end_time="18:00:00",
+                    location=randomizer.choice(LOCATIONS), address=f"{number} Benchmark Street",
+                    about=f"Seeded event number {number} for benchmarks.", expired=expired,
+                ))
+            Event.objects.bulk_create(batch)
+            Link.objects.bulk_create([
+                Link(event_id=event.pk, category_id=category_id)
+                for event in batch for category_id in randomizer.sample(categories, randomizer.randint(1, 3))
+            ])
+            Ticket.objects.bulk_create([
+                Ticket(event=event, ticket_type=name, ticket_price=price, capacity=capacity, available=capacity)
+                for event in batch for name, price, capacity in TICKET_TYPES[:tickets]
+            ])
+            index_events(batch)
+        log(f"{offset + len(batch)} events")
+
+    refresh_summaries()
+    cache.invalidate(cache.EVENTS_TAG, cache.CATEGORIES_TAG)
+    log(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--tickets", type=int, default=2, choices=range(len(TICKET_TYPES) + 1),
+                        help="Ticket types per event.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed, for repeatable data.")
+    args = parser.parse_args()
+
+    setup_django()
+    from event_portal.models import Event
+
+    if Event.objects.filter(title__startswith=TITLE_PREFIX).exists():
+        parser.exit(1, "The database has already been seeded.\n")
+    seed(args.hosts, args.events, args.tickets, seed_value=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of the per-row cost of serializing events, with
+`EventSerializer` on model instances and with `EventValuesSerializer` on
+`.values()` rows.
+
+Seeds a test database, then times serializing a page already read from
+the database, and reading and serializing it, for the full fields and the
+`card` fieldset. Both serializers are checked to produce the same output.
+
+    python -m benchmarks.serializers --rows 100
+"""
+import argparse
+
+from benchmarks.utils import best_of, report, setup_django, test_database
+
+
+def sort_categories(data):
+    return [dict(item, category=sorted(item["category"])) if "category" in item else dict(item) for item in data]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100, help="Events per page.")
+    parser.add_argument("--number", type=int, default=50, help="Runs per timing.")
+    args = parser.parse_args()
+
+    setup_django()
+    from benchmarks.seed import seed
+    from event_portal.api.fieldsets import resolve_fieldset
+    from event_portal.api.serializers import EventSerializer
+    from event_portal.api.values import EventValuesSerializer
+    from event_portal.models import Event
+
+    with test_database():
+        seed(hosts=50, events=args.rows, log=lambda message: None)
+        queryset = Event.objects.select_related("host").prefetch_related("category").order_by("-last_updated")
+
+        for name, fields in (("full", None), ("card", resolve_fieldset(EventSerializer, "card", "").fields)):
+            values = EventValuesSerializer(fields=fields)
+            events, rows = list(queryset), list(values.rows(queryset))
+            expected = EventSerializer(events, many=True, fields=fields).data
+            assert sort_categories(EventValuesSerializer(rows, fields=fields).data) == sort_categories(expected), \
+                "values serializer output differs"
+
+            print(f"{name} fields, {args.rows} rows (per row):")
+            baseline = best_of(lambda: EventSerializer(events, many=True, fields=fields).data,
+                               number=args.number) / args.rows
+            report("  EventSerializer", baseline)
+            report("  EventValuesSerializer", best_of(
+                lambda: EventValuesSerializer(rows, fields=fields).data, number=args.number,
+            ) / args.rows, baseline)
+
+            baseline = best_of(lambda: EventSerializer(list(queryset.all()), many=True, fields=fields).data,
+                               number=args.number) / args.rows
+            report("  read + EventSerializer", baseline)
+            report("  read + EventValuesSerializer", best_of(
+                lambda: EventValuesSerializer(list(values.rows(queryset)), fields=fields).data, number=args.number,
+            ) / args.rows, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import timeit
+from contextlib import contextmanager
+
+
+def setup_django(settings_module: str = "TicketingSystem.settings.dev") -> None:
+    """
+    Configures Django so a benchmark can be run as a standalone script.
+
+    Args:
+        settings_module (str): The settings module used when
+                               DJANGO_SETTINGS_MODULE is not set.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    django.setup()
+
+
+def best_of(func, number: int = 1000, repeat: int = 5) -> float:
+    """
+    Times a callable and returns the best average time per call.
+
+    Args:
+        func (callable): The callable to time.
+        number (int): The number of calls per timing run.
+        repeat (int): The number of timing runs.
+
+    Returns:
+        float: The fastest observed time per call, in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name: str, seconds: float, baseline: float = None) -> None:
+    """
+    Prints a single benchmark result line.
+
+    Args:
+        name (str): The name of the measured case.
+        seconds (float): The time per operation, in seconds.
+        baseline (float, optional): The baseline time to compare against.
+    """
+    line = f"{name:<40} {seconds * 1e6:>10.1f} us/op"
+    if baseline:
+        line += f"   x{baseline / seconds:.2f} vs baseline"
+    print(line)
+
+
+@contextmanager
+def test_database():
+    """
+    Runs the enclosed block against a freshly created test database, so
+    benchmarks never write to the configured database.
+
+    Yields:
+        None
+    """
+    from django.db import connection
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
@@ -46,3 +46,18 @@ class SocialMediaAdmin(admin.ModelAdmin):
     """
     list_display = ("facebook", "instagram", "linkedIn", "twitter")
     list_filter = ("facebook", "instagram", "linkedIn", "twitter")
+
+
+@admin.register(CategorySummary)
+class CategorySummaryAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the CategorySummary model.
+
+    Summaries are maintained from the events, so they are read-only here.
+
+    Attributes:
+        list_display (tuple): Fields to display in the summary list view.
+        readonly_fields (tuple): Fields that cannot be edited.
+    """
+    list_display = ("category", "upcoming_count", "next_start_date", "last_updated")
+    readonly_fields = ("category", "upcoming_count", "next_start_date", "last_updated")
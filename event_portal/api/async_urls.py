@@ -0,0 +1,17 @@
+"""
+URL patterns for the async read API.
+
+These endpoints mirror the event and category read endpoints of
+`event_portal.api.urls` with async-native views, for deployments served
+through ASGI.
+"""
+from django.urls import path
+from . import async_views
+
+app_name = "async"
+
+urlpatterns = [
+    path("category-list/", async_views.AsyncCategoryListView.as_view(), name="category-list"),
+    path("event-list/", async_views.AsyncEventListView.as_view(), name="events-list"),
+    path("event-detail/<slug:slug>/", async_views.AsyncEventDetailView.as_view(), name="event-detail"),
+]
@@ -0,0 +1,270 @@
+"""
+Async-native read endpoints for events and categories.
+
+When the site is served through `TicketingSystem/asgi.py`, these views run
+on the event loop and await the ORM (`acount`, `aget`, `aiterator`)
+instead of holding a worker thread for the whole request, so one process
+can keep many slow clients waiting at once.
+
+They build their querysets with the synchronous views' own filters,
+search, ordering and page sizes, and render the same `CustomRenderer`
+envelope, so clients can switch between `api/events/` and
+`api/async/events/` freely. Responses go through the same tag-versioned
+response cache, with the cache calls run off the event loop. Lists use
+page-number pagination only, and conditional requests are not answered.
+"""
+import math
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from ..models import Event
+from .cache import get_api_cache
+from .renderers import CustomRenderer
+from .views import CategoryListView, EventAPIViewset
+
+
+class AsyncRenderer(CustomRenderer):
+    """
+    Renders plain Django responses in the `CustomRenderer` envelope, for
+    views that do not go through DRF.
+    """
+
+    def render_response(self, data, status=200):
+        """
+        Builds a JSON response in the standard envelope.
+
+        Args:
+            data (object): The response data.
+            status (int): The HTTP status code.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        response = HttpResponse(status=status, content_type="application/json")
+        response.exception = False
+        response.data = data
+        response.content = self.render(data, renderer_context={"response": response})
+        return response
+
+
+renderer = AsyncRenderer()
+
+
+def not_found(detail="Not found."):
+    """
+    Returns a 404 response in the standard envelope.
+
+    Args:
+        detail (str): The error message.
+
+    Returns:
+        HttpResponse: The response.
+    """
+    return renderer.render_response({"detail": detail}, status=404)
+
+
+async def prefetch_categories(events):
+    """
+    Loads the categories of events in one query, the way
+    `prefetch_related("category")` would.
+
+    Args:
+        events (list): The events.
+    """
+    if not events:
+        return
+    by_event = defaultdict(list)
+    links = Event.category.through.objects.filter(event_id__in=[event.pk for event in events])
+    async for link in links.select_related("category").aiterator():
+        by_event[link.event_id].append(link.category)
+    for event in events:
+        manager = event.category
+        queryset = manager.get_queryset()
+        queryset._result_cache = by_event[event.pk]
+        queryset._prefetch_done = True
+        event._prefetched_objects_cache = {manager.prefetch_cache_name: queryset}
+
+
+class AsyncCachedView(View):
+    """
+    Base class for async views built from a synchronous DRF view, whose
+    responses are cached under the synchronous view's cache tags.
+
+    Attributes:
+        sync_view_class (class): The view whose queryset, filters,
+                                 serializer and cache tags are used.
+        action (str): The action of the synchronous view.
+    """
+    sync_view_class = None
+    action = None
+
+    def get_sync_view(self, request):
+        """
+        Instantiates the synchronous view for the request.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            GenericAPIView: The view, ready to build querysets.
+        """
+        return self.sync_view_class(
+            request=Request(request), args=self.args, kwargs=self.kwargs, format_kwarg=None, action=self.action,
+        )
+
+    async def build(self, view):
+        """
+        Builds the response on a cache miss.
+
+        Args:
+            view (GenericAPIView): The synchronous view.
+
+        Returns:
+            HttpResponse: The response, with its data in `data`.
+        """
+        raise NotImplementedError("Async views must define build()")
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Returns the cached response, building it on a miss.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        view = self.get_sync_view(request)
+        cache = get_api_cache()
+        key = await sync_to_async(view.get_cache_key, thread_sensitive=False)(view.request)
+        entry = await cache.aget(key)
+        if entry is not None:
+            return renderer.render_response(entry[0])
+        response = await self.build(view)
+        if response.status_code == 200:
+            await cache.aset(key, (response.data, {}), timeout=settings.API_CACHE_TIMEOUT)
+        return response
+
+
+class AsyncListView(AsyncCachedView):
+    """
+    Base class for async lists built from a synchronous DRF list view.
+    """
+    action = "list"
+
+    async def load(self, view, objects):
+        """
+        Loads the related objects the serializer needs.
+
+        Args:
+            view (GenericAPIView): The synchronous list view.
+            objects (list): The objects on the page.
+        """
+
+    async def build(self, view):
+        """
+        Returns a page of the list.
+
+        Args:
+            view (GenericAPIView): The synchronous list view.
+
+        Returns:
+            HttpResponse: The paginated list.
+        """
+        request = view.request
+        try:
+            queryset = view.filter_queryset(view.get_queryset()).prefetch_related(None)
+        except APIException as exc:
+            return renderer.render_response(exc.detail, status=exc.status_code)
+        paginator = view.paginator
+        page_size = paginator.get_page_size(request)
+        try:
+            number = int(request.query_params.get(paginator.page_query_param, 1))
+        except ValueError:
+            return not_found("Invalid page.")
+        count = await queryset.acount()
+        if not 1 <= number <= max(1, math.ceil(count / page_size)):
+            return not_found("Invalid page.")
+
+        offset = (number - 1) * page_size
+        objects = [obj async for obj in queryset[offset:offset + page_size].aiterator()]
+        await self.load(view, objects)
+
+        url = request.build_absolute_uri()
+        next_link = previous_link = None
+        if offset + page_size < count:
+            next_link = replace_query_param(url, paginator.page_query_param, number + 1)
+        if number == 2:
+            previous_link = remove_query_param(url, paginator.page_query_param)
+        elif number > 2:
+            previous_link = replace_query_param(url, paginator.page_query_param, number - 1)
+        return renderer.render_response({
+            "count": count,
+            "next": next_link,
+            "previous": previous_link,
+            "results": view.get_serializer(objects, many=True).data,
+        })
+
+
+class AsyncEventListView(AsyncListView):
+    """
+    Async version of the upcoming event list, with the same filters,
+    search and ordering.
+    """
+    sync_view_class = EventAPIViewset
+
+    async def load(self, view, objects):
+        """
+        Loads the categories of the events on the page, if they are returned.
+
+        Args:
+            view (GenericAPIView): The synchronous list view.
+            objects (list): The events on the page.
+        """
+        if view.wants_field("category"):
+            await prefetch_categories(objects)
+
+
+class AsyncCategoryListView(AsyncListView):
+    """
+    Async version of the category list.
+    """
+    sync_view_class = CategoryListView
+
+
+class AsyncEventDetailView(AsyncCachedView):
+    """
+    Async version of the event detail.
+    """
+    sync_view_class = EventAPIViewset
+    action = "retrieve"
+
+    async def build(self, view):
+        """
+        Returns an event.
+
+        Args:
+            view (GenericAPIView): The synchronous event view.
+
+        Returns:
+            HttpResponse: The event, or a 404.
+        """
+        try:
+            queryset = view.narrow_queryset(Event.objects.all())
+            if view.wants_field("host"):
+                queryset = queryset.select_related("host")
+            event = await queryset.aget(slug=self.kwargs["slug"])
+        except APIException as exc:
+            return renderer.render_response(exc.detail, status=exc.status_code)
+        except Event.DoesNotExist:
+            return not_found()
+        if view.wants_field("category"):
+            await prefetch_categories([event])
+        return renderer.render_response(view.get_serializer(event).data)
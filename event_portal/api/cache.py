@@ -0,0 +1,211 @@
+"""
+Read-through response cache for the public event and category endpoints.
+
+Cached responses are keyed on the scheme and host the request was made
+to, since pagination links are absolute, the request path, the full query
+string and the current version of every tag the response depends on, such as
+`event:<slug>` or `category-events:<slug>`. Writes never delete response
+entries directly: they bump the version of the affected tags, so stale
+entries simply stop being addressed and are evicted by the backend's LRU
+policy. The backend is whichever cache is configured under
+`settings.API_CACHE_ALIAS`.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import urlencode
+from rest_framework.response import Response
+
+from .conditional import revalidate
+
+# Response headers stored with the cached data.
+CACHED_HEADERS = ("ETag", "Last-Modified", "Cache-Control")
+
+EVENTS_TAG = "events"
+CATEGORIES_TAG = "categories"
+
+
+def event_tag(slug):
+    """
+    Returns the tag for a single event's detail response.
+
+    Args:
+        slug (str): The event slug.
+
+    Returns:
+        str: The cache tag.
+    """
+    return f"event:{slug}"
+
+
+def category_tag(slug):
+    """
+    Returns the tag for a single category's detail response.
+
+    Args:
+        slug (str): The category slug.
+
+    Returns:
+        str: The cache tag.
+    """
+    return f"category:{slug}"
+
+
+def category_events_tag(slug):
+    """
+    Returns the tag for the list of events in a category.
+
+    Args:
+        slug (str): The category slug.
+
+    Returns:
+        str: The cache tag.
+    """
+    return f"category-events:{slug}"
+
+
+def host_tag(host_id):
+    """
+    Returns the tag for a host's dashboard.
+
+    Args:
+        host_id (UUID): The host.
+
+    Returns:
+        str: The cache tag.
+    """
+    return f"host:{host_id}"
+
+
+def get_api_cache():
+    """
+    Returns the cache backend used for API responses.
+
+    Returns:
+        BaseCache: The configured cache backend.
+    """
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def _version_key(tag):
+    return f"api-tag:{tag}"
+
+
+def get_tag_versions(tags):
+    """
+    Returns the current version of each tag, creating missing ones.
+
+    New versions start from a nanosecond timestamp rather than 1 so that a
+    tag evicted and recreated never reuses a version of an older entry.
+
+    Args:
+        tags (list): The cache tags.
+
+    Returns:
+        list: The version of each tag, in the same order.
+    """
+    cache = get_api_cache()
+    keys = [_version_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = time.time_ns()
+            cache.add(key, version, timeout=None)
+            versions[key] = cache.get(key, version)
+    return [versions[key] for key in keys]
+
+
+def invalidate(*tags):
+    """
+    Invalidates every cached response that depends on any of the tags.
+
+    Args:
+        *tags (str): The cache tags to invalidate.
+    """
+    cache = get_api_cache()
+    for tag in set(tags):
+        key = _version_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+class CachedResponseMixin:
+    """
+    A view mixin that caches successful `list` and `retrieve` responses.
+
+    Views declare which tags their responses depend on by implementing
+    `get_cache_tags`. Only the serialized data and the validator headers
+    are cached; rendering still happens on every request, and conditional
+    requests are answered from the cached validators.
+
+    Attributes:
+        cache_timeout (int): Seconds a cached response stays valid. Defaults
+                             to `settings.API_CACHE_TIMEOUT`.
+    """
+    cache_timeout = None
+
+    def get_cache_tags(self):
+        """
+        Returns the tags the current response depends on.
+
+        Returns:
+            list: The cache tags.
+        """
+        raise NotImplementedError("Views using CachedResponseMixin must define get_cache_tags()")
+
+    def get_cache_key(self, request):
+        """
+        Builds the cache key for the current request.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            str: The cache key.
+        """
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        versions = get_tag_versions(self.get_cache_tags())
+        raw = f"{request.build_absolute_uri('/')}|{request.path}?{query}|{versions}"
+        return "api-response:v2:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        """
+        Serves the response from the cache, calling the handler on a miss.
+
+        Args:
+            handler (callable): The uncached view action.
+            request (Request): The request object.
+
+        Returns:
+            Response: The cached or freshly built response, or a 304.
+        """
+        cache = get_api_cache()
+        key = self.get_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            data, headers = entry
+            return revalidate(request, Response(data, headers=headers))
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            timeout = self.cache_timeout
+            if timeout is None:
+                timeout = settings.API_CACHE_TIMEOUT
+            headers = {header: response[header] for header in CACHED_HEADERS if header in response}
+            cache.set(key, (response.data, headers), timeout=timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the cached list response.
+        """
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the cached detail response.
+        """
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
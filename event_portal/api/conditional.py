@@ -0,0 +1,180 @@
+"""
+Conditional GET support for the public event and category endpoints.
+
+Detail responses carry a strong ETag and a Last-Modified date taken from
+the object's `last_updated`. List responses carry a strong ETag built from
+the number of rows matching the filters and their latest `last_updated`,
+read with a single aggregate query; both change whenever a row is added,
+updated, removed or leaves the filter set. The count is handed to the
+paginator, which would otherwise count the rows itself. Lists send no
+Last-Modified date, since a removal does not move the latest
+`last_updated` forward, and cursor pages, which exist to avoid counting
+rows, send no validators at all.
+
+Requests with a matching `If-None-Match` (or, for details, a current
+`If-Modified-Since`) get a 304 without the body being built. Responses are
+marked `Cache-Control: no-cache`, so clients and CDNs keep them but
+revalidate before reuse.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    """
+    Builds a strong ETag from the values a response depends on.
+
+    Args:
+        *parts (object): The values identifying the representation.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    raw = "|".join(str(part) for part in parts)
+    return '"%s"' % hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Adds the validators and the revalidation policy to a response.
+
+    Args:
+        response (HttpResponse): The response.
+        etag (str): The ETag.
+        last_modified (datetime, optional): The last modification time.
+    """
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, no_cache=True)
+
+
+def not_modified(request, etag, last_modified=None):
+    """
+    Checks the request's conditional headers against the validators.
+
+    Args:
+        request (Request): The request object.
+        etag (str): The current ETag.
+        last_modified (datetime, optional): The last modification time.
+
+    Returns:
+        HttpResponse: A 304 (or 412) response if the client's copy is
+                      current, otherwise None.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        response["ETag"] = etag
+    return response
+
+
+def revalidate(request, response):
+    """
+    Answers a conditional request from the validators stored with a cached
+    response.
+
+    Args:
+        request (Request): The request object.
+        response (Response): The cached response.
+
+    Returns:
+        HttpResponse: A 304 response, or the cached response.
+    """
+    etag = response.get("ETag")
+    if etag is None:
+        return response
+    timestamp = parse_http_date_safe(response.get("Last-Modified", ""))
+    return get_conditional_response(request, etag=etag, last_modified=timestamp, response=response)
+
+
+class ConditionalGetMixin:
+    """
+    A view mixin adding validators to `list` and `retrieve` responses and
+    answering conditional requests with 304s.
+
+    Detail views look their object up by the `slug` URL keyword among
+    `get_queryset()`, as their `get_object` does, so a 304 is only sent for
+    an object the view would return.
+
+    Attributes:
+        list_count (int): The number of rows in the filtered list, once read.
+    """
+    list_count = None
+
+    def get_list_etag(self):
+        """
+        Returns the ETag of the list for the current request, from the
+        count and latest update of the filtered rows.
+
+        Returns:
+            str: The ETag.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        stats = queryset.aggregate(count=Count("pk"), last_updated=Max("last_updated"))
+        self.list_count = stats["count"]
+        return make_etag(self.request.build_absolute_uri(), stats["count"], stats["last_updated"])
+
+    def has_list_validators(self):
+        """
+        Checks whether the list response gets validators. Cursor pages do
+        not, since computing them would count the rows.
+
+        Returns:
+            bool: True unless the request asks for cursor pagination.
+        """
+        use_keyset = getattr(self.paginator, "use_keyset", None)
+        return not (use_keyset and use_keyset(self.request))
+
+    def get_detail_etag(self, last_updated):
+        """
+        Returns the ETag of a detail response.
+
+        Args:
+            last_updated (datetime): The object's last update.
+
+        Returns:
+            str: The ETag.
+        """
+        return make_etag(self.request.build_absolute_uri(), last_updated)
+
+    def get_last_updated(self):
+        """
+        Reads the requested object's last update without loading it.
+
+        Returns:
+            datetime: The last update, or None if there is no such object.
+        """
+        queryset = self.get_queryset().filter(slug=self.kwargs["slug"]).order_by()
+        return queryset.values_list("last_updated", flat=True).first()
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the list, or a 304 if the client's copy is current.
+        """
+        if not self.has_list_validators():
+            return super().list(request, *args, **kwargs)
+        etag = self.get_list_etag()
+        response = not_modified(request, etag) or super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the object, or a 304 if the client's copy is current.
+        """
+        if "HTTP_IF_NONE_MATCH" in request.META or "HTTP_IF_MODIFIED_SINCE" in request.META:
+            last_updated = self.get_last_updated()
+            if last_updated is not None:
+                response = not_modified(request, self.get_detail_etag(last_updated), last_updated)
+                if response is not None:
+                    return response
+        instance = self.get_object()
+        response = Response(self.get_serializer(instance).data)
+        set_validators(response, self.get_detail_etag(instance.last_updated), instance.last_updated)
+        return response
@@ -0,0 +1,236 @@
+"""
+Sparse fieldsets for the event and category read endpoints.
+
+Clients choose the fields of each object with `?fields=` (field names or
+preset names, comma separated) and drop fields with `?omit=`. Presets are
+declared on the serializer's `Meta.presets`, and `full` always means every
+field; `?fields=card` returns the short form the event lists need.
+
+The selection does more than trim the payload: fields that are not
+returned are removed from the serializer, so they are not serialized, and
+the queryset is narrowed with `.only()` to the columns the remaining
+fields read, so heavy columns such as `about` are never fetched. Views
+also skip loading relations nobody asked for (see `wants_field`).
+
+Selections are resolved once per serializer and query, and responses with
+different selections are cached and validated separately, since both the
+response cache key and the ETags include the query string.
+"""
+import functools
+from collections import namedtuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.validators import ValidationError
+
+# The preset selecting every field of a serializer.
+FULL = "full"
+
+Fieldset = namedtuple("Fieldset", ["fields", "columns"])
+
+
+def split(value):
+    """
+    Splits a comma separated query parameter.
+
+    Args:
+        value (str): The parameter value.
+
+    Returns:
+        list: The non-empty names, stripped.
+    """
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def model_columns(serializer, names):
+    """
+    Returns the model fields the serializer fields read, for `.only()`.
+
+    Args:
+        serializer (Serializer): A serializer instance.
+        names (iterable): The selected serializer fields.
+
+    Returns:
+        tuple: The concrete model field names, or None if a field reads
+               the whole object or something other than a model field,
+               in which case the queryset cannot be narrowed.
+    """
+    model = serializer.Meta.model
+    columns = []
+    for name in names:
+        source = serializer.fields[name].source
+        if source == "*":
+            return None
+        try:
+            field = model._meta.get_field(source.split(".")[0])
+        except FieldDoesNotExist:
+            return None
+        # Many-to-many and reverse relations are loaded by their own queries.
+        if field.concrete and not field.many_to_many:
+            columns.append(field.name)
+    return tuple(columns)
+
+
+@functools.lru_cache(maxsize=512)
+def resolve_fieldset(serializer_class, fields, omit):
+    """
+    Resolves the `fields` and `omit` parameters against a serializer.
+
+    Args:
+        serializer_class (class): The serializer class.
+        fields (str): The `fields` parameter, or an empty string for every field.
+        omit (str): The `omit` parameter.
+
+    Returns:
+        Fieldset: The selected serializer fields, in declaration order, and
+                  the model columns they read.
+
+    Raises:
+        ValueError: If a name is neither a field nor a preset, or no field
+                    is left.
+    """
+    serializer = serializer_class()
+    available = list(serializer.fields)
+    presets = dict(getattr(serializer_class.Meta, "presets", {}), **{FULL: available})
+    selected, unknown = set(), []
+    for name in split(fields) or [FULL]:
+        if name in presets:
+            selected.update(presets[name])
+        elif name in serializer.fields:
+            selected.add(name)
+        else:
+            unknown.append(name)
+    for name in split(omit):
+        if name in serializer.fields:
+            selected.discard(name)
+        else:
+            unknown.append(name)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+    names = tuple(name for name in available if name in selected)
+    if not names:
+        raise ValueError("No fields selected.")
+    return Fieldset(names, model_columns(serializer, names))
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    A serializer mixin accepting a `fields` argument, the names of the
+    fields to keep; the others are dropped before serializing.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        Creates the serializer, keeping only the given fields.
+
+        Args:
+            fields (iterable, optional): The fields to keep. Defaults to all.
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in [name for name in self.fields if name not in fields]:
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    A view mixin applying `?fields=` and `?omit=` to read requests: the
+    serializer only returns the selected fields and the filtered queryset
+    only loads their columns.
+
+    Views skip loading relations that are not selected by checking
+    `wants_field` in `get_queryset`.
+
+    Attributes:
+        fields_query_param (str): The query parameter selecting fields.
+        omit_query_param (str): The query parameter dropping fields.
+    """
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def get_fieldset(self):
+        """
+        Returns the fieldset selected by the request.
+
+        Returns:
+            Fieldset: The selection, or None when every field is returned,
+                      including when the view is used outside a request.
+
+        Raises:
+            ValidationError: If the selection names unknown fields.
+        """
+        request = getattr(self, "request", None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        fields = request.query_params.get(self.fields_query_param, "")
+        omit = request.query_params.get(self.omit_query_param, "")
+        if not (fields or omit):
+            return None
+        try:
+            return resolve_fieldset(self.get_serializer_class(), fields, omit)
+        except ValueError as exc:
+            raise ValidationError({"detail": str(exc)})
+
+    def wants_field(self, name):
+        """
+        Checks whether a serializer field is returned.
+
+        Args:
+            name (str): The serializer field name.
+
+        Returns:
+            bool: True if the field is selected.
+        """
+        fieldset = self.get_fieldset()
+        return fieldset is None or name in fieldset.fields
+
+    def narrow_queryset(self, queryset):
+        """
+        Limits the columns loaded to those the selected fields read, plus
+        the ordering columns that pagination and validators use.
+
+        Args:
+            queryset (QuerySet): The queryset to narrow.
+
+        Returns:
+            QuerySet: The narrowed queryset.
+        """
+        fieldset = self.get_fieldset()
+        if fieldset is None or fieldset.columns is None:
+            return queryset
+        model = queryset.model
+        columns = set(fieldset.columns)
+        for term in queryset.query.order_by:
+            if isinstance(term, str):
+                try:
+                    field = model._meta.get_field(term.lstrip("-"))
+                except FieldDoesNotExist:
+                    continue
+                if field.concrete:
+                    columns.add(field.name)
+        columns.add("last_updated")
+        return queryset.only(*columns)
+
+    def filter_queryset(self, queryset):
+        """
+        Filters the queryset, then narrows it to the selected columns.
+
+        Args:
+            queryset (QuerySet): The queryset to filter.
+
+        Returns:
+            QuerySet: The filtered queryset.
+        """
+        return self.narrow_queryset(super().filter_queryset(queryset))
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Returns the serializer, limited to the selected fields.
+
+        Returns:
+            Serializer: The serializer instance.
+        """
+        fieldset = self.get_fieldset()
+        if fieldset is not None:
+            kwargs.setdefault("fields", fieldset.fields)
+        return super().get_serializer(*args, **kwargs)
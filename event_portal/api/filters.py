@@ -1,18 +1,70 @@
 import django_filters
+from django import forms
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+from .. import geo
 from ..models import Event
+from ..search import get_search_backend
+
+# The radius of `?near=` lookups that do not give one, in kilometres.
+DEFAULT_RADIUS_KM = 25
+
+
+class PointField(forms.CharField):
+    """
+    A form field reading a point written as `latitude,longitude`.
+    """
+
+    def clean(self, value):
+        """
+        Parses and validates the point.
+
+        Args:
+            value (str): The submitted value.
+
+        Returns:
+            tuple: The latitude and longitude, or None if no value was given.
+
+        Raises:
+            ValidationError: If the value is not a valid point.
+        """
+        value = super().clean(value)
+        if not value:
+            return None
+        try:
+            latitude, longitude = (float(part) for part in value.split(","))
+        except ValueError:
+            raise forms.ValidationError("Enter a point as latitude,longitude.")
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise forms.ValidationError("Enter a latitude between -90 and 90 and a longitude between -180 and 180.")
+        return latitude, longitude
+
+
+class NearFilter(django_filters.Filter):
+    """
+    A filter taking a `latitude,longitude` point.
+    """
+    field_class = PointField
+
 
 class EventFilter(django_filters.FilterSet):
     """
     A filter set for querying Event instances.
 
     This filter set allows for filtering events by a date range for the
-    event start date, as well as by location, host's email, and category name.
+    event start date, as well as by location, host's email, and category name,
+    and by distance from a point.
 
     Attributes:
         event_start_date (DateFromToRangeFilter): A filter for a date range.
+        near (NearFilter): A filter keeping the events within `radius`
+                           kilometres of a point.
+        radius (NumberFilter): The radius of the `near` filter.
         Meta (class): A class to configure the filter set's behavior.
     """
     event_start_date = django_filters.DateFromToRangeFilter()
+    near = NearFilter(method="filter_near")
+    radius = django_filters.NumberFilter(method="filter_radius", min_value=0, max_value=geo.MAX_RADIUS_KM)
 
     class Meta:
         """
@@ -23,4 +75,63 @@ class EventFilter(django_filters.FilterSet):
             fields (list): The fields to include in the filter.
         """
         model = Event
-        fields = ["event_start_date", "location", "host__email", "category__name"]
\ No newline at end of file
+        fields = ["event_start_date", "location", "host__email", "category__name"]
+
+    def filter_near(self, queryset, name, value):
+        """
+        Keeps the events within the requested radius of a point, through
+        the grid index (see `event_portal.geo`).
+
+        Args:
+            queryset (QuerySet): The events.
+            name (str): The filter name.
+            value (tuple): The latitude and longitude of the point.
+
+        Returns:
+            QuerySet: The events within the radius.
+        """
+        radius = self.form.cleaned_data.get("radius")
+        radius = float(radius) if radius is not None else DEFAULT_RADIUS_KM
+        return geo.events_near(queryset, *value, radius)
+
+    def filter_radius(self, queryset, name, value):
+        """
+        Leaves the events unchanged: the radius is applied by `filter_near`.
+
+        Returns:
+            QuerySet: The events.
+        """
+        return queryset
+
+
+class EventSearchFilter(SearchFilter):
+    """
+    A search filter for events backed by the event full-text index.
+
+    It accepts the same `?search=` parameter as DRF's `SearchFilter`, but
+    matches against each event's denormalized search document instead of
+    OR-ing `icontains` lookups across the category join, so it ignores the
+    view's `search_fields`: every view searches the title, location and
+    category names. Unless the client asks for an explicit ordering,
+    results are ordered by relevance.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filters the queryset by the search terms in the request.
+
+        Args:
+            request (Request): The request object.
+            queryset (QuerySet): The queryset of events.
+            view (View): The view being filtered.
+
+        Returns:
+            QuerySet: The matching events.
+        """
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        queryset = get_search_backend().search(queryset, terms)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by("-search_rank", "-last_updated")
+        return queryset
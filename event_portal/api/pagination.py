@@ -1,4 +1,18 @@
-from rest_framework.pagination import PageNumberPagination 
+import base64
+import binascii
+import json
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
 
 class CustomPagination(PageNumberPagination):
     """
@@ -12,7 +26,436 @@ class CustomPagination(PageNumberPagination):
         page_size_query_param (str): The name of the query parameter for
                                      requesting a specific page size.
         max_page_size (int): The maximum allowed page size.
+        known_count (int): The row count given by the view, if any.
     """
     page_size = 8
     page_size_query_param = "max-size"
-    max_page_size = 15
\ No newline at end of file
+    max_page_size = 15
+    known_count = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginates the queryset, reusing the row count already read by the
+        view (as `list_count`) instead of counting the rows again.
+
+        Args:
+            queryset (QuerySet): The queryset to paginate.
+            request (Request): The request object.
+            view (View, optional): The view being paginated.
+
+        Returns:
+            list: The objects on the requested page.
+        """
+        self.known_count = getattr(view, "list_count", None)
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        """
+        Builds the Django paginator for the queryset.
+
+        Args:
+            object_list (QuerySet): The queryset to paginate.
+            per_page (int): The page size.
+
+        Returns:
+            Paginator: The paginator.
+        """
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+
+def encode_cursor(payload):
+    """
+    Encodes a cursor payload into an opaque, URL-safe token.
+
+    Args:
+        payload (dict): The JSON-serializable cursor payload.
+
+    Returns:
+        str: The encoded cursor token.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    Decodes a cursor token produced by `encode_cursor`.
+
+    Args:
+        token (str): The encoded cursor token.
+
+    Returns:
+        dict: The decoded cursor payload.
+
+    Raises:
+        ValueError: If the token is not a valid cursor.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def _invert(term):
+    """
+    Flips the direction of an ordering term.
+
+    Args:
+        term (str): An ordering term such as "-last_updated".
+
+    Returns:
+        str: The term ordered in the opposite direction.
+    """
+    return term[1:] if term.startswith("-") else f"-{term}"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over the queryset's ordering.
+
+    Instead of counting the queryset and scanning past an OFFSET, each page
+    is fetched with a `WHERE (ordering) < (last seen row)` condition, so the
+    cost of a page does not depend on how deep into the results it is. The
+    ordering applied by `OrderingFilter` is honoured and the primary key is
+    appended as a tie-breaker, which makes every position unique.
+
+    Attributes:
+        page_size (int): The default number of items to include on a page.
+        page_size_query_param (str): The name of the query parameter for
+                                     requesting a specific page size.
+        max_page_size (int): The maximum allowed page size.
+        cursor_query_param (str): The name of the cursor query parameter.
+        ordering (tuple): The ordering used when the queryset is unordered.
+        invalid_cursor_message (str): The error raised for a bad cursor.
+    """
+    page_size = 8
+    page_size_query_param = "max-size"
+    max_page_size = 15
+    cursor_query_param = "cursor"
+    ordering = ("-last_updated",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns a single page of results positioned after the cursor.
+
+        Args:
+            queryset (QuerySet): The filtered and ordered queryset.
+            request (Request): The request object.
+            view (View, optional): The view being paginated.
+
+        Returns:
+            list: The objects on the requested page.
+        """
+        self.request = request
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        position, reverse = self.get_position(request)
+        ordering = [_invert(term) for term in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(ordering, position))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = position is not None if reverse else has_more
+        self.has_previous = has_more if reverse else position is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        """
+        Wraps the page data with the next and previous cursor links.
+
+        Args:
+            data (list): The serialized page data.
+
+        Returns:
+            Response: The paginated response.
+        """
+        return Response(OrderedDict([
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        """
+        Describes the paginated response for schema generation.
+
+        Args:
+            schema (dict): The schema of a single page item list.
+
+        Returns:
+            dict: The schema of the paginated response.
+        """
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Returns the page size requested by the client, within limits.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            int: The page size to use.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """
+        Returns the ordering terms for the queryset with a unique tie-breaker.
+
+        Args:
+            queryset (QuerySet): The queryset being paginated.
+
+        Returns:
+            list: Ordering terms such as ["-last_updated", "-id"].
+        """
+        ordering = [term for term in queryset.query.order_by if isinstance(term, str)]
+        if not ordering or len(ordering) != len(queryset.query.order_by):
+            ordering = list(self.ordering)
+        pk_name = queryset.model._meta.pk.name
+        if not any(term.lstrip("-") in (pk_name, "pk") for term in ordering):
+            ordering.append(("-" if ordering[0].startswith("-") else "") + pk_name)
+        return ordering
+
+    def get_position(self, request):
+        """
+        Decodes the cursor in the request, if any.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            tuple: The position values (or None) and whether the cursor
+                   points backwards.
+
+        Raises:
+            NotFound: If the cursor is malformed or was issued for a
+                      different ordering.
+        """
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = decode_cursor(token)
+            if payload.get("o") != self.ordering or len(payload["p"]) != len(self.ordering):
+                raise ValueError("Invalid cursor")
+            position = [
+                self.to_python(term, value)
+                for term, value in zip(self.ordering, payload["p"])
+            ]
+        except (KeyError, TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(payload.get("r"))
+
+    def get_keyset_filter(self, ordering, position):
+        """
+        Builds the row-comparison filter for rows after the position.
+
+        For an ordering (a, b) this produces `a < x OR (a = x AND b < y)`,
+        using `>` for ascending terms.
+
+        Args:
+            ordering (list): The ordering terms in the paging direction.
+            position (list): The values of the last row seen.
+
+        Returns:
+            Q: The filter selecting rows after the position.
+        """
+        condition = Q()
+        equal = Q()
+        for term, value in zip(ordering, position):
+            name = term.lstrip("-")
+            lookup = "lt" if term.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_next_link(self):
+        """
+        Returns the URL of the next page, or None on the last page.
+
+        Returns:
+            str: The next page URL.
+        """
+        if not self.has_next or not self.page:
+            return None
+        return self.build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        """
+        Returns the URL of the previous page, or None on the first page.
+
+        Returns:
+            str: The previous page URL.
+        """
+        if not self.has_previous or not self.page:
+            return None
+        return self.build_link(self.page[0], reverse=True)
+
+    def build_link(self, obj, reverse):
+        """
+        Builds a page URL whose cursor points at the given object.
+
+        Args:
+            obj (Model): The boundary object of the current page.
+            reverse (bool): Whether the link pages backwards.
+
+        Returns:
+            str: The page URL.
+        """
+        payload = {
+            "o": self.ordering,
+            "p": [self.to_json(self.get_value(obj, term)) for term in self.ordering],
+        }
+        if reverse:
+            payload["r"] = 1
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(payload))
+
+    def get_value(self, obj, term):
+        """
+        Returns the value of an ordering term for an object.
+
+        Args:
+            obj (Model): The object to read, or a row read with `.values()`.
+            term (str): The ordering term.
+
+        Returns:
+            object: The attribute value.
+        """
+        name = term.lstrip("-")
+        if isinstance(obj, dict):
+            return obj[self.model._meta.pk.name if name == "pk" else name]
+        if name == "pk":
+            return obj.pk
+        return getattr(obj, name)
+
+    def to_json(self, value):
+        """
+        Converts an ordering value to a lossless JSON-friendly form.
+
+        Args:
+            value (object): The value to convert.
+
+        Returns:
+            object: The JSON-friendly value.
+        """
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
+
+    def to_python(self, term, value):
+        """
+        Converts a cursor value back to the type of its model field.
+
+        Args:
+            term (str): The ordering term.
+            value (object): The value read from the cursor.
+
+        Returns:
+            object: The converted value.
+        """
+        name = term.lstrip("-")
+        try:
+            field = self.model._meta.pk if name == "pk" else self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+
+class EventPagination(CustomPagination):
+    """
+    Page-number pagination with an opt-in keyset (cursor) mode.
+
+    Clients get the usual numbered pages by default. Passing
+    `?pagination=cursor`, or following a `cursor` link, switches to
+    `KeysetPagination`, which skips the COUNT query and costs the same for
+    every page.
+
+    Attributes:
+        pagination_mode_query_param (str): The query parameter selecting
+                                           the pagination mode.
+        keyset_class (class): The pagination class used in cursor mode.
+    """
+    pagination_mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+    keyset = None
+
+    def use_keyset(self, request):
+        """
+        Checks whether the request asks for cursor pagination.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            bool: True if cursor pagination should be used.
+        """
+        params = request.query_params
+        return (
+            params.get(self.pagination_mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginates the queryset with the mode requested by the client.
+
+        Args:
+            queryset (QuerySet): The queryset to paginate.
+            request (Request): The request object.
+            view (View, optional): The view being paginated.
+
+        Returns:
+            list: The objects on the requested page.
+        """
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """
+        Returns the paginated response for the active mode.
+
+        Args:
+            data (list): The serialized page data.
+
+        Returns:
+            Response: The paginated response.
+        """
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,52 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.parsers import BaseParser
+
+from ..importer import read_csv, read_ndjson
+
+
+class StreamingTextParser(BaseParser):
+    """
+    Base class for parsers of line-based text formats.
+
+    The request body is decoded and parsed lazily, so a large upload is
+    read row by row as it is processed instead of being loaded at once.
+    Subclasses set `read_rows` to the function turning lines into rows.
+
+    Attributes:
+        read_rows (callable): The function reading rows from lines of text.
+    """
+    read_rows = None
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns an iterator over the rows of the request body.
+
+        Args:
+            stream (file): The request body.
+            media_type (str, optional): The media type of the body.
+            parser_context (dict, optional): Context for the parser.
+
+        Returns:
+            iterator: The parsed rows.
+        """
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        lines = codecs.getreader(encoding)(stream) if stream is not None else []
+        return type(self).read_rows(lines)
+
+
+class NDJSONParser(StreamingTextParser):
+    """
+    Parses newline-delimited JSON, one object per line.
+    """
+    media_type = "application/x-ndjson"
+    read_rows = read_ndjson
+
+
+class CSVParser(StreamingTextParser):
+    """
+    Parses CSV with a header line.
+    """
+    media_type = "text/csv"
+    read_rows = read_csv
@@ -53,7 +53,7 @@ class EventHostOrReadOnly(permissions.BasePermission):
         if request.user.is_staff:
             return True
 
-        return request.user == obj.host
+        return request.user.pk == obj.host_id
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
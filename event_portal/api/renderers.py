@@ -1,7 +1,59 @@
-from rest_framework import renderers 
-import json
+from rest_framework import renderers
+import datetime
+import uuid
 from django.core.serializers.json import DjangoJSONEncoder
 
+
+def _encode_datetime(o):
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:23] + r[26:]
+    if r.endswith("+00:00"):
+        r = r[:-6] + "Z"
+    return r
+
+
+def _encode_time(o):
+    if o.tzinfo is not None and o.utcoffset() is not None:
+        raise ValueError("JSON can't represent timezone-aware times.")
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:12]
+    return r
+
+
+class FastJSONEncoder(DjangoJSONEncoder):
+    """
+    A JSON encoder producing the same output as `DjangoJSONEncoder`.
+
+    The most common non-JSON types in API payloads (UUIDs, dates and times)
+    are looked up by exact type in a table instead of walking the
+    `isinstance` chain of `DjangoJSONEncoder.default`; anything else falls
+    back to it.
+    """
+    type_encoders = {
+        uuid.UUID: str,
+        datetime.datetime: _encode_datetime,
+        datetime.date: datetime.date.isoformat,
+        datetime.time: _encode_time,
+    }
+
+    def default(self, o):
+        """
+        Converts a non-JSON value into a JSON-serializable one.
+
+        Args:
+            o (object): The value to convert.
+
+        Returns:
+            object: The JSON-serializable value.
+        """
+        encode = self.type_encoders.get(type(o))
+        if encode is not None:
+            return encode(o)
+        return super().default(o)
+
+
 class CustomRenderer(renderers.JSONRenderer):
     """
     A custom JSON renderer that wraps the response data in a standard format.
@@ -12,15 +64,19 @@ class CustomRenderer(renderers.JSONRenderer):
 
     Attributes:
         charset (str): The character set for the response.
+        encoder (FastJSONEncoder): The shared encoder used for every response.
     """
     charset = "utf-8"
+    encoder = FastJSONEncoder()
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
         Renders the data into a custom JSON format.
 
-        If the data contains an error detail, the status is set to 'Error'.
-        Otherwise, the status is 'Successful'.
+        The status is 'Error' when the response is an error response (a 4xx
+        or 5xx status code, or one built from a handled exception), and
+        'Successful' otherwise. Without a response in the renderer context,
+        the data itself is inspected for error details.
 
         Args:
             data (dict): The response data.
@@ -28,23 +84,53 @@ class CustomRenderer(renderers.JSONRenderer):
             renderer_context (dict, optional): Context for the renderer.
 
         Returns:
-            str: The JSON-formatted response string.
+            bytes: The JSON-encoded response body.
         """
-        response = ""
-
-        if "ErrorDetail" in str(data):
-            response = json.dumps(
-                {
-                    "status": "Error",
-                    "data": data,
-                }
-            )
-        else:
-            response = json.dumps(
-                {
-                    "status": "Successful",
-                    "data": data,
-                },
-                cls=DjangoJSONEncoder
-            )
-        return response
\ No newline at end of file
+        status = "Error" if self.is_error(data, renderer_context) else "Successful"
+        # ensure_ascii output is pure ASCII, which is also valid UTF-8.
+        return self.encoder.encode({"status": status, "data": data}).encode("ascii")
+
+    def is_error(self, data, renderer_context=None):
+        """
+        Checks whether the data being rendered describes an error.
+
+        Args:
+            data (dict): The response data.
+            renderer_context (dict, optional): Context for the renderer.
+
+        Returns:
+            bool: True if the response is an error response.
+        """
+        response = (renderer_context or {}).get("response")
+        if response is None:
+            return "ErrorDetail" in str(data)
+        return response.exception or response.status_code >= 400
+
+
+class NDJSONRenderer(CustomRenderer):
+    """
+    Selects NDJSON for streamed exports (`?format=ndjson` or an Accept
+    header). Export rows are streamed by the view; this renderer only
+    renders error responses, in the standard JSON format.
+
+    Attributes:
+        media_type (str): The media type of the export.
+        format (str): The format suffix of the export.
+    """
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVRenderer(CustomRenderer):
+    """
+    Selects CSV for streamed exports (`?format=csv` or an Accept header).
+    Export rows are streamed by the view; this renderer only renders error
+    responses, in the standard JSON format.
+
+    Attributes:
+        media_type (str): The media type of the export.
+        format (str): The format suffix of the export.
+    """
+    media_type = "text/csv"
+    format = "csv"
+
@@ -1,13 +1,15 @@
 from ..models import *
+from ..inventory import remaining_tickets
+from .fieldsets import SparseFieldsetSerializerMixin
 from rest_framework import serializers 
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the Category model.
 
     This serializer handles the representation of Category objects, including
-    all fields.
+    all fields unless a sparse fieldset is selected.
 
     Attributes:
         Meta (class): A class to configure the serializer's behavior.
@@ -20,17 +22,64 @@ class CategorySerializer(serializers.ModelSerializer):
         Attributes:
             model (Model): The model to be serialized (Category).
             fields (str): Specifies that all fields in the model should be used.
+            presets (dict): The named fieldsets clients can select.
         """
         model = Category
         fields = "__all__"
+        presets = {"card": ["name", "slug"]}
 
 
-class EventSerializer(serializers.ModelSerializer):
+class CategorySummarySerializer(serializers.ModelSerializer):
+    """
+    Serializer for the upcoming event summary of a category.
+
+    Attributes:
+        Meta (class): A class to configure the serializer's behavior.
+    """
+
+    class Meta:
+        """
+        Meta options for the CategorySummarySerializer.
+
+        Attributes:
+            model (Model): The model to be serialized (CategorySummary).
+            fields (list): The fields to include in the serialization.
+        """
+        model = CategorySummary
+        fields = ["upcoming_count", "next_start_date"]
+
+
+class CategoryWithCountsSerializer(CategorySerializer):
+    """
+    Serializer for categories along with the summary of their upcoming
+    events, for category menus.
+
+    Attributes:
+        counts (CategorySummarySerializer): The number of upcoming events
+                                            and the next start date.
+        Meta (class): A class to configure the serializer's behavior.
+    """
+    counts = CategorySummarySerializer(source="summary", read_only=True)
+
+    class Meta(CategorySerializer.Meta):
+        """
+        Meta options for the CategoryWithCountsSerializer.
+
+        Attributes:
+            presets (dict): The named fieldsets clients can select.
+        """
+        presets = {"card": ["name", "slug", "counts"]}
+
+
+class EventSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the Event model.
 
     This serializer handles the representation of Event objects. It includes
     validation to ensure that the event's end date is not before its start date.
+    The `card` preset holds the fields event lists show. Changing an
+    event's location or address clears its coordinates until it is
+    geocoded again.
 
     Attributes:
         host (StringRelatedField): A read-only field for the event host.
@@ -47,16 +96,27 @@ class EventSerializer(serializers.ModelSerializer):
         Attributes:
             model (Model): The model to be serialized (Event).
             fields (list): The fields to include in the serialization.
+            read_only_fields (list): The fields clients cannot write.
+            presets (dict): The named fieldsets clients can select.
         """
         model = Event
         fields = [
             "title", "event_start_date",
             "event_start_time", "event_end_date",
             "event_end_time", "location",
-            "address", "date_created", "category",
+            "address", "latitude", "longitude",
+            "date_created", "category",
             "last_updated", "about", "expired", "host",
             "slug"
         ]
+        # Coordinates are set by the geocoding step, not by clients.
+        read_only_fields = ["latitude", "longitude"]
+        presets = {
+            "card": [
+                "title", "slug", "event_start_date", "event_start_time",
+                "event_end_date", "event_end_time", "location",
+            ],
+        }
 
     def validate(self, data):
         """
@@ -78,5 +138,145 @@ class EventSerializer(serializers.ModelSerializer):
         except KeyError:
             pass
         return data
-        
-    
\ No newline at end of file
+
+    def update(self, instance, validated_data):
+        """
+        Updates an event, clearing its coordinates if it moved.
+
+        Args:
+            instance (Event): The event to update.
+            validated_data (dict): The validated data.
+
+        Returns:
+            Event: The updated event.
+        """
+        if any(
+            name in validated_data and validated_data[name] != getattr(instance, name)
+            for name in ("location", "address")
+        ):
+            validated_data.update(latitude=None, longitude=None)
+        return super().update(instance, validated_data)
+
+
+class EventImportSerializer(EventSerializer):
+    """
+    Serializer validating one row of a bulk event import.
+
+    It validates the same fields as `EventSerializer`, but leaves the checks
+    that need a query per row to the importer, which runs them once per
+    chunk: categories are given by id, name or slug and resolved in bulk,
+    and title uniqueness is checked against all the titles of a chunk.
+
+    Attributes:
+        category (ListField): The ids, names or slugs of the categories.
+        Meta (class): A class to configure the serializer's behavior.
+    """
+    category = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+    class Meta(EventSerializer.Meta):
+        """
+        Meta options for the EventImportSerializer.
+
+        Attributes:
+            extra_kwargs (dict): Drops the per-row title uniqueness check.
+        """
+        extra_kwargs = {"title": {"validators": []}}
+
+
+class TicketSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the Ticket model.
+
+    This serializer handles the representation of ticket types and their
+    stock. The remaining stock is read-only and only changes through orders.
+
+    Attributes:
+        event (StringRelatedField): A read-only field for the event.
+        available (SerializerMethodField): The remaining stock, including
+                                           any sharded stock.
+        Meta (class): A class to configure the serializer's behavior.
+    """
+    event = serializers.StringRelatedField()
+    available = serializers.SerializerMethodField()
+
+    class Meta:
+        """
+        Meta options for the TicketSerializer.
+
+        Attributes:
+            model (Model): The model to be serialized (Ticket).
+            fields (list): The fields to include in the serialization.
+        """
+        model = Ticket
+        fields = ["id", "ticket_type", "ticket_price", "capacity", "available", "event"]
+
+    def get_available(self, obj):
+        """
+        Returns the remaining stock of the ticket type.
+
+        Uses the `remaining` annotation when the queryset provides it.
+
+        Args:
+            obj (Ticket): The ticket being serialized.
+
+        Returns:
+            int: The number of tickets neither sold nor held.
+        """
+        remaining = getattr(obj, "remaining", None)
+        if remaining is None:
+            remaining = remaining_tickets(obj)
+        return remaining
+
+
+class TicketOrderSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the TicketOrder model.
+
+    Attributes:
+        Meta (class): A class to configure the serializer's behavior.
+    """
+
+    class Meta:
+        """
+        Meta options for the TicketOrderSerializer.
+
+        Attributes:
+            model (Model): The model to be serialized (TicketOrder).
+            fields (list): The fields to include in the serialization.
+        """
+        model = TicketOrder
+        fields = [
+            "id", "ticket", "quantity", "unit_price",
+            "status", "expires_at", "date_created"
+        ]
+        read_only_fields = fields
+
+
+class TicketHoldSerializer(serializers.Serializer):
+    """
+    Serializer validating a request to hold tickets.
+
+    Attributes:
+        quantity (IntegerField): The number of tickets to hold.
+    """
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+
+class WaitingRoomStatusSerializer(serializers.Serializer):
+    """
+    Serializer for a buyer's place in an event's waiting room.
+
+    Attributes:
+        token (CharField): The queue token, only returned on joining.
+        event (SlugField): The slug of the event.
+        position (IntegerField): The buyer's position in the queue.
+        admitted (BooleanField): Whether the buyer may purchase tickets.
+        ahead (IntegerField): The number of buyers still waiting ahead.
+        estimated_wait (IntegerField): The estimated wait in seconds.
+    """
+    token = serializers.CharField(required=False)
+    event = serializers.SlugField()
+    position = serializers.IntegerField()
+    admitted = serializers.BooleanField()
+    ahead = serializers.IntegerField()
+    estimated_wait = serializers.IntegerField(allow_null=True)
@@ -2,7 +2,8 @@
 URL patterns for the event portal API.
 
 This module defines the API endpoints for managing events and categories,
-including creating, listing, and detailing events and categories.
+including creating, listing, and detailing events and categories, as well
+as holding and purchasing tickets.
 """
 from django.urls import path
 from . import views
@@ -16,6 +17,10 @@ urlpatterns = [
 
     # Event endpoints (using a ViewSet)
     path('create-event/', views.EventAPIViewset.as_view({'post': 'create'}), name='create-event'),
+    path('import-events/', views.EventImportView.as_view(), name='import-events'),
+    path('changes/', views.ChangeFeedView.as_view(), name='changes'),
+    path('host-dashboard/', views.HostDashboardView.as_view(), name='host-dashboard'),
+    path('export-events/', views.EventExportView.as_view(), name='export-events'),
     path('event-list/', views.EventAPIViewset.as_view({'get': 'list'}), name='events-list'),
     path('event-detail/<slug:slug>/',
          views.EventAPIViewset.as_view(
@@ -28,5 +33,14 @@ urlpatterns = [
          ),
 
     # Endpoint to get events by category
-    path("events-by-category/<slug:slug>/", views.CategoryEventView.as_view(), name="events-by-category")
+    path("events-by-category/<slug:slug>/", views.CategoryEventView.as_view(), name="events-by-category"),
+
+    # Ticket and order endpoints
+    path("event-detail/<slug:slug>/tickets/", views.EventTicketListCreateView.as_view(), name="event-tickets"),
+    path("event-detail/<slug:slug>/waiting-room/", views.WaitingRoomJoinView.as_view(), name="waiting-room-join"),
+    path("waiting-room-status/", views.WaitingRoomStatusView.as_view(), name="waiting-room-status"),
+    path("hold-ticket/<uuid:pk>/", views.HoldTicketView.as_view(), name="hold-ticket"),
+    path("confirm-order/<uuid:pk>/", views.ConfirmOrderView.as_view(), name="confirm-order"),
+    path("cancel-order/<uuid:pk>/", views.CancelOrderView.as_view(), name="cancel-order"),
+    path("my-orders/", views.UserOrderListView.as_view(), name="my-orders"),
 ]
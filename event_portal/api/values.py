@@ -0,0 +1,234 @@
+"""
+Read-only serializers working on `.values()` rows instead of model instances.
+
+`ModelSerializer` builds a model instance per row and then dispatches
+`get_attribute` and `to_representation` through every field of it, which
+dominates the CPU time of large event pages. A values serializer
+reproduces the output of one of those serializers from plain rows: the
+columns are read with `.values()`, many-to-many ids with one query on the
+link table for the whole page, and each item is built by a single loop
+over precomputed `(name, column, convert)` triples. The conversions are
+the `to_representation` methods of the original serializer's own fields,
+skipped for fields that return their value unchanged, so the output is the
+same, key order included.
+
+The triples are compiled once per serializer and fieldset, and only the
+selected fields' columns are read. Values serializers are only used for
+lists; details and writes keep the regular serializers.
+"""
+import functools
+from collections import defaultdict, namedtuple
+
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+
+from .serializers import CategorySerializer, CategoryWithCountsSerializer, EventSerializer
+
+# Fields whose representation of a database value is the value itself.
+UNCHANGED = (serializers.CharField, serializers.BooleanField, serializers.IntegerField, relations.StringRelatedField)
+
+Plan = namedtuple("Plan", ["fields", "nested", "many_to_many", "columns"])
+
+
+def get_converter(field):
+    """
+    Returns the conversion of a field's database values.
+
+    Args:
+        field (Field): The serializer field.
+
+    Returns:
+        callable: The field's `to_representation`, or None if it returns
+                  database values unchanged.
+    """
+    return None if isinstance(field, UNCHANGED) else field.to_representation
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Base class for read-only serializers building the output of
+    `serializer_class` from rows read by `rows()`.
+
+    Attributes:
+        serializer_class (class): The serializer whose output is reproduced.
+        sources (dict): The `.values()` lookups of fields that do not read
+                        their own column, such as string related fields.
+        many_to_many (tuple): The fields holding the primary keys of a
+                              many-to-many relation.
+        nested (tuple): The fields nesting a serializer of a one-to-one
+                        relation, read with a join.
+        plan (Plan): The compiled fields.
+    """
+    serializer_class = None
+    sources = {}
+    many_to_many = ()
+    nested = ()
+
+    def __init__(self, instance=None, fields=None, **kwargs):
+        """
+        Creates the serializer.
+
+        Args:
+            instance (list, optional): The rows to serialize.
+            fields (iterable, optional): The fields to return. Defaults to all.
+        """
+        super().__init__(instance, **kwargs)
+        self.plan = self.compile(tuple(fields) if fields is not None else None)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def compile(cls, fields):
+        """
+        Compiles the fields of `serializer_class` into `(name, column,
+        convert)` triples. Fields filled after the main loop have no column.
+
+        Args:
+            fields (tuple): The fields to return, or None for all.
+
+        Returns:
+            Plan: The triples of the fields, the relation and triples of
+                  each nested field, the many-to-many fields and the
+                  columns to read.
+        """
+        triples, nested, many_to_many, columns = [], {}, [], []
+        for name, field in cls.serializer_class().fields.items():
+            if fields is not None and name not in fields:
+                continue
+            if name in cls.many_to_many:
+                triples.append((name, None, None))
+                many_to_many.append(name)
+            elif name in cls.nested:
+                triples.append((name, None, None))
+                children = [
+                    (child_name, f"{field.source}__{child.source}", get_converter(child))
+                    for child_name, child in field.fields.items()
+                ]
+                nested[name] = (f"{field.source}__pk", children)
+                columns += [f"{field.source}__pk", *[column for _, column, _ in children]]
+            else:
+                column = cls.sources.get(name, field.source)
+                triples.append((name, column, get_converter(field)))
+                columns.append(column)
+        return Plan(triples, nested, many_to_many, columns)
+
+    def rows(self, queryset):
+        """
+        Turns a queryset into one of rows holding the columns to serialize.
+
+        The primary key and the ordering columns are always read, for the
+        many-to-many fields and for cursor pagination.
+
+        Args:
+            queryset (QuerySet): The filtered and ordered queryset.
+
+        Returns:
+            QuerySet: A queryset of dicts.
+        """
+        ordering = [term.lstrip("-") for term in queryset.query.order_by if isinstance(term, str)]
+        columns = dict.fromkeys(["id", "last_updated", *ordering, *self.plan.columns])
+        return queryset.prefetch_related(None).values(*columns)
+
+    def load(self, rows, data):
+        """
+        Fills the many-to-many fields of a page, with one query per field.
+
+        Args:
+            rows (list): The rows of the page.
+            data (list): The items built from the rows, in the same order.
+        """
+        model = self.serializer_class.Meta.model
+        for name in self.plan.many_to_many:
+            field = model._meta.get_field(name)
+            source, target = f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+            pairs = field.remote_field.through.objects.filter(
+                **{f"{source}__in": [row["id"] for row in rows]}
+            ).values_list(source, target)
+            links = defaultdict(list)
+            for owner, related in pairs:
+                links[owner].append(related)
+            for row, item in zip(rows, data):
+                item[name] = links[row["id"]]
+
+    def to_representation(self, rows):
+        """
+        Serializes rows.
+
+        Args:
+            rows (iterable): The rows, as read by a `rows()` queryset.
+
+        Returns:
+            list: The serialized items.
+        """
+        rows = list(rows)
+        triples, nested = self.plan.fields, self.plan.nested.items()
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in triples:
+                value = row[column] if column is not None else None
+                item[name] = value if value is None or convert is None else convert(value)
+            for name, (key, children) in nested:
+                if row[key] is not None:
+                    child = item[name] = {}
+                    for child_name, column, convert in children:
+                        value = row[column]
+                        child[child_name] = value if value is None or convert is None else convert(value)
+            data.append(item)
+        if rows and self.plan.many_to_many:
+            self.load(rows, data)
+        return data
+
+
+class EventValuesSerializer(ValuesSerializer):
+    """
+    Values serializer reproducing `EventSerializer`.
+    """
+    serializer_class = EventSerializer
+    # The string representation of a user is their email address.
+    sources = {"host": "host__email"}
+    many_to_many = ("category",)
+
+
+class CategoryValuesSerializer(ValuesSerializer):
+    """
+    Values serializer reproducing `CategorySerializer`.
+    """
+    serializer_class = CategorySerializer
+
+
+class CategoryWithCountsValuesSerializer(ValuesSerializer):
+    """
+    Values serializer reproducing `CategoryWithCountsSerializer`, reading
+    the counts from the summary in the same query.
+    """
+    serializer_class = CategoryWithCountsSerializer
+    nested = ("counts",)
+
+
+# The values serializer reproducing each serializer.
+VALUES_SERIALIZERS = {
+    serializer.serializer_class: serializer
+    for serializer in (EventValuesSerializer, CategoryValuesSerializer, CategoryWithCountsValuesSerializer)
+}
+
+
+class ValuesListMixin:
+    """
+    A list view mixin serializing pages from `.values()` rows when a values
+    serializer reproduces the view's serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns a page of the list, serialized from values.
+        """
+        values_serializer_class = VALUES_SERIALIZERS.get(self.get_serializer_class())
+        if values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+        fieldset = self.get_fieldset()
+        fields = fieldset.fields if fieldset is not None else None
+        rows = values_serializer_class(fields=fields).rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is None:
+            return Response(values_serializer_class(rows, fields=fields).data)
+        return self.get_paginated_response(values_serializer_class(page, fields=fields).data)
@@ -1,29 +1,55 @@
-from datetime import datetime 
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.generics import (
+    CreateAPIView, GenericAPIView, ListAPIView,
+    ListCreateAPIView, RetrieveUpdateDestroyAPIView
+)
+from rest_framework.response import Response
+from rest_framework.validators import ValidationError
+from rest_framework.exceptions import PermissionDenied
+from rest_framework import status
+from rest_framework.filters import OrderingFilter
 from django.shortcuts import get_object_or_404
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from django.http import StreamingHttpResponse
+from django.db.models import Count, Max
+from django.utils import timezone
+from authentication.api.authentication import StatelessJWTAuthentication
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
 from rest_framework import viewsets
-from django_auto_prefetching import AutoPrefetchViewSetMixin
 
  
 
 from ..models import *
+from .. import inventory, waiting_room
+from ..importer import import_events
+from ..exporter import EXPORTERS, filter_events
+from ..changes import changes_since
+from ..dashboard import INTERVALS, host_dashboard
 from .serializers import *
-from .renderers import CustomRenderer
+from .renderers import CustomRenderer, CSVRenderer, NDJSONRenderer
+from .parsers import CSVParser, NDJSONParser
 from .permissions import *
-from .pagination import CustomPagination
-from .filters import EventFilter
-
-
-class CategoryListView(ListAPIView):
+from .pagination import CustomPagination, EventPagination
+from .filters import EventFilter, EventSearchFilter
+from .conditional import ConditionalGetMixin, make_etag
+from .fieldsets import SparseFieldsetMixin
+from .values import ValuesListMixin
+from .cache import (
+    CachedResponseMixin, EVENTS_TAG, CATEGORIES_TAG,
+    event_tag, category_tag, category_events_tag, host_tag
+)
+
+
+class CategoryListView(CachedResponseMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, ListAPIView):
     """
     API endpoint to list all available event categories.
 
     This view provides a paginated list of all categories in the system.
+    With `?counts=true`, each category also carries the number of its
+    upcoming events and their next start date, read from the maintained
+    category summaries in the same query. `?fields=` and `?omit=` select
+    the fields returned. Responses are cached until a category (or, with
+    counts, an event) changes, and carry an ETag for conditional requests.
 
     Attributes:
         serializer_class (Serializer): The serializer for Category objects.
@@ -36,6 +62,68 @@ class CategoryListView(ListAPIView):
     pagination_class = CustomPagination
     queryset = Category.objects.all()
 
+    def wants_counts(self):
+        """
+        Checks whether the request asks for the upcoming event counts.
+
+        Returns:
+            bool: True if `counts` is set to a true value.
+        """
+        return self.request.query_params.get("counts", "").lower() in ("1", "true", "yes")
+
+    def get_queryset(self):
+        """
+        Returns the categories, with their summaries when counts are asked for.
+
+        Returns:
+            QuerySet: A queryset of Category objects.
+        """
+        queryset = super().get_queryset()
+        if self.wants_counts():
+            queryset = queryset.select_related("summary")
+        return queryset
+
+    def get_serializer_class(self):
+        """
+        Returns the serializer, including the counts when asked for.
+
+        Returns:
+            Serializer: The serializer class.
+        """
+        if self.wants_counts():
+            return CategoryWithCountsSerializer
+        return super().get_serializer_class()
+
+    def get_list_etag(self):
+        """
+        Returns the ETag of the list, which with counts also depends on the
+        latest change to the summaries.
+
+        Returns:
+            str: The ETag.
+        """
+        if not self.wants_counts():
+            return super().get_list_etag()
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        stats = queryset.aggregate(
+            count=Count("pk"), last_updated=Max("last_updated"), counts_updated=Max("summary__last_updated"),
+        )
+        self.list_count = stats["count"]
+        return make_etag(
+            self.request.build_absolute_uri(), stats["count"], stats["last_updated"], stats["counts_updated"],
+        )
+
+    def get_cache_tags(self):
+        """
+        Returns the cache tags for the category list.
+
+        Returns:
+            list: The cache tags.
+        """
+        if self.wants_counts():
+            return [CATEGORIES_TAG, EVENTS_TAG]
+        return [CATEGORIES_TAG]
+
 
 class CategoryCreateView(CreateAPIView):
     """
@@ -50,18 +138,21 @@ class CategoryCreateView(CreateAPIView):
         renderer_classes (list): The renderers for the response.
         serializer_class (Serializer): The serializer for creating a Category.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAdminUser]
     renderer_classes = [CustomRenderer]
     serializer_class = CategorySerializer
 
 
-class CategoryDetailView(RetrieveUpdateDestroyAPIView):
+class CategoryDetailView(CachedResponseMixin, ConditionalGetMixin, SparseFieldsetMixin, RetrieveUpdateDestroyAPIView):
     """
     API endpoint to retrieve, update, or delete a category.
 
     This view allows anyone to view a category, but only admin users can
-    update or delete it. The category is looked up by its slug.
+    update or delete it. The category is looked up by its slug, and
+    `?fields=` and `?omit=` select the fields returned. Retrieved categories
+    are cached until the category changes, and carry an ETag and a
+    Last-Modified date for conditional requests.
 
     Attributes:
         serializer_class (Serializer): The serializer for Category objects.
@@ -72,6 +163,15 @@ class CategoryDetailView(RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAdminOrReadOnly]
     renderer_classes = [CustomRenderer]
 
+    def get_queryset(self):
+        """
+        Returns the categories the view looks the requested one up in.
+
+        Returns:
+            QuerySet: All Category objects.
+        """
+        return Category.objects.all()
+
     def get_object(self):
         """
         Retrieves the category object based on the slug in the URL.
@@ -80,17 +180,30 @@ class CategoryDetailView(RetrieveUpdateDestroyAPIView):
             Category: The category instance.
         """
         slug = self.kwargs["slug"]
-        obj = get_object_or_404(Category, slug=slug)
+        obj = get_object_or_404(self.narrow_queryset(self.get_queryset()), slug=slug)
         return obj
 
+    def get_cache_tags(self):
+        """
+        Returns the cache tags for the requested category.
 
-class EventAPIViewset(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
+        Returns:
+            list: The cache tags.
+        """
+        return [category_tag(self.kwargs["slug"])]
+
+
+class EventAPIViewset(CachedResponseMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     A ViewSet for handling CRUD operations for Events.
 
     This ViewSet provides 'list', 'create', 'retrieve', 'update',
-    and 'destroy' actions for events. It also includes filtering, searching,
-    and ordering capabilities.
+    and 'destroy' actions for events. It also includes filtering, searching
+    (`?search=` matches each event's title, location and category names)
+    and ordering capabilities. 'list' and 'retrieve' return the fields
+    selected with `?fields=` and `?omit=` (e.g. `?fields=card`), and their
+    responses are cached until a relevant event changes, and carry
+    validators for conditional requests.
 
     Attributes:
         serializer_class (Serializer): The serializer for Event objects.
@@ -98,15 +211,13 @@ class EventAPIViewset(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
         renderer_classes (list): The renderers for the response.
         filter_backends (list): The filter backends to use.
         filterset_class (FilterSet): The filter set for filtering events.
-        search_fields (list): The fields to search against.
         ordering_fields (list): The fields to order by.
     """
     serializer_class = EventSerializer
-    pagination_class = CustomPagination
+    pagination_class = EventPagination
     renderer_classes = [CustomRenderer]
-    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, EventSearchFilter]
     filterset_class = EventFilter
-    search_fields = ["location", "category__name", "title"]
     ordering_fields = ["event_start_date", "date_posted", "last_updated"]
 
     def perform_create(self, serializer):
@@ -116,22 +227,29 @@ class EventAPIViewset(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
         Args:
             serializer (EventSerializer): The serializer instance.
         """
-        user = self.request.user
-        serializer.save(host=user)
+        serializer.save(host_id=self.request.user.pk)
 
     def get_queryset(self):
         """
-        Returns a queryset of upcoming events.
+        Returns a queryset of events.
 
-        Filters events to include only those with a start date from today
-        onwards, ordered by the most recently updated.
+        The list is limited to events that have not expired, ordered by the
+        most recently updated, while single events are looked up among all
+        events. The host and the categories are loaded with the events when
+        they are returned, so serializing a page takes the same number of
+        queries whatever its size.
 
         Returns:
-            QuerySet: A queryset of future Event objects.
+            QuerySet: A queryset of Event objects.
         """
-        return Event.objects.filter(
-            event_start_date__gte=datetime.today().date().strftime('%Y-%m-%d')
-        ).order_by("-last_updated")
+        queryset = Event.objects.order_by("-last_updated")
+        if self.action == "list":
+            queryset = queryset.filter(expired=False)
+        if self.wants_field("host"):
+            queryset = queryset.select_related("host")
+        if self.wants_field("category"):
+            queryset = queryset.prefetch_related("category")
+        return queryset
 
     def get_object(self):
         """
@@ -141,10 +259,21 @@ class EventAPIViewset(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
             Event: The event instance.
         """
         slug = self.kwargs["slug"]
-        obj = get_object_or_404(Event, slug=slug)
+        obj = get_object_or_404(self.narrow_queryset(self.get_queryset()), slug=slug)
         self.check_object_permissions(self.request, obj)
         return obj
 
+    def get_cache_tags(self):
+        """
+        Returns the cache tags for the current action.
+
+        Returns:
+            list: The cache tags.
+        """
+        if self.action == "retrieve":
+            return [event_tag(self.kwargs["slug"])]
+        return [EVENTS_TAG]
+
     def get_permissions(self):
         """
         Sets the permissions required for each action.
@@ -165,12 +294,142 @@ class EventAPIViewset(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
         return super().get_permissions()
 
 
-class CategoryEventView(ListAPIView):
+class EventImportView(GenericAPIView):
+    """
+    API endpoint to create many events at once for the current user.
+
+    The request body is NDJSON (`application/x-ndjson`, one event object
+    per line) or CSV (`text/csv` with a header line, categories separated
+    by semicolons). Events have the same fields as in `create-event/`, with
+    categories given by id, name or slug. Rows are imported in chunks;
+    invalid rows are reported by row number without stopping the import.
+
+    Attributes:
+        permission_classes (list): The permissions required for this view.
+        parser_classes (list): The parsers for the request body.
+        renderer_classes (list): The renderers for the response.
+        chunk_size (int): The number of rows validated and written at once.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [NDJSONParser, CSVParser]
+    renderer_classes = [CustomRenderer]
+    chunk_size = 500
+
+    def post(self, request, *args, **kwargs):
+        """
+        Imports the events in the request body.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The number of events created and the rejected rows,
+                      with a 400 status when every row was rejected.
+        """
+        result = import_events(request.data, request.user, chunk_size=self.chunk_size)
+        if result["created"]:
+            return Response(result, status=status.HTTP_201_CREATED)
+        if result["errors"]:
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result)
+
+
+class EventExportView(GenericAPIView):
+    """
+    API endpoint streaming every matching event as NDJSON or CSV.
+
+    It accepts the event list filters and `search`, plus `since` to only
+    export events updated after a time. The format is chosen with
+    `?format=ndjson` (the default) or `?format=csv`, or the Accept header.
+    The `X-Export-Until` response header holds the time the export covers
+    up to, to pass as `since` to the next incremental export.
+
+    Attributes:
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the export formats.
+        chunk_size (int): The number of events read from the database at once.
+    """
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    chunk_size = 500
+
+    def get(self, request, *args, **kwargs):
+        """
+        Streams the matching events.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            StreamingHttpResponse: The exported events.
+
+        Raises:
+            ValidationError: If a filter parameter is not valid.
+        """
+        until = timezone.now()
+        queryset = filter_events(request.query_params, until=until)
+        export, content_type = EXPORTERS[request.accepted_renderer.format]
+        response = StreamingHttpResponse(export(queryset, self.chunk_size), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="events.{request.accepted_renderer.format}"'
+        response["X-Export-Until"] = until.isoformat()
+        return response
+
+
+class ChangeFeedView(GenericAPIView):
+    """
+    API endpoint listing the events and categories changed or deleted after
+    a watermark, oldest change first.
+
+    A mirror starts without a watermark and passes the `watermark` of each
+    response to its next request, as `?watermark=`; `has_more` tells it
+    whether to ask again straight away.
+
+    Attributes:
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+        default_limit (int): The number of changes returned by default.
+        max_limit (int): The largest `?limit=` accepted.
+    """
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [CustomRenderer]
+    default_limit = 100
+    max_limit = 500
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns a page of changes.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The changes, the next watermark and `has_more`.
+
+        Raises:
+            ValidationError: If the watermark or limit is not valid.
+        """
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"detail": "The limit must be a number."})
+        limit = min(max(limit, 1), self.max_limit)
+        try:
+            page = changes_since(request.query_params.get("watermark"), limit=limit)
+        except ValueError:
+            raise ValidationError({"detail": "Invalid watermark."})
+        return Response(page)
+
+
+class CategoryEventView(CachedResponseMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, ListAPIView):
     """
     API endpoint to list all events belonging to a specific category.
 
     This view retrieves a list of events filtered by the category slug
-    provided in the URL.
+    provided in the URL, with the fields selected by `?fields=` and
+    `?omit=`. `?search=` matches the same search document as the event
+    list: the title, the location and the category names. Responses are cached until an event in the
+    category, or the category itself, changes, and carry an ETag for
+    conditional requests.
 
     Attributes:
         serializer_class (Serializer): The serializer for Event objects.
@@ -178,44 +437,384 @@ class CategoryEventView(ListAPIView):
         renderer_classes (list): The renderers for the response.
         filter_backends (list): The filter backends to use.
         ordering_fields (list): The fields to order by.
-        search_fields (list): The fields to search against.
     """
     serializer_class = EventSerializer
-    pagination_class = CustomPagination
+    pagination_class = EventPagination
     renderer_classes = [CustomRenderer]
-    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, EventSearchFilter]
     ordering_fields = ["event_start_date", "date_posted", "last_updated"]
-    search_fields = ["location", "title"]
 
     def get_queryset(self):
         """
-        Returns a queryset of events filtered by category slug.
+        Returns a queryset of the events in a category that have not expired.
 
-        The slug is extracted from the URL kwargs.
+        The slug is extracted from the URL kwargs. Events are ordered by the
+        most recently updated so that both page-number and cursor pagination
+        see a stable order. The host and the categories are loaded with the
+        events when they are returned.
 
         Returns:
             QuerySet: A queryset of Event objects in the specified category.
         """
         slug = self.kwargs["slug"]
-        queryset = Event.objects.filter(category__slug=slug)
+        queryset = Event.objects.filter(category__slug=slug, expired=False).order_by("-last_updated")
+        if self.wants_field("host"):
+            queryset = queryset.select_related("host")
+        if self.wants_field("category"):
+            queryset = queryset.prefetch_related("category")
         return queryset
-    
-    
-    
-    
-    
-    
 
+    def get_cache_tags(self):
+        """
+        Returns the cache tags for the requested category's events.
+
+        Returns:
+            list: The cache tags.
+        """
+        return [category_events_tag(self.kwargs["slug"])]
+
+
+class HostDashboardView(CachedResponseMixin, GenericAPIView):
+    """
+    API endpoint returning aggregates of the current host's events.
+
+    The dashboard holds the number of upcoming and expired events, overall
+    and per category, a histogram of start dates grouped by `?interval=`
+    (`day`, `week`, `month` or `year`, by default `month`) and the price
+    statistics of each ticket type. It is cached per host until one of the
+    host's events or tickets, or a category, changes.
+
+    Attributes:
+        authentication_classes (list): The authentication methods for this view.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated, EventHostPermissions]
+    renderer_classes = [CustomRenderer]
+
+    def get_cache_tags(self):
+        """
+        Returns the cache tags for the host's dashboard.
+
+        Returns:
+            list: The cache tags.
+        """
+        return [host_tag(self.request.user.pk), CATEGORIES_TAG]
+
+    def get_cache_key(self, request):
+        """
+        Builds the cache key for the current host's dashboard.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"{super().get_cache_key(request)}:{request.user.pk}"
 
-         
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the cached dashboard, building it on a miss.
 
-        
-        
+        Args:
+            request (Request): The request object.
 
-    
-    
-    
-    
-        
-    
+        Returns:
+            Response: The dashboard.
+        """
+        return self.cached_response(self.build, request, *args, **kwargs)
+
+    def build(self, request, *args, **kwargs):
+        """
+        Builds the dashboard of the current host.
 
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The dashboard.
+
+        Raises:
+            ValidationError: If the interval is not valid.
+        """
+        interval = request.query_params.get("interval", "month")
+        if interval not in INTERVALS:
+            raise ValidationError({"detail": f"The interval must be one of {', '.join(INTERVALS)}."})
+        return Response(host_dashboard(request.user.pk, interval))
+
+
+class EventTicketListCreateView(ListCreateAPIView):
+    """
+    API endpoint to list an event's ticket types or add a new one.
+
+    Anyone can list the ticket types of an event and their remaining stock.
+    Only the event host or admin users can add ticket types.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for Ticket objects.
+        renderer_classes (list): The renderers for the response.
+    """
+    serializer_class = TicketSerializer
+    renderer_classes = [CustomRenderer]
+
+    def get_event(self):
+        """
+        Retrieves the event based on the slug in the URL.
+
+        Returns:
+            Event: The event instance.
+        """
+        return get_object_or_404(Event, slug=self.kwargs["slug"])
+
+    def get_queryset(self):
+        """
+        Returns the ticket types of the event, cheapest first.
+
+        Returns:
+            QuerySet: A queryset of Ticket objects.
+        """
+        queryset = Ticket.objects.filter(event__slug=self.kwargs["slug"]).select_related("event")
+        return inventory.with_remaining(queryset).order_by("ticket_price")
+
+    def get_permissions(self):
+        """
+        Requires authentication to add ticket types.
+
+        Returns:
+            list: A list of permission instances.
+        """
+        if self.request.method == "POST":
+            self.permission_classes = [IsAuthenticated, EventHostOrReadOnly]
+        else:
+            self.permission_classes = [permissions.AllowAny]
+        return super().get_permissions()
+
+    def perform_create(self, serializer):
+        """
+        Adds the ticket type to the event after checking the user hosts it.
+
+        Args:
+            serializer (TicketSerializer): The serializer instance.
+        """
+        event = self.get_event()
+        self.check_object_permissions(self.request, event)
+        serializer.save(event=event)
+
+
+class HoldTicketView(CreateAPIView):
+    """
+    API endpoint to hold tickets of a ticket type for the current user.
+
+    The tickets are taken out of stock immediately and returned if the order
+    is not confirmed before its hold expires. For events with a waiting
+    room, the request must carry an admitted queue token in the
+    `X-Queue-Token` header.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for the hold request.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    serializer_class = TicketHoldSerializer
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CustomRenderer]
+
+    def create(self, request, *args, **kwargs):
+        """
+        Holds the requested number of tickets.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The held order.
+
+        Raises:
+            ValidationError: If the tickets cannot be held.
+            PermissionDenied: If the buyer has not been admitted from the
+                              event's waiting room.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ticket = get_object_or_404(Ticket.objects.select_related("event"), pk=self.kwargs["pk"])
+        queue_token = request.headers.get("X-Queue-Token")
+        queued = ticket.event.admission_rate is not None
+        if queued:
+            try:
+                waiting_room.admit(ticket.event, queue_token, request.user.pk)
+            except waiting_room.WaitingRoomError as exc:
+                raise PermissionDenied(str(exc))
+        try:
+            order = inventory.hold_tickets(ticket, request.user, serializer.validated_data["quantity"])
+        except inventory.InventoryError as exc:
+            if queued:
+                waiting_room.release(ticket.event, queue_token)
+            raise ValidationError({"detail": str(exc)})
+        return Response(TicketOrderSerializer(order).data, status=status.HTTP_201_CREATED)
+
+
+class WaitingRoomJoinView(GenericAPIView):
+    """
+    API endpoint to join the waiting room of an event.
+
+    Returns a queue token and the buyer's position. Joining never requires
+    authentication, so the crowd at an on-sale does not load user rows.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for the queue status.
+        authentication_classes (list): The authentication methods for this view.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    serializer_class = WaitingRoomStatusSerializer
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [CustomRenderer]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Adds the caller to the back of the event's queue.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The queue status, including the queue token.
+
+        Raises:
+            Http404: If the event does not exist.
+            ValidationError: If the event has no waiting room.
+        """
+        rate = waiting_room.get_admission_rate(self.kwargs["slug"])
+        if rate is None:
+            get_object_or_404(Event, slug=self.kwargs["slug"])
+            raise ValidationError({"detail": "This event has no waiting room"})
+        queued = waiting_room.join(self.kwargs["slug"], rate)
+        return Response(self.get_serializer(queued).data, status=status.HTTP_201_CREATED)
+
+
+class WaitingRoomStatusView(GenericAPIView):
+    """
+    API endpoint to poll a buyer's place in a waiting room.
+
+    The queue token is sent in the `X-Queue-Token` header. Polling only
+    reads the waiting room cache, never the database.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for the queue status.
+        authentication_classes (list): The authentication methods for this view.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    serializer_class = WaitingRoomStatusSerializer
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    renderer_classes = [CustomRenderer]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the queue status of the token's holder.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The queue status.
+
+        Raises:
+            ValidationError: If the queue token is not valid.
+        """
+        try:
+            queued = waiting_room.get_status(request.headers.get("X-Queue-Token"))
+        except waiting_room.InvalidQueueToken as exc:
+            raise ValidationError({"detail": str(exc)})
+        return Response(self.get_serializer(queued).data)
+
+
+class OrderActionView(GenericAPIView):
+    """
+    Base API endpoint for actions on one of the current user's orders.
+
+    Subclasses set `action_function` to the inventory function applied to
+    the order.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for TicketOrder objects.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+        action_function (callable): The inventory function to apply.
+    """
+    serializer_class = TicketOrderSerializer
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CustomRenderer]
+    action_function = None
+
+    def get_queryset(self):
+        """
+        Returns the orders of the current user.
+
+        Returns:
+            QuerySet: A queryset of TicketOrder objects.
+        """
+        return TicketOrder.objects.filter(buyer_id=self.request.user.pk)
+
+    def post(self, request, *args, **kwargs):
+        """
+        Applies the action to the order.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The updated order.
+
+        Raises:
+            ValidationError: If the order is not in a valid state.
+        """
+        order = self.get_object()
+        try:
+            order = type(self).action_function(order)
+        except inventory.InventoryError as exc:
+            raise ValidationError({"detail": str(exc)})
+        return Response(self.get_serializer(order).data)
+
+
+class ConfirmOrderView(OrderActionView):
+    """
+    API endpoint to confirm (purchase) a held order before it expires.
+    """
+    action_function = inventory.confirm_order
+
+
+class CancelOrderView(OrderActionView):
+    """
+    API endpoint to cancel a held order and release its tickets.
+    """
+    action_function = inventory.cancel_order
+
+
+class UserOrderListView(ListAPIView):
+    """
+    API endpoint to list the current user's ticket orders.
+
+    Attributes:
+        serializer_class (Serializer): The serializer for TicketOrder objects.
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+        pagination_class (Pagination): The pagination style for the list.
+    """
+    serializer_class = TicketOrderSerializer
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CustomRenderer]
+    pagination_class = CustomPagination
+
+    def get_queryset(self):
+        """
+        Returns the orders of the current user, newest first.
+
+        Returns:
+            QuerySet: A queryset of TicketOrder objects.
+        """
+        return TicketOrder.objects.filter(buyer_id=self.request.user.pk).order_by("-date_created")
@@ -6,7 +6,8 @@ class EventPortalConfig(AppConfig):
     Configuration for the 'event_portal' Django app.
 
     This class sets up the configuration for the event_portal app, such as
-    the default auto field for models and the app name.
+    the default auto field for models and the app name. It also imports the
+    app's signals when the app is ready.
 
     Attributes:
         default_auto_field (str): The default primary key type for models.
@@ -14,3 +15,13 @@ class EventPortalConfig(AppConfig):
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'event_portal'
+
+    def ready(self) -> None:
+        """
+        Imports the signals for the event_portal app.
+
+        This method is called by Django when the application is ready. It
+        imports the signals module to ensure that the signal handlers are
+        connected.
+        """
+        import event_portal.signals
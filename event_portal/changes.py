@@ -0,0 +1,122 @@
+"""
+Change feed of events and categories, for mirrors kept in sync incrementally.
+
+Every event, category and tombstone (the record left by a deletion) is
+positioned by `(last_updated, id)`. A feed page holds the changes after a
+watermark in that order, read with one indexed keyset query per table, and
+returns the watermark of its last change for the next request. Following
+the watermarks visits every change exactly once; an object changed several
+times between two requests is reported once, in its latest state.
+
+A write is stamped with `last_updated` before its transaction commits, so
+changes newer than `CHANGE_FEED_SETTLE_SECONDS` are held back until slower
+transactions stamped just before them have had time to commit.
+"""
+import heapq
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .api.pagination import decode_cursor, encode_cursor
+from .api.serializers import CategorySerializer, EventSerializer
+from .models import Category, Event, Tombstone
+
+
+def encode_watermark(last_updated, pk):
+    """
+    Encodes a feed position as an opaque token.
+
+    Args:
+        last_updated (datetime): The update time of the last change seen.
+        pk (UUID): The primary key of the last change seen.
+
+    Returns:
+        str: The watermark.
+    """
+    return encode_cursor({"t": last_updated.isoformat(), "id": pk.hex})
+
+
+def decode_watermark(token):
+    """
+    Decodes a watermark produced by `encode_watermark`.
+
+    Args:
+        token (str): The watermark.
+
+    Returns:
+        tuple: The update time and primary key of the position.
+
+    Raises:
+        ValueError: If the token is not a valid watermark.
+    """
+    payload = decode_cursor(token)
+    try:
+        last_updated = parse_datetime(payload["t"])
+        pk = uuid.UUID(payload["id"])
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError("Invalid watermark") from exc
+    if last_updated is None or timezone.is_naive(last_updated):
+        raise ValueError("Invalid watermark")
+    return last_updated, pk
+
+
+def _position(obj):
+    return obj.last_updated, obj.pk.hex
+
+
+def _after(queryset, position, horizon, limit):
+    queryset = queryset.filter(last_updated__lte=horizon)
+    if position is not None:
+        last_updated, pk = position
+        queryset = queryset.filter(Q(last_updated__gt=last_updated) | Q(last_updated=last_updated, pk__gt=pk))
+    return list(queryset.order_by("last_updated", "pk")[:limit])
+
+
+def _entry(obj):
+    if isinstance(obj, Tombstone):
+        return {
+            "kind": obj.kind, "id": obj.object_id, "deleted": True,
+            "last_updated": obj.last_updated, "data": {"slug": obj.slug},
+        }
+    if isinstance(obj, Event):
+        kind, data = "event", EventSerializer(obj).data
+    else:
+        kind, data = "category", CategorySerializer(obj).data
+    return {"kind": kind, "id": obj.pk, "deleted": False, "last_updated": obj.last_updated, "data": data}
+
+
+def changes_since(watermark=None, limit=100, now=None):
+    """
+    Returns the changes after a watermark.
+
+    Args:
+        watermark (str, optional): The watermark returned by the previous
+                                   request. Defaults to the beginning.
+        limit (int): The maximum number of changes to return.
+        now (datetime, optional): The current time.
+
+    Returns:
+        dict: The `changes`, oldest first, the `watermark` to pass to the
+              next request, and whether more changes are ready (`has_more`).
+
+    Raises:
+        ValueError: If the watermark is not valid.
+    """
+    position = decode_watermark(watermark) if watermark else None
+    horizon = (now or timezone.now()) - timedelta(seconds=settings.CHANGE_FEED_SETTLE_SECONDS)
+    sources = [
+        Event.objects.select_related("host").prefetch_related("category"),
+        Category.objects.all(),
+        Tombstone.objects.all(),
+    ]
+    merged = heapq.merge(*(_after(queryset, position, horizon, limit + 1) for queryset in sources), key=_position)
+    page = [obj for _, obj in zip(range(limit + 1), merged)]
+    has_more = len(page) > limit
+    page = page[:limit]
+    if page:
+        watermark = encode_watermark(page[-1].last_updated, page[-1].pk)
+    return {"changes": [_entry(obj) for obj in page], "watermark": watermark, "has_more": has_more}
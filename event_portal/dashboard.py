@@ -0,0 +1,123 @@
+"""
+Aggregates of a host's events for the host dashboard.
+
+Every figure is computed by the database with grouped aggregate queries,
+one per section, so building a dashboard costs the same four queries
+whatever the size of the host's portfolio. Dashboards are cached per host
+by `HostDashboardView` and invalidated through the host's cache tag when
+the host's events or tickets change.
+"""
+from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.db.models.functions import Trunc
+
+from .models import Event, Ticket
+
+# The periods the date histogram can be grouped by.
+INTERVALS = ("day", "week", "month", "year")
+
+UPCOMING = Q(expired=False)
+EXPIRED = Q(expired=True)
+
+
+def event_totals(events):
+    """
+    Counts the upcoming and expired events.
+
+    Args:
+        events (QuerySet): The host's events.
+
+    Returns:
+        dict: The `upcoming_count`, the `expired_count` and the
+              `next_start_date` of the upcoming events.
+    """
+    return events.aggregate(
+        upcoming_count=Count("pk", filter=UPCOMING),
+        expired_count=Count("pk", filter=EXPIRED),
+        next_start_date=Min("event_start_date", filter=UPCOMING),
+    )
+
+
+def events_by_category(events):
+    """
+    Counts the upcoming and expired events of each category. Events without
+    a category are counted under a null slug and name.
+
+    Args:
+        events (QuerySet): The host's events.
+
+    Returns:
+        list: The `slug`, `name`, `upcoming_count` and `expired_count` of
+              each category.
+    """
+    rows = events.order_by().values("category__slug", "category__name").annotate(
+        upcoming_count=Count("pk", filter=UPCOMING),
+        expired_count=Count("pk", filter=EXPIRED),
+    ).order_by("category__name")
+    return [
+        {"slug": row["category__slug"], "name": row["category__name"],
+         "upcoming_count": row["upcoming_count"], "expired_count": row["expired_count"]}
+        for row in rows
+    ]
+
+
+def start_date_histogram(events, interval="month"):
+    """
+    Counts the upcoming and expired events starting in each period.
+
+    Args:
+        events (QuerySet): The host's events.
+        interval (str): The period, one of `INTERVALS`.
+
+    Returns:
+        list: The first day of each period with events, as `period`, and
+              its `upcoming_count` and `expired_count`, oldest first.
+    """
+    return list(
+        events.order_by().annotate(period=Trunc("event_start_date", interval)).values("period").annotate(
+            upcoming_count=Count("pk", filter=UPCOMING),
+            expired_count=Count("pk", filter=EXPIRED),
+        ).order_by("period")
+    )
+
+
+def ticket_price_stats(host_id):
+    """
+    Summarizes the prices and capacity of each ticket type.
+
+    Args:
+        host_id (UUID): The host.
+
+    Returns:
+        list: The `ticket_type`, the number of `events` offering it, the
+              `min_price`, `max_price` and `average_price`, and the total
+              `capacity` of each ticket type.
+    """
+    rows = Ticket.objects.filter(event__host_id=host_id).values("ticket_type").annotate(
+        events=Count("event", distinct=True),
+        min_price=Min("ticket_price"),
+        max_price=Max("ticket_price"),
+        average_price=Avg("ticket_price"),
+        capacity=Sum("capacity"),
+    ).order_by("ticket_type")
+    return [dict(row, average_price=round(row["average_price"], 2)) for row in rows]
+
+
+def host_dashboard(host_id, interval="month"):
+    """
+    Builds the dashboard of a host.
+
+    Args:
+        host_id (UUID): The host.
+        interval (str): The period of the date histogram, one of `INTERVALS`.
+
+    Returns:
+        dict: The event `totals`, the events `by_category`, the
+              `start_dates` histogram and the `tickets` price statistics.
+    """
+    events = Event.objects.filter(host_id=host_id)
+    return {
+        "totals": event_totals(events),
+        "by_category": events_by_category(events),
+        "start_dates": start_date_histogram(events, interval),
+        "tickets": ticket_price_stats(host_id),
+    }
@@ -0,0 +1,93 @@
+"""
+Marks events whose end has passed as expired.
+
+The sweep walks the events that have not expired yet through a partial
+index on their end date and time, and flips them in batches. Each batch is
+a single conditional UPDATE (`... WHERE id IN (...) AND NOT expired`), so
+sweeps running concurrently never count or invalidate the same event twice
+and never block each other for long.
+"""
+import time
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .api import cache
+from .models import Event
+from .summaries import refresh_summaries
+
+
+def ended_events(now=None):
+    """
+    Returns the events that have ended but are not marked expired yet.
+
+    Args:
+        now (datetime, optional): The current time.
+
+    Returns:
+        QuerySet: A queryset of Event objects.
+    """
+    now = timezone.localtime(now)
+    return Event.objects.filter(expired=False).filter(
+        Q(event_end_date__lt=now.date())
+        | Q(event_end_date=now.date(), event_end_time__lte=now.time())
+    )
+
+
+def _invalidate(ids):
+    events = Event.objects.filter(pk__in=ids)
+    tags = [cache.event_tag(slug) for slug in events.values_list("slug", flat=True)]
+    categories = set(events.values_list("category__pk", "category__slug")) - {(None, None)}
+    tags += [cache.category_events_tag(slug) for _, slug in categories]
+    hosts = events.filter(host__isnull=False).values_list("host_id", flat=True).distinct()
+    tags += [cache.host_tag(host_id) for host_id in hosts]
+    refresh_summaries(pk for pk, _ in categories)
+    cache.invalidate(cache.EVENTS_TAG, *tags)
+
+
+def expire_events(now=None, batch_size=500):
+    """
+    Marks every event that has ended as expired.
+
+    Args:
+        now (datetime, optional): The current time.
+        batch_size (int): The number of events updated per query.
+
+    Returns:
+        int: The number of events this call marked expired.
+    """
+    now = now or timezone.now()
+    expired = 0
+    while True:
+        batch = list(ended_events(now).values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return expired
+        updated = Event.objects.filter(pk__in=batch, expired=False).update(expired=True, last_updated=now)
+        if updated:
+            _invalidate(batch)
+        expired += updated
+
+
+def run_sweeper(interval, batch_size=500, report=None, sweeps=None):
+    """
+    Runs the expiry sweep every `interval` seconds.
+
+    Args:
+        interval (float): The number of seconds between sweeps.
+        batch_size (int): The number of events updated per query.
+        report (callable, optional): Called with the number of events
+                                     expired and the sweep duration in
+                                     seconds after every sweep.
+        sweeps (int, optional): Stop after this many sweeps instead of
+                                running forever.
+    """
+    done = 0
+    while sweeps is None or done < sweeps:
+        started = time.monotonic()
+        expired = expire_events(batch_size=batch_size)
+        duration = time.monotonic() - started
+        if report:
+            report(expired, duration)
+        done += 1
+        if sweeps is None or done < sweeps:
+            time.sleep(max(interval - duration, 0))
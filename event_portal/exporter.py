@@ -0,0 +1,119 @@
+"""
+Streaming export of events as NDJSON or CSV.
+
+Events are read with `QuerySet.iterator(chunk_size=...)`, which uses a
+server-side cursor where the database supports one and prefetches the
+categories of each chunk, and each event is encoded as soon as it is read.
+Memory use therefore stays flat however many events are exported.
+
+Exports are ordered by `last_updated`. A partner keeping a copy up to date
+passes the `until` time of its previous export as `since`, and receives
+every event changed in between, including events that expired since.
+"""
+import csv
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_filters.utils import translate_validation
+from rest_framework.exceptions import ValidationError
+
+from .api.filters import EventFilter
+from .api.renderers import CustomRenderer
+from .api.serializers import EventSerializer
+from .importer import CSV_LIST_SEPARATOR
+from .models import Event
+from .search import get_search_backend
+
+FIELDS = EventSerializer.Meta.fields
+
+
+def filter_events(params, until=None):
+    """
+    Returns the events to export for a set of query parameters.
+
+    Accepts the `EventFilter` parameters, `search`, and `since`, an ISO
+    8601 time: only events updated after it are exported, and expired
+    events are included so that their expiry reaches the partner.
+
+    Args:
+        params (dict): The query parameters.
+        until (datetime, optional): Only export events updated up to this
+                                    time. Defaults to now.
+
+    Returns:
+        QuerySet: The events, oldest update first.
+
+    Raises:
+        ValidationError: If a parameter is not valid.
+    """
+    until = until or timezone.now()
+    queryset = Event.objects.filter(last_updated__lte=until)
+    since = params.get("since")
+    if since:
+        parsed = parse_datetime(since)
+        if parsed is None:
+            raise ValidationError({"since": ["Enter a valid ISO 8601 date and time."]})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        queryset = queryset.filter(last_updated__gt=parsed)
+    else:
+        queryset = queryset.filter(expired=False)
+    filterset = EventFilter(params, queryset=queryset)
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+    queryset = filterset.qs
+    terms = params.get("search", "").replace(",", " ").split()
+    if terms:
+        queryset = get_search_backend().search(queryset, terms)
+    return queryset.select_related("host").prefetch_related("category").order_by("last_updated", "pk")
+
+
+def _rows(queryset, chunk_size):
+    for event in queryset.iterator(chunk_size=chunk_size):
+        yield EventSerializer(event).data
+
+
+def export_ndjson(queryset, chunk_size=500):
+    """
+    Encodes events as newline-delimited JSON.
+
+    Args:
+        queryset (QuerySet): The events to export.
+        chunk_size (int): The number of events read from the database at once.
+
+    Yields:
+        str: One line of JSON per event.
+    """
+    encode = CustomRenderer.encoder.encode
+    for row in _rows(queryset, chunk_size):
+        yield encode(row) + "\n"
+
+
+class _Line:
+    def write(self, value):
+        return value
+
+
+def export_csv(queryset, chunk_size=500):
+    """
+    Encodes events as CSV with a header line. Categories are separated by
+    semicolons, as the importer expects.
+
+    Args:
+        queryset (QuerySet): The events to export.
+        chunk_size (int): The number of events read from the database at once.
+
+    Yields:
+        str: The header line, then one line per event.
+    """
+    writer = csv.writer(_Line())
+    yield writer.writerow(FIELDS)
+    for row in _rows(queryset, chunk_size):
+        row["category"] = CSV_LIST_SEPARATOR.join(str(pk) for pk in row["category"])
+        yield writer.writerow([row[field] for field in FIELDS])
+
+
+EXPORTERS = {
+    "ndjson": (export_ndjson, "application/x-ndjson"),
+    "csv": (export_csv, "text/csv"),
+}
@@ -0,0 +1,155 @@
+"""
+Distances and radius lookups over event coordinates.
+
+Radius lookups are answered in three steps so they stay index-backed on
+SQLite and Postgres alike, without a spatial extension:
+
+1. Every geocoded event stores the latitude band it falls in
+   (`geo_band`, bands of `GRID_DEGREES`). The bands and the longitude
+   range of the bounding box around the centre are matched against the
+   `(geo_band, longitude)` index, one range scan per band.
+2. The latitude range of the box drops the candidates of the edge bands
+   lying outside it.
+3. The exact great-circle distance, computed by the database, drops the
+   corners of the box.
+"""
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+# The mean radius of the Earth, in kilometres.
+EARTH_RADIUS_KM = 6371.0088
+
+# The height of a latitude band of the grid index, in degrees (about 55 km).
+GRID_DEGREES = 0.5
+
+# The largest radius a lookup may use, in kilometres.
+MAX_RADIUS_KM = 500
+
+
+def grid_band(latitude):
+    """
+    Returns the latitude band of the grid index a latitude falls in.
+
+    Args:
+        latitude (float): The latitude, or None.
+
+    Returns:
+        int: The band number, or None if the latitude is None.
+    """
+    if latitude is None:
+        return None
+    return math.floor(latitude / GRID_DEGREES)
+
+
+def distance_km(latitude, longitude, other_latitude, other_longitude):
+    """
+    Computes the great-circle distance between two points with the
+    haversine formula.
+
+    Args:
+        latitude (float): The latitude of the first point.
+        longitude (float): The longitude of the first point.
+        other_latitude (float): The latitude of the second point.
+        other_longitude (float): The longitude of the second point.
+
+    Returns:
+        float: The distance in kilometres.
+    """
+    lat1, lat2 = math.radians(latitude), math.radians(other_latitude)
+    half_dlat = (lat2 - lat1) / 2
+    half_dlng = math.radians(other_longitude - longitude) / 2
+    h = math.sin(half_dlat) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(half_dlng) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def bounding_box(latitude, longitude, radius):
+    """
+    Computes the box of latitudes and longitudes enclosing a circle.
+
+    Args:
+        latitude (float): The latitude of the centre.
+        longitude (float): The longitude of the centre.
+        radius (float): The radius in kilometres.
+
+    Returns:
+        tuple: The minimum and maximum latitude, and the minimum and
+               maximum longitude, or None for the longitudes when the
+               circle reaches a pole and spans every longitude. The
+               longitudes are not wrapped, so the minimum can be below
+               -180 and the maximum above 180.
+    """
+    delta = math.degrees(radius / EARTH_RADIUS_KM)
+    min_latitude, max_latitude = latitude - delta, latitude + delta
+    if min_latitude <= -90 or max_latitude >= 90:
+        return max(min_latitude, -90.0), min(max_latitude, 90.0), None, None
+    # The widest longitude span of the circle, at its tangent meridians.
+    spread = math.degrees(math.asin(math.sin(radius / EARTH_RADIUS_KM) / math.cos(math.radians(latitude))))
+    return min_latitude, max_latitude, longitude - spread, longitude + spread
+
+
+def prefilter(latitude, longitude, radius):
+    """
+    Builds the index-backed condition matching the events in the bounding
+    box of a circle.
+
+    Args:
+        latitude (float): The latitude of the centre.
+        longitude (float): The longitude of the centre.
+        radius (float): The radius in kilometres.
+
+    Returns:
+        Q: The condition on the grid band, longitude and latitude.
+    """
+    min_latitude, max_latitude, min_longitude, max_longitude = bounding_box(latitude, longitude, radius)
+    bands = list(range(grid_band(min_latitude), grid_band(max_latitude) + 1))
+    condition = Q(geo_band__in=bands)
+    if min_longitude is not None:
+        if min_longitude < -180:
+            longitudes = Q(longitude__gte=min_longitude + 360) | Q(longitude__lte=max_longitude)
+        elif max_longitude > 180:
+            longitudes = Q(longitude__gte=min_longitude) | Q(longitude__lte=max_longitude - 360)
+        else:
+            longitudes = Q(longitude__range=(min_longitude, max_longitude))
+        condition &= longitudes
+    return condition & Q(latitude__range=(min_latitude, max_latitude))
+
+
+def distance_expression(latitude, longitude):
+    """
+    Builds the database expression of an event's distance from a point,
+    with the haversine formula.
+
+    Args:
+        latitude (float): The latitude of the point.
+        longitude (float): The longitude of the point.
+
+    Returns:
+        Func: The distance in kilometres.
+    """
+    half_dlat = (Radians(F("latitude")) - Value(math.radians(latitude))) / Value(2.0)
+    half_dlng = (Radians(F("longitude")) - Value(math.radians(longitude))) / Value(2.0)
+    h = Power(Sin(half_dlat), 2) + Value(math.cos(math.radians(latitude))) * Cos(Radians(F("latitude"))) * Power(
+        Sin(half_dlng), 2
+    )
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Sqrt(h), output_field=FloatField())
+
+
+def events_near(queryset, latitude, longitude, radius):
+    """
+    Limits events to those within a radius of a point.
+
+    Args:
+        queryset (QuerySet): The events.
+        latitude (float): The latitude of the centre.
+        longitude (float): The longitude of the centre.
+        radius (float): The radius in kilometres.
+
+    Returns:
+        QuerySet: The events within the radius, annotated with their
+                  `distance` in kilometres.
+    """
+    return queryset.filter(prefilter(latitude, longitude, radius)).annotate(
+        distance=distance_expression(latitude, longitude)
+    ).filter(distance__lte=radius)
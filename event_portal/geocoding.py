@@ -0,0 +1,129 @@
+"""
+Offline geocoding of events against a gazetteer.
+
+Events get their `latitude` and `longitude` from a local gazetteer file,
+a CSV file mapping place names to coordinates, so geocoding never calls
+out to a geocoding service (`python manage.py geocode_events`). An event
+is matched on its `location` first, then on the parts of its `address`,
+last part first. Events whose location or address is edited through the
+API lose their coordinates until the next geocoding run.
+"""
+import csv
+
+from django.utils import timezone
+
+from .api import cache
+from .geo import grid_band
+from .models import Event
+
+
+def normalize(name):
+    """
+    Normalizes a place name for matching.
+
+    Args:
+        name (str): The place name.
+
+    Returns:
+        str: The name, casefolded, with runs of whitespace collapsed.
+    """
+    return " ".join(name.casefold().split())
+
+
+def load_gazetteer(lines):
+    """
+    Reads a gazetteer: a CSV file with `name`, `latitude` and `longitude`
+    columns.
+
+    Args:
+        lines (iterable): The lines of the file.
+
+    Returns:
+        dict: The coordinates of each normalized place name. The first
+              entry of a name wins.
+
+    Raises:
+        ValueError: If a column is missing or a row holds invalid coordinates.
+    """
+    reader = csv.DictReader(lines)
+    missing = {"name", "latitude", "longitude"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"The gazetteer is missing the columns: {', '.join(sorted(missing))}.")
+    places = {}
+    for number, row in enumerate(reader, start=2):
+        try:
+            latitude, longitude = float(row["latitude"]), float(row["longitude"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Line {number} of the gazetteer has invalid coordinates.")
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Line {number} of the gazetteer has out of range coordinates.")
+        places.setdefault(normalize(row["name"]), (latitude, longitude))
+    return places
+
+
+def geocode(location, address, places):
+    """
+    Finds the coordinates of an event in a gazetteer.
+
+    Args:
+        location (str): The event location.
+        address (str): The event address, or None.
+        places (dict): The gazetteer, as read by `load_gazetteer`.
+
+    Returns:
+        tuple: The latitude and longitude, or None if no name matches.
+    """
+    candidates = [location] + list(reversed((address or "").split(",")))
+    for candidate in candidates:
+        coordinates = places.get(normalize(candidate))
+        if coordinates is not None:
+            return coordinates
+    return None
+
+
+def _invalidate(events):
+    tags = [cache.EVENTS_TAG] + [cache.event_tag(event.slug) for event in events]
+    categories = Event.category.through.objects.filter(event__in=events).values_list("category__slug", flat=True)
+    tags += [cache.category_events_tag(slug) for slug in set(categories)]
+    cache.invalidate(*tags)
+
+
+def geocode_events(places, events=None, batch_size=500):
+    """
+    Sets the coordinates of events from a gazetteer.
+
+    Events no gazetteer entry matches keep their coordinates. The rows are
+    written with `bulk_update`, which skips signals, so their last update
+    time is set and the cached event responses are invalidated here.
+
+    Args:
+        places (dict): The gazetteer, as read by `load_gazetteer`.
+        events (QuerySet, optional): The events to geocode. Defaults to the
+                                     events without coordinates.
+        batch_size (int): The number of events read and written at once.
+
+    Returns:
+        tuple: The number of events geocoded and of events left unmatched.
+    """
+    if events is None:
+        events = Event.objects.filter(latitude__isnull=True)
+    events = events.order_by("pk").only("pk", "slug", "location", "address", "latitude", "longitude", "geo_band")
+    geocoded, unmatched, last = 0, 0, None
+    while True:
+        batch = list((events.filter(pk__gt=last) if last is not None else events)[:batch_size])
+        if not batch:
+            return geocoded, unmatched
+        last = batch[-1].pk
+        changed, now = [], timezone.now()
+        for event in batch:
+            coordinates = geocode(event.location, event.address, places)
+            if coordinates is None:
+                unmatched += 1
+            elif coordinates != (event.latitude, event.longitude):
+                event.latitude, event.longitude = coordinates
+                event.geo_band, event.last_updated = grid_band(event.latitude), now
+                changed.append(event)
+        if changed:
+            Event.objects.bulk_update(changed, ["latitude", "longitude", "geo_band", "last_updated"])
+            _invalidate(changed)
+            geocoded += len(changed)
@@ -0,0 +1,203 @@
+"""
+Bulk import of events from NDJSON or CSV.
+
+Rows are read lazily from the input and processed in chunks. Each row is
+validated with `EventImportSerializer`; the checks that would cost a query
+per row (category lookups, title and slug uniqueness) run once per chunk,
+and the valid rows of a chunk are written with one `bulk_create` for the
+events and one for their category links. Invalid rows are reported with
+their row number and never stop the rest of the import.
+
+`bulk_create` skips `Event.save` and the model signals, so the importer
+computes slugs and the expired flag itself, and refreshes the search
+documents, category summaries and cached responses once per chunk.
+"""
+import csv
+import json
+import uuid
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+from .api import cache
+from .api.serializers import EventImportSerializer
+from .models import Category, Event
+from .search import index_events
+from .summaries import refresh_summaries
+
+CSV_LIST_SEPARATOR = ";"
+
+
+class RowError(Exception):
+    """
+    Raised for a row that cannot be read from the input.
+    """
+
+
+def read_ndjson(lines):
+    """
+    Reads one JSON object per line, skipping blank lines.
+
+    Args:
+        lines (iterable): The lines of the input, as text.
+
+    Yields:
+        dict: Each row, or a RowError for a line that is not a JSON object.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield RowError(f"Invalid JSON: {exc}")
+            continue
+        yield row if isinstance(row, dict) else RowError("Each line must be a JSON object")
+
+
+def read_csv(lines):
+    """
+    Reads rows from CSV with a header line. Empty cells are left out, and
+    the categories of a row are separated by semicolons.
+
+    Args:
+        lines (iterable): The lines of the input, as text.
+
+    Yields:
+        dict: Each row.
+    """
+    for row in csv.DictReader(lines):
+        row = {key: value for key, value in row.items() if key and value not in (None, "")}
+        if "category" in row:
+            row["category"] = [name.strip() for name in row["category"].split(CSV_LIST_SEPARATOR) if name.strip()]
+        yield row
+
+
+def _resolve_categories(references):
+    ids, names = set(), set()
+    for reference in references:
+        try:
+            ids.add(uuid.UUID(reference))
+        except ValueError:
+            names.add(reference)
+    resolved = {}
+    for category in Category.objects.filter(Q(pk__in=ids) | Q(name__in=names) | Q(slug__in=names)):
+        resolved[str(category.pk)] = resolved[category.name] = resolved[category.slug] = category.pk
+    return resolved
+
+
+def _validate_chunk(rows, errors):
+    valid = []
+    for number, row in rows:
+        if isinstance(row, RowError):
+            errors.append({"row": number, "errors": {"detail": [str(row)]}})
+            continue
+        serializer = EventImportSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((number, serializer.validated_data))
+        else:
+            errors.append({"row": number, "errors": serializer.errors})
+    if not valid:
+        return []
+
+    categories = _resolve_categories({ref for _, data in valid for ref in data["category"]})
+    titles = {data["title"] for _, data in valid}
+    slugs = {slugify(title) for title in titles}
+    taken = set()
+    for title, slug in Event.objects.filter(Q(title__in=titles) | Q(slug__in=slugs)).values_list("title", "slug"):
+        taken.update((title, slug))
+
+    accepted = []
+    for number, data in valid:
+        slug = slugify(data["title"])
+        unknown = [ref for ref in data["category"] if ref not in categories]
+        if unknown:
+            errors.append({"row": number, "errors": {"category": [f"Unknown category: {ref}" for ref in unknown]}})
+        elif data["title"] in taken or slug in taken:
+            errors.append({"row": number, "errors": {"title": ["An event with this title already exists."]}})
+        else:
+            taken.update((data["title"], slug))
+            accepted.append((number, data, slug, {categories[ref] for ref in data["category"]}))
+    return accepted
+
+
+def _build(data, slug, category_ids, host_id):
+    fields = {key: value for key, value in data.items() if key != "category"}
+    event = Event(slug=slug, host_id=host_id, **fields)
+    event.expired = event.has_ended()
+    event._category_ids = category_ids
+    return event
+
+
+def _write(rows, host_id):
+    events = [_build(data, slug, category_ids, host_id) for _, data, slug, category_ids in rows]
+    Event.objects.bulk_create(events)
+    Link = Event.category.through
+    Link.objects.bulk_create([
+        Link(event_id=event.pk, category_id=category_id)
+        for event in events for category_id in event._category_ids
+    ])
+    return events
+
+
+def _write_chunk(rows, host_id, errors):
+    try:
+        with transaction.atomic():
+            return _write(rows, host_id)
+    except IntegrityError:
+        # A concurrent import or create took one of the titles: retry the
+        # rows one at a time so only the conflicting ones fail.
+        pass
+    events = []
+    for row in rows:
+        try:
+            with transaction.atomic():
+                events += _write([row], host_id)
+        except IntegrityError:
+            errors.append({"row": row[0], "errors": {"title": ["An event with this title already exists."]}})
+    return events
+
+
+def _refresh(events):
+    index_events(events)
+    category_ids = {category_id for event in events for category_id in event._category_ids}
+    refresh_summaries(category_ids)
+    tags = [cache.EVENTS_TAG] + [cache.event_tag(event.slug) for event in events]
+    tags += [cache.host_tag(host_id) for host_id in {event.host_id for event in events}]
+    tags += [
+        cache.category_events_tag(slug)
+        for slug in Category.objects.filter(pk__in=category_ids).values_list("slug", flat=True)
+    ]
+    cache.invalidate(*tags)
+
+
+def import_events(rows, host, chunk_size=500):
+    """
+    Imports events in chunks, reporting invalid rows instead of failing.
+
+    Args:
+        rows (iterable): The rows to import, as dicts (or RowErrors for
+                         rows that could not be read).
+        host (CustomUser): The user hosting the imported events.
+        chunk_size (int): The number of rows validated and written at once.
+
+    Returns:
+        dict: The number of events `created` and the `errors` of every
+              rejected row, numbered from 1.
+    """
+    created, errors = 0, []
+    numbered = enumerate(rows, start=1)
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return {"created": created, "errors": sorted(errors, key=lambda error: error["row"])}
+        accepted = _validate_chunk(chunk, errors)
+        if not accepted:
+            continue
+        events = _write_chunk(accepted, host.pk, errors)
+        created += len(events)
+        if events:
+            _refresh(events)
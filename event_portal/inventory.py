@@ -0,0 +1,333 @@
+"""
+Ticket inventory and order processing.
+
+Stock is never read, modified and written back. Every change to
+`Ticket.available` is a single conditional UPDATE such as
+`SET available = available - 2 WHERE id = ... AND available >= 2`, which
+the database applies atomically, so any number of concurrent buyers can
+never take more tickets than exist. Order state transitions use the same
+pattern on `TicketOrder.status`, so a hold cannot be both confirmed and
+expired.
+
+The stock of a hot ticket type can be sharded over several
+`TicketInventoryShard` rows. Buyers then decrement a random shard, so
+concurrent purchases touch different rows, and only fall back to locking
+every shard of the ticket (to rebalance the stock) when the shards they try
+have run dry but the ticket type as a whole has not.
+"""
+import random
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Ticket, TicketInventoryShard, TicketOrder
+
+
+class InventoryError(Exception):
+    """
+    Base class for errors raised while allocating tickets.
+    """
+
+
+class SoldOut(InventoryError):
+    """
+    Raised when not enough tickets are available for a hold.
+    """
+
+
+class EventEnded(InventoryError):
+    """
+    Raised when holding tickets for an event that has expired.
+    """
+
+
+class HoldExpired(InventoryError):
+    """
+    Raised when confirming an order whose hold has expired.
+    """
+
+
+class InvalidOrderState(InventoryError):
+    """
+    Raised when an order is not in a state that allows the operation.
+    """
+
+
+def allocate(ticket, quantity):
+    """
+    Atomically takes tickets out of stock if enough are available.
+
+    Args:
+        ticket (Ticket): The ticket type.
+        quantity (int): The number of tickets to take.
+
+    Returns:
+        bool: True if the tickets were taken, False if stock was too low.
+    """
+    if ticket.shard_count:
+        return _allocate_from_shards(ticket, quantity)
+    return Ticket.objects.filter(pk=ticket.pk, available__gte=quantity).update(
+        available=F("available") - quantity
+    ) == 1
+
+
+def _allocate_from_shards(ticket, quantity):
+    shards = TicketInventoryShard.objects.filter(ticket_id=ticket.pk)
+    for index in random.sample(range(ticket.shard_count), min(settings.TICKET_SHARD_ATTEMPTS, ticket.shard_count)):
+        if shards.filter(index=index, available__gte=quantity).update(
+            available=F("available") - quantity
+        ):
+            return True
+    return _rebalance_and_allocate(ticket, quantity)
+
+
+def _rebalance_and_allocate(ticket, quantity):
+    # A sold out ticket type is answered from an unlocked read, so buyers
+    # arriving after the sale ends do not queue on the shard locks.
+    shards = TicketInventoryShard.objects.filter(ticket_id=ticket.pk)
+    if (shards.aggregate(total=Sum("available"))["total"] or 0) < quantity:
+        return False
+    with transaction.atomic():
+        shards = list(
+            TicketInventoryShard.objects.select_for_update()
+            .filter(ticket_id=ticket.pk).order_by("index")
+        )
+        total = sum(shard.available for shard in shards)
+        if not shards or total < quantity:
+            return False
+        share, extra = divmod(total - quantity, len(shards))
+        for shard in shards:
+            shard.available = share + (1 if shard.index < extra else 0)
+        TicketInventoryShard.objects.bulk_update(shards, ["available"])
+    return True
+
+
+def restock(ticket_id, quantity):
+    """
+    Atomically returns tickets to stock.
+
+    For a sharded ticket type the tickets go back to a random shard.
+
+    Args:
+        ticket_id (UUID): The primary key of the ticket type.
+        quantity (int): The number of tickets to return.
+    """
+    shard_count = Ticket.objects.filter(pk=ticket_id).values_list("shard_count", flat=True).first()
+    if shard_count:
+        TicketInventoryShard.objects.filter(
+            ticket_id=ticket_id, index=random.randrange(shard_count)
+        ).update(available=F("available") + quantity)
+    else:
+        Ticket.objects.filter(pk=ticket_id).update(available=F("available") + quantity)
+
+
+def shard_inventory(ticket, shard_count):
+    """
+    Redistributes the remaining stock of a ticket type over a number of
+    shards, or back into `Ticket.available` when `shard_count` is 0.
+
+    This locks the ticket and its shards while it runs and is meant to be
+    used before an event goes on sale, not during a sale.
+
+    Args:
+        ticket (Ticket): The ticket type.
+        shard_count (int): The number of shards to use.
+
+    Returns:
+        Ticket: The updated ticket.
+    """
+    with transaction.atomic():
+        ticket = Ticket.objects.select_for_update().get(pk=ticket.pk)
+        shards = TicketInventoryShard.objects.select_for_update().filter(ticket=ticket)
+        total = ticket.available + sum(shard.available for shard in shards)
+        shards.delete()
+        if shard_count:
+            share, extra = divmod(total, shard_count)
+            TicketInventoryShard.objects.bulk_create([
+                TicketInventoryShard(ticket=ticket, index=index, available=share + (1 if index < extra else 0))
+                for index in range(shard_count)
+            ])
+            ticket.available = 0
+        else:
+            ticket.available = total
+        ticket.shard_count = shard_count
+        ticket.save(update_fields=["available", "shard_count", "last_updated"])
+    return ticket
+
+
+def with_remaining(queryset):
+    """
+    Annotates a ticket queryset with `remaining`, the stock left across the
+    ticket and all of its shards, in a single query.
+
+    Args:
+        queryset (QuerySet): A queryset of tickets.
+
+    Returns:
+        QuerySet: The annotated queryset.
+    """
+    shard_stock = (
+        TicketInventoryShard.objects.filter(ticket=OuterRef("pk"))
+        .values("ticket").annotate(total=Sum("available")).values("total")
+    )
+    return queryset.annotate(
+        remaining=F("available") + Coalesce(Subquery(shard_stock, output_field=IntegerField()), 0)
+    )
+
+
+def remaining_tickets(ticket):
+    """
+    Returns the stock left for a ticket type.
+
+    Args:
+        ticket (Ticket): The ticket type.
+
+    Returns:
+        int: The number of tickets neither sold nor held.
+    """
+    return with_remaining(Ticket.objects.filter(pk=ticket.pk)).values_list("remaining", flat=True).get()
+
+
+def hold_tickets(ticket, buyer, quantity):
+    """
+    Reserves tickets for a buyer until the hold expires.
+
+    If stock is too low, expired holds on the ticket are released first and
+    the allocation is retried once, so stock returns even if the periodic
+    sweep has not run yet.
+
+    Args:
+        ticket (Ticket): The ticket type to reserve.
+        buyer (CustomUser): The user reserving the tickets.
+        quantity (int): The number of tickets to reserve.
+
+    Returns:
+        TicketOrder: The held order.
+
+    Raises:
+        EventEnded: If the event has expired.
+        SoldOut: If not enough tickets are available.
+        InventoryError: If the quantity is not allowed.
+    """
+    if ticket.event.expired:
+        raise EventEnded("This event has ended")
+    if quantity < 1 or quantity > settings.TICKET_MAX_PER_ORDER:
+        raise InventoryError(
+            f"quantity must be between 1 and {settings.TICKET_MAX_PER_ORDER}"
+        )
+    order = _hold(ticket, buyer, quantity)
+    if order is None and release_expired_holds(ticket=ticket):
+        order = _hold(ticket, buyer, quantity)
+    if order is None:
+        raise SoldOut("Not enough tickets available")
+    return order
+
+
+def _hold(ticket, buyer, quantity):
+    with transaction.atomic():
+        if not allocate(ticket, quantity):
+            return None
+        return TicketOrder.objects.create(
+            ticket=ticket, buyer_id=buyer.pk, quantity=quantity,
+            unit_price=ticket.ticket_price, status=TicketOrder.HELD,
+            expires_at=timezone.now() + settings.TICKET_HOLD_DURATION,
+        )
+
+
+def confirm_order(order):
+    """
+    Completes the purchase of a held order.
+
+    Args:
+        order (TicketOrder): The order to confirm.
+
+    Returns:
+        TicketOrder: The confirmed order.
+
+    Raises:
+        HoldExpired: If the hold expired before it was confirmed.
+        InvalidOrderState: If the order is not held.
+    """
+    confirmed = TicketOrder.objects.filter(
+        pk=order.pk, status=TicketOrder.HELD, expires_at__gt=timezone.now()
+    ).update(status=TicketOrder.CONFIRMED, last_updated=timezone.now())
+    order.refresh_from_db()
+    if confirmed:
+        return order
+    if order.status == TicketOrder.HELD:
+        _end_hold(order, TicketOrder.EXPIRED)
+        order.refresh_from_db()
+    if order.status == TicketOrder.EXPIRED:
+        raise HoldExpired("This order's hold has expired")
+    raise InvalidOrderState(f"Cannot confirm an order that is {order.status}")
+
+
+def cancel_order(order):
+    """
+    Cancels a held order and returns its tickets to stock.
+
+    Args:
+        order (TicketOrder): The order to cancel.
+
+    Returns:
+        TicketOrder: The cancelled order.
+
+    Raises:
+        InvalidOrderState: If the order is not held.
+    """
+    cancelled = _end_hold(order, TicketOrder.CANCELLED)
+    order.refresh_from_db()
+    if not cancelled:
+        raise InvalidOrderState(f"Cannot cancel an order that is {order.status}")
+    return order
+
+
+def _end_hold(order, status):
+    with transaction.atomic():
+        ended = TicketOrder.objects.filter(pk=order.pk, status=TicketOrder.HELD).update(
+            status=status, last_updated=timezone.now()
+        )
+        if ended:
+            restock(order.ticket_id, order.quantity)
+    return bool(ended)
+
+
+def release_expired_holds(ticket=None, now=None, batch_size=500):
+    """
+    Expires held orders past their deadline and returns their stock.
+
+    Each order is moved from held to expired with a conditional UPDATE, so
+    an order confirmed concurrently is never expired, and running several
+    sweeps at once never returns the same tickets twice.
+
+    Args:
+        ticket (Ticket, optional): Only release holds on this ticket type.
+        now (datetime, optional): The current time.
+        batch_size (int): The number of orders processed per batch.
+
+    Returns:
+        int: The number of tickets returned to stock.
+    """
+    now = now or timezone.now()
+    expired = TicketOrder.objects.filter(status=TicketOrder.HELD, expires_at__lte=now)
+    if ticket is not None:
+        expired = expired.filter(ticket=ticket)
+    released = 0
+    while True:
+        batch = list(expired.values_list("pk", "ticket_id", "quantity")[:batch_size])
+        if not batch:
+            return released
+        restocked = defaultdict(int)
+        with transaction.atomic():
+            for pk, ticket_id, quantity in batch:
+                if TicketOrder.objects.filter(pk=pk, status=TicketOrder.HELD).update(
+                    status=TicketOrder.EXPIRED, last_updated=now
+                ):
+                    restocked[ticket_id] += quantity
+            for ticket_id, quantity in restocked.items():
+                restock(ticket_id, quantity)
+        released += sum(restocked.values())
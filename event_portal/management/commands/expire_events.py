@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from event_portal.expiry import run_sweeper
+
+
+class Command(BaseCommand):
+    """
+    Marks events whose end has passed as expired, so the event lists can
+    filter on the indexed `expired` flag.
+
+    Run it once from cron, or leave it running with `--interval`. It is safe
+    to run several instances at once.
+    """
+    help = "Marks ended events as expired, once or every --interval seconds."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Number of events updated per query.")
+        parser.add_argument("--interval", type=float, default=None,
+                            help="Keep sweeping every INTERVAL seconds instead of sweeping once.")
+
+    def handle(self, *args, **options):
+        """
+        Runs the expiry sweep and reports the events expired and the time taken.
+        """
+        run_sweeper(
+            options["interval"] or 0, batch_size=options["batch_size"], report=self.report,
+            sweeps=None if options["interval"] else 1,
+        )
+
+    def report(self, expired, duration):
+        """
+        Writes the result of one sweep.
+
+        Args:
+            expired (int): The number of events marked expired.
+            duration (float): How long the sweep took, in seconds.
+        """
+        self.stdout.write(self.style.SUCCESS(f"Marked {expired} events expired in {duration * 1000:.1f} ms."))
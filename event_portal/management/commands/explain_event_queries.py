@@ -0,0 +1,87 @@
+import re
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from event_portal.api.filters import EventFilter
+from event_portal.api.views import CategoryEventView, EventAPIViewset
+
+# Plan fragments showing that the database reads a table through an index,
+# and fragments showing a full scan of the event table.
+INDEX_PATTERNS = {
+    "sqlite": re.compile(r"USING (COVERING )?INDEX|USING INTEGER PRIMARY KEY"),
+    "postgresql": re.compile(r"Index Scan|Index Only Scan|Bitmap Index Scan"),
+}
+FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"SCAN event_portal_event\b(?! USING)"),
+    "postgresql": re.compile(r"Seq Scan on event_portal_event\b"),
+}
+
+
+def event_list_queries():
+    """
+    Builds the querysets run by the event list endpoints.
+
+    Returns:
+        list: (name, QuerySet) pairs.
+    """
+    events = EventAPIViewset(action="list").get_queryset()
+    category_view = CategoryEventView()
+    category_view.kwargs = {"slug": "music"}
+    return [
+        ("upcoming events", events),
+        ("upcoming events by start date", events.order_by("event_start_date")),
+        ("filter by location", EventFilter({"location": "Lagos"}, queryset=events).qs),
+        ("filter by host email", EventFilter({"host__email": "host@example.com"}, queryset=events).qs),
+        ("filter by category name", EventFilter({"category__name": "Music"}, queryset=events).qs),
+        ("filter by start date range", EventFilter(
+            {"event_start_date_after": "2030-01-01", "event_start_date_before": "2030-12-31"}, queryset=events
+        ).qs),
+        ("events near a point", EventFilter({"near": "6.5244,3.3792", "radius": "25"}, queryset=events).qs),
+        ("events by category", category_view.get_queryset()),
+    ]
+
+
+class Command(BaseCommand):
+    """
+    Runs EXPLAIN on the queries behind the event list and filter endpoints
+    and reports whether each one reads the event table through an index.
+
+    Query plans depend on the data and statistics of the database they run
+    on, so this is most useful against a copy of production data.
+    """
+    help = "Explains the event list queries and reports which ones use an index."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--plans", action="store_true", help="Print the full query plans.")
+
+    def handle(self, *args, **options):
+        """
+        Explains every event list query and prints a report.
+        """
+        index_pattern = INDEX_PATTERNS.get(connection.vendor)
+        scan_pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if index_pattern is None:
+            self.stderr.write(f"Plans cannot be checked on {connection.vendor}; printing them instead.")
+            options["plans"] = True
+        full_scans = 0
+        for name, queryset in event_list_queries():
+            plan = queryset.explain()
+            if index_pattern is None:
+                verdict = "?"
+            elif (scan_pattern and scan_pattern.search(plan)) or not index_pattern.search(plan):
+                verdict = self.style.WARNING("full scan")
+                full_scans += 1
+            else:
+                verdict = self.style.SUCCESS("index")
+            self.stdout.write(f"{name}: {verdict}")
+            if options["plans"]:
+                self.stdout.write("    " + plan.replace("\n", "\n    "))
+        if full_scans:
+            self.stdout.write(self.style.WARNING(f"{full_scans} queries scan the whole event table."))
@@ -0,0 +1,62 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from event_portal.exporter import EXPORTERS, filter_events
+
+
+class Command(BaseCommand):
+    """
+    Exports events as NDJSON or CSV, streaming them from the database.
+
+    Takes the same filters as the export endpoint, as `--filter name=value`
+    pairs, and `--since` for an incremental export. The time the export
+    covers up to is printed on stderr, to pass as `--since` next time.
+    """
+    help = "Streams events to a file or stdout as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--output", "-o", default="-", help="The file to write (default: stdout).")
+        parser.add_argument("--format", choices=sorted(EXPORTERS), default="ndjson", help="The export format.")
+        parser.add_argument("--since", help="Only export events updated after this ISO 8601 time.")
+        parser.add_argument("--search", help="Only export events matching these search terms.")
+        parser.add_argument("--filter", action="append", default=[], metavar="NAME=VALUE",
+                            help="An event list filter, e.g. location=Lagos. May be repeated.")
+        parser.add_argument("--chunk-size", type=int, default=500,
+                            help="Number of events read from the database at once.")
+
+    def handle(self, *args, **options):
+        """
+        Writes the matching events.
+        """
+        params = {}
+        for pair in options["filter"]:
+            name, sep, value = pair.partition("=")
+            if not sep:
+                raise CommandError(f"Filters are given as NAME=VALUE, not {pair!r}.")
+            params[name] = value
+        for name in ("since", "search"):
+            if options[name]:
+                params[name] = options[name]
+        until = timezone.now()
+        try:
+            queryset = filter_events(params, until=until)
+        except ValidationError as exc:
+            raise CommandError(exc.detail)
+        export, _ = EXPORTERS[options["format"]]
+        output = sys.stdout if options["output"] == "-" else open(options["output"], "w", newline="", encoding="utf-8")
+        try:
+            for line in export(queryset, options["chunk_size"]):
+                output.write(line)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        self.stderr.write(f"Exported events updated up to {until.isoformat()}.")
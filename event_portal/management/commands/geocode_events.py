@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from event_portal.geocoding import geocode_events, load_gazetteer
+from event_portal.models import Event
+
+
+class Command(BaseCommand):
+    """
+    Sets the coordinates of events from a local gazetteer file, so radius
+    lookups (`?near=`) can find them.
+
+    The gazetteer is a CSV file with `name`, `latitude` and `longitude`
+    columns. By default only events without coordinates are geocoded; run
+    it after imports and periodically to pick up edited events.
+    """
+    help = "Geocodes events against a CSV gazetteer of place names and coordinates."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("gazetteer", help="The CSV file with name, latitude and longitude columns.")
+        parser.add_argument("--all", action="store_true",
+                            help="Geocode every event again, not only those without coordinates.")
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Number of events read and written at once.")
+
+    def handle(self, *args, **options):
+        """
+        Geocodes the events and reports the events geocoded and left unmatched.
+        """
+        try:
+            with open(options["gazetteer"], newline="", encoding="utf-8") as lines:
+                places = load_gazetteer(lines)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+        events = Event.objects.all() if options["all"] else None
+        geocoded, unmatched = geocode_events(places, events, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Geocoded {geocoded} events, {unmatched} events matched no place."
+        ))
@@ -0,0 +1,51 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from event_portal.importer import import_events, read_csv, read_ndjson
+
+READERS = {".csv": read_csv, ".ndjson": read_ndjson, ".jsonl": read_ndjson}
+
+
+class Command(BaseCommand):
+    """
+    Imports events from an NDJSON or CSV file for a host.
+
+    The file is read row by row and written in chunks; rows that fail
+    validation are reported and skipped.
+    """
+    help = "Bulk imports events from an NDJSON (.ndjson, .jsonl) or CSV (.csv) file."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("path", help="The file to import.")
+        parser.add_argument("--host", required=True, help="The email of the user hosting the events.")
+        parser.add_argument("--format", choices=["csv", "ndjson"], default=None,
+                            help="The file format (default: from the file extension).")
+        parser.add_argument("--chunk-size", type=int, default=500,
+                            help="Number of rows validated and written at once.")
+
+    def handle(self, *args, **options):
+        """
+        Imports the file and reports the events created and the rejected rows.
+        """
+        extension = f".{options['format']}" if options["format"] else os.path.splitext(options["path"])[1].lower()
+        if extension not in READERS:
+            raise CommandError("Cannot tell the file format; pass --format csv or --format ndjson.")
+        try:
+            host = get_user_model().objects.get(email=options["host"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user with the email {options['host']}.")
+        with open(options["path"], newline="", encoding="utf-8") as lines:
+            result = import_events(READERS[extension](lines), host, chunk_size=options["chunk_size"])
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} events, rejected {len(result['errors'])} rows."
+        ))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from event_portal.api import cache
+from event_portal.models import Category, Event
+from event_portal.search import index_events
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the search document of every event.
+
+    Useful after loading data with methods that bypass model signals, such
+    as `QuerySet.update()` or raw SQL.
+    """
+    help = "Rebuilds the full-text search documents of all events."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Number of events indexed per batch.")
+
+    def handle(self, *args, **options):
+        """
+        Indexes all events in batches, then invalidates cached event lists
+        since their search results may have changed.
+        """
+        batch_size = options["batch_size"]
+        batch, total = [], 0
+        for pk in Event.objects.values_list("pk", flat=True).iterator(chunk_size=batch_size):
+            batch.append(pk)
+            if len(batch) == batch_size:
+                index_events(batch)
+                total += len(batch)
+                batch = []
+        index_events(batch)
+        total += len(batch)
+        cache.invalidate(cache.EVENTS_TAG, *[
+            cache.category_events_tag(slug)
+            for slug in Category.objects.values_list("slug", flat=True)
+        ])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} events."))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from event_portal.api import cache
+from event_portal.summaries import refresh_summaries
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the upcoming event summary of every category, correcting
+    any drift left by concurrent writes.
+
+    Intended to be run periodically, for example every hour from cron.
+    """
+    help = "Recomputes the upcoming event count and next start date of every category."
+
+    def handle(self, *args, **options):
+        """
+        Refreshes every summary and reports the number of summaries corrected.
+        """
+        changed = refresh_summaries()
+        if changed:
+            cache.invalidate(cache.CATEGORIES_TAG)
+        self.stdout.write(self.style.SUCCESS(f"Corrected {changed} category summaries."))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from event_portal.inventory import release_expired_holds
+
+
+class Command(BaseCommand):
+    """
+    Expires unconfirmed ticket holds and returns their tickets to stock.
+
+    Intended to be run periodically, for example every minute from cron.
+    It is safe to run several instances at once.
+    """
+    help = "Expires ticket holds past their deadline and restocks their tickets."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Number of orders expired per transaction.")
+
+    def handle(self, *args, **options):
+        """
+        Releases expired holds and reports the number of tickets restocked.
+        """
+        released = release_expired_holds(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Returned {released} tickets to stock."))
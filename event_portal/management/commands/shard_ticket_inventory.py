@@ -0,0 +1,42 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from event_portal.inventory import remaining_tickets, shard_inventory
+from event_portal.models import Ticket
+
+
+class Command(BaseCommand):
+    """
+    Spreads the remaining stock of a ticket type over several shard rows.
+
+    Run this before a popular event goes on sale so concurrent buyers
+    decrement different rows. Passing `--shards 0` moves the stock back
+    into the ticket row.
+    """
+    help = "Shards the remaining stock of a ticket type for high-contention sales."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("ticket_id", help="The ID of the ticket type.")
+        parser.add_argument("--shards", type=int, default=8,
+                            help="Number of shards to spread the stock over.")
+
+    def handle(self, *args, **options):
+        """
+        Shards the ticket's stock and reports the result.
+        """
+        try:
+            ticket = Ticket.objects.get(pk=options["ticket_id"])
+        except (Ticket.DoesNotExist, ValidationError):
+            raise CommandError(f"Ticket {options['ticket_id']} does not exist")
+        if options["shards"] < 0:
+            raise CommandError("--shards cannot be negative")
+        ticket = shard_inventory(ticket, options["shards"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{remaining_tickets(ticket)} tickets spread over {ticket.shard_count} shards."
+        ))
@@ -0,0 +1,109 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+SEARCH_INDEX_SQL = {
+    "sqlite": {
+        "create": [
+            """
+            CREATE VIRTUAL TABLE event_portal_eventsearch_fts USING fts5(
+                document,
+                content='event_portal_eventsearchdocument',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+            """,
+            """
+            CREATE TRIGGER event_portal_eventsearch_ai
+            AFTER INSERT ON event_portal_eventsearchdocument BEGIN
+                INSERT INTO event_portal_eventsearch_fts(rowid, document)
+                VALUES (new.id, new.document);
+            END
+            """,
+            """
+            CREATE TRIGGER event_portal_eventsearch_ad
+            AFTER DELETE ON event_portal_eventsearchdocument BEGIN
+                INSERT INTO event_portal_eventsearch_fts(event_portal_eventsearch_fts, rowid, document)
+                VALUES ('delete', old.id, old.document);
+            END
+            """,
+            """
+            CREATE TRIGGER event_portal_eventsearch_au
+            AFTER UPDATE ON event_portal_eventsearchdocument BEGIN
+                INSERT INTO event_portal_eventsearch_fts(event_portal_eventsearch_fts, rowid, document)
+                VALUES ('delete', old.id, old.document);
+                INSERT INTO event_portal_eventsearch_fts(rowid, document)
+                VALUES (new.id, new.document);
+            END
+            """,
+        ],
+        "drop": [
+            "DROP TRIGGER IF EXISTS event_portal_eventsearch_au",
+            "DROP TRIGGER IF EXISTS event_portal_eventsearch_ad",
+            "DROP TRIGGER IF EXISTS event_portal_eventsearch_ai",
+            "DROP TABLE IF EXISTS event_portal_eventsearch_fts",
+        ],
+    },
+    "postgresql": {
+        "create": [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            """
+            CREATE INDEX event_portal_eventsearch_tsv
+            ON event_portal_eventsearchdocument
+            USING GIN (to_tsvector('simple', document))
+            """,
+            """
+            CREATE INDEX event_portal_eventsearch_trgm
+            ON event_portal_eventsearchdocument
+            USING GIN (document gin_trgm_ops)
+            """,
+        ],
+        "drop": [
+            "DROP INDEX IF EXISTS event_portal_eventsearch_trgm",
+            "DROP INDEX IF EXISTS event_portal_eventsearch_tsv",
+        ],
+    },
+}
+
+
+def create_search_index(apps, schema_editor):
+    for statement in SEARCH_INDEX_SQL.get(schema_editor.connection.vendor, {}).get("create", []):
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    for statement in SEARCH_INDEX_SQL.get(schema_editor.connection.vendor, {}).get("drop", []):
+        schema_editor.execute(statement)
+
+
+def populate_search_documents(apps, schema_editor):
+    Event = apps.get_model("event_portal", "Event")
+    EventSearchDocument = apps.get_model("event_portal", "EventSearchDocument")
+    documents = []
+    for event in Event.objects.prefetch_related("category").iterator(chunk_size=500):
+        parts = [event.title, event.location] + [category.name for category in event.category.all()]
+        documents.append(EventSearchDocument(event=event, document=" ".join(filter(None, parts))))
+    EventSearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0024_alter_event_event_end_date_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('document', models.TextField(default='')),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='event_portal.event')),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0026_ticket_inventory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='shard_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TicketInventoryShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveSmallIntegerField()),
+                ('available', models.PositiveIntegerField(default=0)),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shards', to='event_portal.ticket')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='ticketinventoryshard',
+            constraint=models.UniqueConstraint(fields=('ticket', 'index'), name='unique_ticket_shard_index'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0027_ticketinventoryshard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='admission_rate',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0028_event_admission_rate'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_start_date', '-last_updated'], name='event_start_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('expired', False)), fields=['event_start_date', '-last_updated'], name='event_upcoming_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-last_updated', '-id'], name='event_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location', '-last_updated'], name='event_location_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0029_event_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('expired', False)), fields=['event_end_date', 'event_end_time'], name='event_pending_expiry_idx'),
+        ),
+    ]
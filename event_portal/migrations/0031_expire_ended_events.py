@@ -0,0 +1,26 @@
+from django.db import migrations
+from django.db.models import Q
+from django.utils import timezone
+
+
+def expire_ended_events(apps, schema_editor):
+    # The lists filter on the expired flag, which was never set before the
+    # expiry sweep existed; flip every event that has ended, with the same
+    # cutoff as `event_portal.expiry.ended_events`.
+    Event = apps.get_model("event_portal", "Event")
+    now = timezone.localtime()
+    Event.objects.filter(expired=False).filter(
+        Q(event_end_date__lt=now.date())
+        | Q(event_end_date=now.date(), event_end_time__lte=now.time())
+    ).update(expired=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0030_event_pending_expiry_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(expire_ended_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:54
+
+from django.db import migrations, models
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0031_expire_ended_events'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('event', 'Event'), ('category', 'Category')], max_length=10)),
+                ('object_id', models.UUIDField()),
+                ('slug', models.SlugField(db_index=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['last_updated', 'id'], name='category_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['last_updated', 'id'], name='tombstone_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+from django.db.models import Count, Min, Q
+
+
+def populate_category_summaries(apps, schema_editor):
+    Category = apps.get_model("event_portal", "Category")
+    CategorySummary = apps.get_model("event_portal", "CategorySummary")
+    upcoming = Q(event__expired=False)
+    rows = Category.objects.order_by().values("pk").annotate(
+        upcoming_count=Count("event", filter=upcoming),
+        next_start_date=Min("event__event_start_date", filter=upcoming),
+    )
+    CategorySummary.objects.bulk_create([
+        CategorySummary(
+            category_id=row["pk"], upcoming_count=row["upcoming_count"], next_start_date=row["next_start_date"],
+        )
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0032_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategorySummary',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='event_portal.category')),
+                ('upcoming_count', models.PositiveIntegerField(default=0)),
+                ('next_start_date', models.DateField(blank=True, null=True)),
+                ('last_updated', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(populate_category_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_portal', '0033_category_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='geo_band',
+            field=models.IntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('expired', False)), fields=['geo_band', 'longitude'], name='event_geo_idx'),
+        ),
+    ]
@@ -3,6 +3,9 @@ from django.conf import settings
 from django.utils import timezone
 from django.utils.text import slugify
 import uuid
+
+from .geo import grid_band
+
 # Create your models here.
 
 
@@ -62,8 +65,14 @@ class Category(BaseTrackingModel):
     class Meta(BaseTrackingModel.Meta):
         """
         Meta options for the Category model.
+
+        The index serves the change feed, which reads categories in order
+        of last update.
         """
         verbose_name_plural = "Categories"
+        indexes = [
+            models.Index(fields=["last_updated", "id"], name="category_updated_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -99,6 +108,15 @@ class Event(BaseTrackingModel):
         category (ManyToManyField): The categories the event belongs to.
         about (TextField): A detailed description of the event.
         expired (BooleanField): A flag indicating if the event has passed.
+        admission_rate (PositiveIntegerField): How many buyers per minute the
+                                               waiting room admits to the
+                                               purchase endpoints, or None
+                                               when there is no waiting room.
+        latitude (FloatField): The latitude of the event, or None until it
+                               is geocoded.
+        longitude (FloatField): The longitude of the event.
+        geo_band (IntegerField): The latitude band of the grid index radius
+                                 lookups use, kept in step with `latitude`.
     """
     title = models.CharField(max_length=250, unique=True)
     event_start_date = models.DateField()
@@ -112,12 +130,64 @@ class Event(BaseTrackingModel):
     category = models.ManyToManyField(Category)
     about = models.TextField(null=True)
     expired = models.BooleanField(default=False)
+    admission_rate = models.PositiveIntegerField(null=True, blank=True)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geo_band = models.IntegerField(null=True, editable=False)
+
+    class Meta(BaseTrackingModel.Meta):
+        """
+        Meta options for the Event model.
+
+        The indexes match the access paths of the event list endpoints:
+        upcoming events newest first (with a partial index for events that
+        have not expired), pages ordered by last update, the start date
+        ordering and the location filter, plus the end of events still to
+        be marked expired by the expiry sweep and the grid of upcoming
+        events that radius lookups scan.
+        """
+        indexes = [
+            models.Index(fields=["event_start_date", "-last_updated"], name="event_start_updated_idx"),
+            models.Index(
+                fields=["event_start_date", "-last_updated"], name="event_upcoming_idx",
+                condition=models.Q(expired=False),
+            ),
+            models.Index(fields=["-last_updated", "-id"], name="event_updated_idx"),
+            models.Index(fields=["location", "-last_updated"], name="event_location_idx"),
+            models.Index(
+                fields=["event_end_date", "event_end_time"], name="event_pending_expiry_idx",
+                condition=models.Q(expired=False),
+            ),
+            models.Index(
+                fields=["geo_band", "longitude"], name="event_geo_idx",
+                condition=models.Q(expired=False),
+            ),
+        ]
+
+    def has_ended(self, now=None):
+        """
+        Checks whether the event's end date and time have passed.
+
+        Args:
+            now (datetime, optional): The current time.
+
+        Returns:
+            bool: True if the event has ended.
+        """
+        now = timezone.localtime(now)
+        end_date = self._meta.get_field("event_end_date").to_python(self.event_end_date)
+        end_time = self._meta.get_field("event_end_time").to_python(self.event_end_time)
+        return (end_date, end_time) <= (now.date(), now.time())
 
     def save(self, *args, **kwargs):
         """
-        Overrides the save method to automatically generate the slug.
+        Overrides the save method to automatically generate the slug and
+        to keep the expired flag in step with the event's end and the grid
+        band in step with its latitude.
         """
         self.slug = slugify(self.title)
+        self.expired = self.has_ended()
+        self.geo_band = grid_band(self.latitude)
         return super().save(*args, **kwargs)
 
     def __str__(self):
@@ -130,6 +200,101 @@ class Event(BaseTrackingModel):
         return self.title
 
 
+class EventSearchDocument(models.Model):
+    """
+    A denormalized full-text search document for an event.
+
+    The document concatenates the searchable text of an event (title,
+    location and category names) so that search does not need to join
+    through the category relation. It is kept up to date by signals and is
+    indexed by SQLite FTS5 or Postgres full-text and trigram indexes created
+    in the migrations.
+
+    Attributes:
+        event (OneToOneField): The event the document describes.
+        document (TextField): The searchable text of the event.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name="search_document")
+    document = models.TextField(default="")
+
+    def __str__(self):
+        """
+        Returns the string representation of the search document.
+
+        Returns:
+            str: The title of the associated event.
+        """
+        return f"{self.event.title}"
+
+
+class Tombstone(BaseTrackingModel):
+    """
+    A record of a deleted event or category, kept so that the change feed
+    can report deletions. Its `last_updated` is the time of the deletion.
+
+    Attributes:
+        KINDS (tuple): The choices for the kind of deleted object.
+        kind (CharField): Whether an event or a category was deleted.
+        object_id (UUIDField): The primary key of the deleted object.
+        slug (SlugField): The slug of the deleted object.
+    """
+    KINDS = (
+        ("event", "Event"),
+        ("category", "Category"),
+    )
+    kind = models.CharField(max_length=10, choices=KINDS)
+    object_id = models.UUIDField()
+    slug = models.SlugField(db_index=False)
+
+    class Meta(BaseTrackingModel.Meta):
+        """
+        Meta options for the Tombstone model.
+
+        The index serves the change feed, which reads tombstones in order
+        of deletion.
+        """
+        indexes = [
+            models.Index(fields=["last_updated", "id"], name="tombstone_updated_idx"),
+        ]
+
+    def __str__(self):
+        """
+        Returns the string representation of the tombstone.
+
+        Returns:
+            str: The kind and slug of the deleted object.
+        """
+        return f"{self.kind} {self.slug}"
+
+
+class CategorySummary(models.Model):
+    """
+    The upcoming events of a category, maintained by `event_portal.summaries`
+    so category menus can show counts without joining through the events.
+
+    Attributes:
+        category (OneToOneField): The summarized category, also the primary key.
+        upcoming_count (PositiveIntegerField): The number of the category's
+                                               events that have not expired.
+        next_start_date (DateField): The earliest start date of those events,
+                                     or None when there are none.
+        last_updated (DateTimeField): When the summary last changed.
+    """
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, primary_key=True, related_name="summary")
+    upcoming_count = models.PositiveIntegerField(default=0)
+    next_start_date = models.DateField(null=True, blank=True)
+    last_updated = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        """
+        Returns the string representation of the summary.
+
+        Returns:
+            str: The category ID and its number of upcoming events.
+        """
+        return f"{self.category_id}: {self.upcoming_count}"
+
+
 class Ticket(BaseTrackingModel):
     """
     A model for different types of tickets available for an event.
@@ -138,10 +303,32 @@ class Ticket(BaseTrackingModel):
         ticket_type (CharField): The type of the ticket (e.g., VIP, General).
         ticket_price (FloatField): The price of the ticket.
         event (ForeignKey): The event this ticket is associated with.
+        capacity (PositiveIntegerField): The total number of tickets of this
+                                         type that can be sold.
+        available (PositiveIntegerField): The number of tickets neither sold
+                                          nor held, when the stock is not
+                                          sharded. It is only ever changed
+                                          with conditional UPDATE statements
+                                          (see `event_portal.inventory`).
+        shard_count (PositiveSmallIntegerField): The number of
+                                                 `TicketInventoryShard` rows
+                                                 holding the stock instead of
+                                                 `available`, or 0.
     """
     ticket_type = models.CharField(max_length=25)
     ticket_price = models.FloatField()
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
+    capacity = models.PositiveIntegerField(default=0)
+    available = models.PositiveIntegerField(default=0)
+    shard_count = models.PositiveSmallIntegerField(default=0)
+
+    def save(self, *args, **kwargs):
+        """
+        Overrides the save method so new ticket types start fully available.
+        """
+        if self._state.adding:
+            self.available = self.capacity
+        return super().save(*args, **kwargs)
 
     def __str__(self):
         """
@@ -150,7 +337,95 @@ class Ticket(BaseTrackingModel):
         Returns:
             str: The ID of the ticket.
         """
-        return self.ticket_id
+        return str(self.id)
+
+
+class TicketInventoryShard(models.Model):
+    """
+    A slice of the remaining stock of a ticket type.
+
+    Spreading the stock of a popular ticket type over several rows lets
+    concurrent buyers decrement different rows instead of all waiting on
+    the same one. The remaining stock is the sum of all shards.
+
+    Attributes:
+        ticket (ForeignKey): The ticket type the stock belongs to.
+        index (PositiveSmallIntegerField): The shard number, from 0 to
+                                           `ticket.shard_count - 1`.
+        available (PositiveIntegerField): The tickets left in this shard.
+    """
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="shards")
+    index = models.PositiveSmallIntegerField()
+    available = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """
+        Meta options for the TicketInventoryShard model.
+        """
+        constraints = [
+            models.UniqueConstraint(fields=["ticket", "index"], name="unique_ticket_shard_index"),
+        ]
+
+    def __str__(self):
+        """
+        Returns the string representation of the shard.
+
+        Returns:
+            str: The ticket ID and shard index.
+        """
+        return f"{self.ticket_id}:{self.index}"
+
+
+class TicketOrder(BaseTrackingModel):
+    """
+    A reservation or purchase of tickets of a single type.
+
+    An order starts as a time-limited hold on stock. Confirming it before
+    `expires_at` completes the purchase; otherwise it expires, or is
+    cancelled, and its tickets are returned to the ticket's stock.
+
+    Attributes:
+        STATUS_CHOICES (tuple): The possible order states.
+        ticket (ForeignKey): The ticket type being bought.
+        buyer (ForeignKey): The user buying the tickets.
+        quantity (PositiveIntegerField): The number of tickets in the order.
+        unit_price (FloatField): The ticket price when the order was placed.
+        status (CharField): The state of the order.
+        expires_at (DateTimeField): When a held order expires.
+    """
+    HELD = "held"
+    CONFIRMED = "confirmed"
+    EXPIRED = "expired"
+    CANCELLED = "cancelled"
+    STATUS_CHOICES = (
+        (HELD, "Held"),
+        (CONFIRMED, "Confirmed"),
+        (EXPIRED, "Expired"),
+        (CANCELLED, "Cancelled"),
+    )
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="orders")
+    buyer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="ticket_orders")
+    quantity = models.PositiveIntegerField()
+    unit_price = models.FloatField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=HELD)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(BaseTrackingModel.Meta):
+        """
+        Meta options for the TicketOrder model.
+        """
+        indexes = [
+            models.Index(fields=["status", "expires_at"], name="ticketorder_status_expiry_idx"),
+        ]
+
+    def __str__(self):
+        """
+        Returns the string representation of the order.
+
+        Returns:
+            str: The ID of the order.
+        """
+        return str(self.id)
 
 
 class SocialMedia(BaseTrackingModel):
@@ -0,0 +1,203 @@
+"""
+Full-text search over events.
+
+Each event has an `EventSearchDocument` holding its searchable text. The
+search backend used depends on the database: SQLite uses the FTS5 index
+created in the migrations, Postgres uses its full-text and trigram GIN
+indexes, and other databases fall back to a plain `icontains` scan of the
+document table. Every backend filters a queryset of events and annotates
+it with a `search_rank`, where a higher rank is a better match.
+"""
+import re
+from functools import lru_cache
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .models import Event, EventSearchDocument
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_document(event):
+    """
+    Builds the searchable text of an event.
+
+    Args:
+        event (Event): The event, ideally with its categories prefetched.
+
+    Returns:
+        str: The search document.
+    """
+    parts = [event.title, event.location] + [category.name for category in event.category.all()]
+    return " ".join(filter(None, parts))
+
+
+def index_events(events):
+    """
+    Creates or refreshes the search documents of the given events.
+
+    Args:
+        events (iterable): Event instances or primary keys.
+    """
+    ids = [getattr(event, "pk", event) for event in events]
+    if not ids:
+        return
+    existing = dict(
+        EventSearchDocument.objects.filter(event_id__in=ids).values_list("event_id", "id")
+    )
+    created, updated = [], []
+    for event in Event.objects.filter(pk__in=ids).prefetch_related("category"):
+        document = EventSearchDocument(event=event, document=build_document(event))
+        if event.pk in existing:
+            document.pk = existing[event.pk]
+            updated.append(document)
+        else:
+            created.append(document)
+    EventSearchDocument.objects.bulk_create(created)
+    EventSearchDocument.objects.bulk_update(updated, ["document"])
+
+
+def tokenize(terms):
+    """
+    Splits search terms into word tokens, dropping punctuation.
+
+    Args:
+        terms (list): The raw search terms.
+
+    Returns:
+        list: The lowercased word tokens.
+    """
+    return TOKEN_RE.findall(" ".join(terms).lower())
+
+
+class SearchBackend:
+    """
+    A fallback search backend using case-insensitive substring matching on
+    the search document.
+    """
+
+    def search(self, queryset, terms):
+        """
+        Filters a queryset of events to those matching every term.
+
+        Args:
+            queryset (QuerySet): The queryset of events to search.
+            terms (list): The search terms.
+
+        Returns:
+            QuerySet: The matching events annotated with `search_rank`.
+        """
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        condition = Q()
+        for token in tokens:
+            condition &= Q(search_document__document__icontains=token)
+        return queryset.filter(condition).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    A search backend using the SQLite FTS5 index, ranked by BM25.
+
+    Every token is matched as a prefix, so results update as the user types.
+    """
+    fts_table = "event_portal_eventsearch_fts"
+
+    def search(self, queryset, terms):
+        """
+        Filters a queryset of events with an FTS5 MATCH query.
+
+        Args:
+            queryset (QuerySet): The queryset of events to search.
+            terms (list): The search terms.
+
+        Returns:
+            QuerySet: The matching events annotated with `search_rank`.
+        """
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        match = " ".join(f'"{token}"*' for token in tokens)
+        documents = EventSearchDocument._meta.db_table
+        matches = RawSQL(
+            f"SELECT d.event_id FROM {documents} d "
+            f"JOIN {self.fts_table} f ON f.rowid = d.id "
+            f"WHERE {self.fts_table} MATCH %s",
+            [match],
+        )
+        rank = RawSQL(
+            f"SELECT -bm25({self.fts_table}) FROM {self.fts_table} "
+            f"WHERE {self.fts_table} MATCH %s AND rowid = ("
+            f"SELECT d.id FROM {documents} d WHERE d.event_id = {Event._meta.db_table}.id)",
+            [match],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    A search backend using Postgres full-text search with trigram similarity.
+
+    Events match when every token matches as a word prefix, or when the
+    document is trigram-similar to the query, which tolerates typos. The
+    rank combines `ts_rank` and trigram similarity.
+    """
+
+    def search(self, queryset, terms):
+        """
+        Filters a queryset of events with the full-text and trigram indexes.
+
+        Args:
+            queryset (QuerySet): The queryset of events to search.
+            terms (list): The search terms.
+
+        Returns:
+            QuerySet: The matching events annotated with `search_rank`.
+        """
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+        text = " ".join(tokens)
+        documents = EventSearchDocument._meta.db_table
+        matches = RawSQL(
+            f"SELECT event_id FROM {documents} "
+            f"WHERE to_tsvector('simple', document) @@ to_tsquery('simple', %s) "
+            f"OR document %% %s",
+            [tsquery, text],
+        )
+        rank = RawSQL(
+            f"SELECT ts_rank(to_tsvector('simple', document), to_tsquery('simple', %s)) "
+            f"+ similarity(document, %s) FROM {documents} "
+            f"WHERE event_id = {Event._meta.db_table}.id",
+            [tsquery, text],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+@lru_cache(maxsize=None)
+def _backend_for(vendor):
+    return BACKENDS.get(vendor, SearchBackend)()
+
+
+def get_search_backend():
+    """
+    Returns the search backend for the default database.
+
+    Returns:
+        SearchBackend: The search backend.
+    """
+    return _backend_for(connection.vendor)
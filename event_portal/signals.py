@@ -0,0 +1,416 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from event_portal import summaries, waiting_room
+from event_portal.api import cache
+from event_portal.models import Category, CategorySummary, Event, Ticket, Tombstone
+from event_portal.search import index_events
+
+
+def invalidate_on_commit(*tags) -> None:
+    """
+    Invalidates the cache tags now and again once the transaction commits.
+
+    The second invalidation drops any response that a concurrent reader
+    cached from the old, still-committed rows while the write was in flight.
+
+    Args:
+        *tags (str): The cache tags to invalidate.
+    """
+    cache.invalidate(*tags)
+    transaction.on_commit(lambda: cache.invalidate(*tags))
+
+
+def _previous_slug(model, instance):
+    if instance._state.adding or instance.pk is None:
+        return None
+    return model.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+
+
+@receiver(pre_save, sender=Event)
+@receiver(pre_save, sender=Category)
+def remember_previous_slug(sender, instance, **kwargs) -> None:
+    """
+    Records the stored slug before a save so a renamed object's old cache
+    entries can be invalidated too.
+
+    Args:
+        sender (Model): The model class being saved.
+        instance (Model): The instance being saved.
+        **kwargs: Wildcard keyword arguments.
+    """
+    instance._previous_slug = _previous_slug(sender, instance)
+
+
+@receiver(pre_delete, sender=Event)
+def remember_event_categories(sender, instance, **kwargs) -> None:
+    """
+    Records an event's categories before the M2M rows are deleted.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The event being deleted.
+        **kwargs: Wildcard keyword arguments.
+    """
+    categories = list(instance.category.values_list("pk", "slug"))
+    instance._category_ids = [pk for pk, _ in categories]
+    instance._category_slugs = [slug for _, slug in categories]
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_events(sender, instance, **kwargs) -> None:
+    """
+    Records the slugs of a category's events before the M2M rows are deleted.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The category being deleted.
+        **kwargs: Wildcard keyword arguments.
+    """
+    instance._event_slugs = list(instance.event_set.values_list("slug", flat=True))
+    instance._event_ids = list(instance.event_set.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Event)
+def invalidate_saved_event(sender, instance, **kwargs) -> None:
+    """
+    Invalidates cached responses that include a created or updated event.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The saved event.
+        **kwargs: Wildcard keyword arguments.
+    """
+    tags = [cache.EVENTS_TAG, cache.event_tag(instance.slug)]
+    previous = getattr(instance, "_previous_slug", None)
+    if previous and previous != instance.slug:
+        tags.append(cache.event_tag(previous))
+    if instance.host_id:
+        tags.append(cache.host_tag(instance.host_id))
+    tags += [
+        cache.category_events_tag(slug)
+        for slug in instance.category.values_list("slug", flat=True)
+    ]
+    invalidate_on_commit(*tags)
+
+
+@receiver(post_delete, sender=Event)
+def invalidate_deleted_event(sender, instance, **kwargs) -> None:
+    """
+    Invalidates cached responses that included a deleted event.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The deleted event.
+        **kwargs: Wildcard keyword arguments.
+    """
+    tags = [cache.EVENTS_TAG, cache.event_tag(instance.slug)]
+    if instance.host_id:
+        tags.append(cache.host_tag(instance.host_id))
+    tags += [cache.category_events_tag(slug) for slug in getattr(instance, "_category_slugs", [])]
+    invalidate_on_commit(*tags)
+
+
+@receiver(post_save, sender=Category)
+def invalidate_saved_category(sender, instance, **kwargs) -> None:
+    """
+    Invalidates cached responses that include a created or updated category.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The saved category.
+        **kwargs: Wildcard keyword arguments.
+    """
+    tags = [
+        cache.EVENTS_TAG, cache.CATEGORIES_TAG,
+        cache.category_tag(instance.slug), cache.category_events_tag(instance.slug),
+    ]
+    previous = getattr(instance, "_previous_slug", None)
+    if previous and previous != instance.slug:
+        tags += [cache.category_tag(previous), cache.category_events_tag(previous)]
+    invalidate_on_commit(*tags)
+
+
+@receiver(post_delete, sender=Category)
+def invalidate_deleted_category(sender, instance, **kwargs) -> None:
+    """
+    Invalidates cached responses that included a deleted category,
+    including the detail of every event that belonged to it.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The deleted category.
+        **kwargs: Wildcard keyword arguments.
+    """
+    tags = [
+        cache.EVENTS_TAG, cache.CATEGORIES_TAG,
+        cache.category_tag(instance.slug), cache.category_events_tag(instance.slug),
+    ]
+    tags += [cache.event_tag(slug) for slug in getattr(instance, "_event_slugs", [])]
+    invalidate_on_commit(*tags)
+
+
+@receiver(m2m_changed, sender=Event.category.through)
+def invalidate_event_categories(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """
+    Invalidates cached responses when events are added to or removed from
+    categories, from either side of the relation.
+
+    Args:
+        sender (Model): The M2M through model.
+        instance (Model): The event, or the category when `reverse` is True.
+        action (str): The M2M action being performed.
+        reverse (bool): Whether the change was made from the category side.
+        pk_set (set): The primary keys added or removed.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if action == "pre_clear":
+        related = instance.event_set if reverse else instance.category
+        instance._cleared_slugs = list(related.values_list("slug", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if action == "post_clear":
+        slugs = getattr(instance, "_cleared_slugs", [])
+    else:
+        related_model = Event if reverse else Category
+        slugs = list(related_model.objects.filter(pk__in=pk_set).values_list("slug", flat=True))
+
+    if reverse:
+        tags = [cache.category_events_tag(instance.slug)]
+        tags += [cache.event_tag(slug) for slug in slugs]
+        hosts = Event.objects.filter(slug__in=slugs, host__isnull=False).values_list("host_id", flat=True)
+        tags += [cache.host_tag(host_id) for host_id in hosts.distinct()]
+    else:
+        tags = [cache.event_tag(instance.slug)]
+        tags += [cache.category_events_tag(slug) for slug in slugs]
+        if instance.host_id:
+            tags.append(cache.host_tag(instance.host_id))
+    invalidate_on_commit(cache.EVENTS_TAG, *tags)
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_ticket_host_dashboard(sender, instance, **kwargs) -> None:
+    """
+    Invalidates the dashboard of the host of a saved or deleted ticket type.
+
+    Args:
+        sender (Model): The model class (Ticket).
+        instance (Ticket): The saved or deleted ticket type.
+        **kwargs: Wildcard keyword arguments.
+    """
+    host_id = Event.objects.filter(pk=instance.event_id).values_list("host_id", flat=True).first()
+    if host_id:
+        invalidate_on_commit(cache.host_tag(host_id))
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def forget_event_admission_rate(sender, instance, **kwargs) -> None:
+    """
+    Drops the cached admission rate of a saved or deleted event so the
+    waiting room picks up the change immediately.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The saved or deleted event.
+        **kwargs: Wildcard keyword arguments.
+    """
+    slugs = {instance.slug, getattr(instance, "_previous_slug", None)} - {None}
+    waiting_room.forget_admission_rate(*slugs)
+    transaction.on_commit(lambda: waiting_room.forget_admission_rate(*slugs))
+
+
+@receiver(post_save, sender=Event)
+def update_event_search_document(sender, instance, **kwargs) -> None:
+    """
+    Refreshes the search document of a created or updated event.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The saved event.
+        **kwargs: Wildcard keyword arguments.
+    """
+    index_events([instance])
+
+
+@receiver(post_save, sender=Category)
+def update_category_search_documents(sender, instance, created, **kwargs) -> None:
+    """
+    Refreshes the search documents of a renamed category's events.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The saved category.
+        created (bool): Whether a new record was created.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if not created:
+        index_events(instance.event_set.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Category)
+def update_deleted_category_search_documents(sender, instance, **kwargs) -> None:
+    """
+    Refreshes the search documents of a deleted category's former events.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The deleted category.
+        **kwargs: Wildcard keyword arguments.
+    """
+    index_events(getattr(instance, "_event_ids", []))
+
+
+@receiver(m2m_changed, sender=Event.category.through)
+def update_event_categories_search_documents(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """
+    Refreshes the search documents of events whose categories changed.
+
+    Args:
+        sender (Model): The M2M through model.
+        instance (Model): The event, or the category when `reverse` is True.
+        action (str): The M2M action being performed.
+        reverse (bool): Whether the change was made from the category side.
+        pk_set (set): The primary keys added or removed.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_event_ids = list(instance.event_set.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        index_events(pk_set if reverse else [instance])
+    elif action == "post_clear":
+        index_events(getattr(instance, "_cleared_event_ids", []) if reverse else [instance])
+
+
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Category)
+def record_tombstone(sender, instance, **kwargs) -> None:
+    """
+    Records the deletion of an event or category for the change feed.
+
+    Args:
+        sender (Model): The model class being deleted.
+        instance (Model): The deleted instance.
+        **kwargs: Wildcard keyword arguments.
+    """
+    kind = "event" if sender is Event else "category"
+    Tombstone.objects.create(kind=kind, object_id=instance.pk, slug=instance.slug)
+
+
+def touch_events(event_ids) -> None:
+    """
+    Marks events as updated so the change feed reports them again.
+
+    Args:
+        event_ids (iterable): The primary keys of the events.
+    """
+    event_ids = list(event_ids)
+    if event_ids:
+        Event.objects.filter(pk__in=event_ids).update(last_updated=timezone.now())
+
+
+@receiver(m2m_changed, sender=Event.category.through)
+def touch_events_with_changed_categories(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """
+    Marks events as updated when their categories change, from either side
+    of the relation, since the change does not save the event.
+
+    Args:
+        sender (Model): The M2M through model.
+        instance (Model): The event, or the category when `reverse` is True.
+        action (str): The M2M action being performed.
+        reverse (bool): Whether the change was made from the category side.
+        pk_set (set): The primary keys added or removed.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if action == "pre_clear" and reverse:
+        instance._touched_event_ids = list(instance.event_set.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove") and pk_set:
+        touch_events(pk_set if reverse else [instance.pk])
+    elif action == "post_clear":
+        touch_events(getattr(instance, "_touched_event_ids", []) if reverse else [instance.pk])
+
+
+@receiver(post_delete, sender=Category)
+def touch_deleted_category_events(sender, instance, **kwargs) -> None:
+    """
+    Marks a deleted category's former events as updated, since they lost
+    the category without being saved.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The deleted category.
+        **kwargs: Wildcard keyword arguments.
+    """
+    touch_events(getattr(instance, "_event_ids", []))
+
+
+@receiver(post_save, sender=Category)
+def create_category_summary(sender, instance, created, **kwargs) -> None:
+    """
+    Creates the empty summary of a new category.
+
+    Args:
+        sender (Model): The model class (Category).
+        instance (Category): The saved category.
+        created (bool): Whether a new record was created.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if created:
+        CategorySummary.objects.get_or_create(category=instance)
+
+
+@receiver(post_save, sender=Event)
+def update_saved_event_category_summaries(sender, instance, created, **kwargs) -> None:
+    """
+    Refreshes the summaries of an updated event's categories. A new event
+    has no categories until they are added.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The saved event.
+        created (bool): Whether a new record was created.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if not created:
+        summaries.refresh_on_commit(instance.category.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Event)
+def update_deleted_event_category_summaries(sender, instance, **kwargs) -> None:
+    """
+    Refreshes the summaries of a deleted event's former categories.
+
+    Args:
+        sender (Model): The model class (Event).
+        instance (Event): The deleted event.
+        **kwargs: Wildcard keyword arguments.
+    """
+    summaries.refresh_on_commit(getattr(instance, "_category_ids", []))
+
+
+@receiver(m2m_changed, sender=Event.category.through)
+def update_changed_category_summaries(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """
+    Refreshes the summaries of categories that gained or lost events, from
+    either side of the relation.
+
+    Args:
+        sender (Model): The M2M through model.
+        instance (Model): The event, or the category when `reverse` is True.
+        action (str): The M2M action being performed.
+        reverse (bool): Whether the change was made from the category side.
+        pk_set (set): The primary keys added or removed.
+        **kwargs: Wildcard keyword arguments.
+    """
+    if action == "pre_clear" and not reverse:
+        instance._cleared_category_ids = list(instance.category.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove") and pk_set:
+        summaries.refresh_on_commit([instance.pk] if reverse else pk_set)
+    elif action == "post_clear":
+        summaries.refresh_on_commit([instance.pk] if reverse else getattr(instance, "_cleared_category_ids", []))
@@ -0,0 +1,92 @@
+"""
+Per-category summaries of upcoming events.
+
+`CategorySummary` holds, for every category, the number of its events that
+have not expired and their earliest start date, so the category list can
+return them with one join instead of counting each category's events.
+
+Summaries are refreshed for the categories a change touches: by signals
+when events are saved or deleted or their categories change, and
+explicitly by the bulk paths (imports and the expiry sweep) that skip
+signals. Each refresh recomputes the touched categories with one grouped
+query and only writes the rows whose values changed. Summaries written by
+transactions racing on the same category can miss each other's changes,
+so `python manage.py reconcile_category_summaries` recomputes every
+category and should be scheduled periodically.
+"""
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from .models import Category, CategorySummary
+
+UPCOMING = Q(event__expired=False)
+
+
+def compute_summaries(category_ids=None):
+    """
+    Computes the summaries of categories from their events.
+
+    Args:
+        category_ids (iterable, optional): The categories to compute.
+                                           Defaults to every category.
+
+    Returns:
+        dict: The upcoming event count and next start date, by category ID.
+    """
+    categories = Category.objects.order_by()
+    if category_ids is not None:
+        categories = categories.filter(pk__in=category_ids)
+    rows = categories.values("pk").annotate(
+        upcoming_count=Count("event", filter=UPCOMING),
+        next_start_date=Min("event__event_start_date", filter=UPCOMING),
+    )
+    return {row["pk"]: (row["upcoming_count"], row["next_start_date"]) for row in rows}
+
+
+def refresh_summaries(category_ids=None):
+    """
+    Brings the summaries of categories up to date.
+
+    Args:
+        category_ids (iterable, optional): The categories to refresh.
+                                           Defaults to every category.
+
+    Returns:
+        int: The number of summaries created or changed.
+    """
+    if category_ids is not None:
+        category_ids = set(category_ids)
+        if not category_ids:
+            return 0
+    computed = compute_summaries(category_ids)
+    existing = CategorySummary.objects.in_bulk(computed.keys())
+    now = timezone.now()
+    created, changed = [], []
+    for pk, (count, next_start_date) in computed.items():
+        summary = existing.get(pk)
+        if summary is None:
+            created.append(CategorySummary(
+                category_id=pk, upcoming_count=count, next_start_date=next_start_date, last_updated=now,
+            ))
+        elif (summary.upcoming_count, summary.next_start_date) != (count, next_start_date):
+            summary.upcoming_count, summary.next_start_date, summary.last_updated = count, next_start_date, now
+            changed.append(summary)
+    CategorySummary.objects.bulk_create(created, ignore_conflicts=True)
+    CategorySummary.objects.bulk_update(changed, ["upcoming_count", "next_start_date", "last_updated"])
+    return len(created) + len(changed)
+
+
+def refresh_on_commit(category_ids):
+    """
+    Refreshes summaries now, so the writing transaction sees them, and
+    again once it commits, so they reflect what other transactions
+    committed meanwhile.
+
+    Args:
+        category_ids (iterable): The categories to refresh.
+    """
+    category_ids = set(category_ids)
+    if category_ids:
+        refresh_summaries(category_ids)
+        transaction.on_commit(lambda: refresh_summaries(category_ids))
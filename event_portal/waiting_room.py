@@ -0,0 +1,240 @@
+"""
+Virtual waiting room in front of the ticket purchase endpoints.
+
+Events with an `admission_rate` queue their buyers before they can hold
+tickets. Joining the queue hands out a signed token carrying the event and
+the buyer's position, taken from an atomic counter in the waiting room
+cache. The queue head, the position up to which buyers are admitted, is
+advanced lazily whenever the queue is read: it moves forward by the
+admission rate for the time elapsed since it last moved, and never more
+than `WAITING_ROOM_BURST` places past the end of the queue, so an idle
+queue lets the next burst of buyers straight through while a sudden spike
+is admitted at the configured rate.
+
+Joining and polling only touch the cache (the admission rate of an event is
+cached too), so a crowd refreshing its queue status never reaches the
+database. With more than one worker process, the waiting room cache must
+be shared between them; concurrent processes may then lose a fraction of a
+second of head movement to each other, which only slows admission down.
+"""
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+
+from .models import Event
+
+TOKEN_SALT = "event_portal.waiting_room"
+RATE_TIMEOUT = 60
+
+_MISSING = object()
+_head_lock = threading.Lock()
+
+
+class WaitingRoomError(Exception):
+    """
+    Base class for errors raised by the waiting room.
+    """
+
+
+class InvalidQueueToken(WaitingRoomError):
+    """
+    Raised when a queue token is missing, tampered with, expired or issued
+    for another event.
+    """
+
+
+class NotAdmitted(WaitingRoomError):
+    """
+    Raised when a buyer tries to purchase before being admitted.
+    """
+
+
+def get_cache():
+    """
+    Returns the cache holding the waiting room state.
+
+    Returns:
+        BaseCache: The waiting room cache.
+    """
+    return caches[settings.WAITING_ROOM_CACHE_ALIAS]
+
+
+def _key(slug, name):
+    return f"waiting-room:{slug}:{name}"
+
+
+def get_admission_rate(slug):
+    """
+    Returns the admission rate of an event, reading the database at most
+    once per `RATE_TIMEOUT` seconds.
+
+    Args:
+        slug (str): The slug of the event.
+
+    Returns:
+        int: Buyers admitted per minute, or None if the event does not
+             exist or has no waiting room.
+    """
+    cache = get_cache()
+    rate = cache.get(_key(slug, "rate"), _MISSING)
+    if rate is _MISSING:
+        rate = Event.objects.filter(slug=slug).values_list("admission_rate", flat=True).first()
+        cache.set(_key(slug, "rate"), rate, RATE_TIMEOUT)
+    return rate
+
+
+def forget_admission_rate(*slugs):
+    """
+    Drops the cached admission rate of events so a changed rate applies
+    immediately.
+
+    Args:
+        *slugs (str): The slugs of the events.
+    """
+    get_cache().delete_many([_key(slug, "rate") for slug in slugs])
+
+
+def _advance_head(slug, rate, now):
+    cache = get_cache()
+    with _head_lock:
+        tail = cache.get(_key(slug, "tail"), 0)
+        head, moved_at = cache.get(_key(slug, "head")) or (settings.WAITING_ROOM_BURST, now)
+        head = min(head + max(now - moved_at, 0) * rate / 60, max(head, tail + settings.WAITING_ROOM_BURST))
+        cache.set(_key(slug, "head"), (head, now), None)
+    return head
+
+
+def _status(slug, position, rate, now):
+    head = _advance_head(slug, rate, now)
+    admitted = position <= head
+    return {
+        "event": slug,
+        "position": position,
+        "admitted": admitted,
+        "ahead": 0 if admitted else max(position - math.floor(head) - 1, 0),
+        "estimated_wait": 0 if admitted else (math.ceil((position - head) * 60 / rate) if rate else None),
+    }
+
+
+def join(slug, rate, now=None):
+    """
+    Adds a buyer to the back of an event's queue.
+
+    Args:
+        slug (str): The slug of the event.
+        rate (int): The admission rate of the event.
+        now (float, optional): The current time in seconds.
+
+    Returns:
+        dict: The queue status of the new buyer, including their `token`.
+    """
+    now = time.time() if now is None else now
+    cache = get_cache()
+    # Bring the head up to date before the queue grows, so the time the
+    # queue sat idle cannot be spent admitting the newcomers of a spike.
+    _advance_head(slug, rate, now)
+    cache.add(_key(slug, "tail"), 0, None)
+    position = cache.incr(_key(slug, "tail"))
+    token = signing.dumps({"e": slug, "p": position}, salt=TOKEN_SALT)
+    return {"token": token, **_status(slug, position, rate, now)}
+
+
+def read_token(token, slug=None):
+    """
+    Verifies a queue token.
+
+    Args:
+        token (str): The queue token.
+        slug (str, optional): The event the token must have been issued for.
+
+    Returns:
+        tuple: The event slug and the queue position in the token.
+
+    Raises:
+        InvalidQueueToken: If the token is not valid.
+    """
+    if not token:
+        raise InvalidQueueToken("A queue token is required")
+    try:
+        data = signing.loads(token, salt=TOKEN_SALT, max_age=settings.WAITING_ROOM_TOKEN_MAX_AGE)
+    except signing.SignatureExpired:
+        raise InvalidQueueToken("This queue token has expired")
+    except signing.BadSignature:
+        raise InvalidQueueToken("Invalid queue token")
+    if slug is not None and data["e"] != slug:
+        raise InvalidQueueToken("This queue token was issued for another event")
+    return data["e"], data["p"]
+
+
+def get_status(token, now=None):
+    """
+    Returns the queue status of a buyer.
+
+    Args:
+        token (str): The buyer's queue token.
+        now (float, optional): The current time in seconds.
+
+    Returns:
+        dict: The event, position, whether the buyer is admitted, how many
+              buyers are ahead and the estimated wait in seconds.
+
+    Raises:
+        InvalidQueueToken: If the token is not valid.
+    """
+    slug, position = read_token(token)
+    rate = get_admission_rate(slug)
+    if rate is None:
+        return {"event": slug, "position": position, "admitted": True, "ahead": 0, "estimated_wait": 0}
+    return _status(slug, position, rate, time.time() if now is None else now)
+
+
+def admit(event, token, user_id, now=None):
+    """
+    Redeems an admitted queue token to purchase tickets for an event.
+
+    An admitted token is bound to the first user who purchases with it, so
+    it cannot be passed around to let other accounts skip the queue, and
+    it is used up by the purchase: each place in the queue buys once. Call
+    `release` if the purchase fails so the buyer can try again.
+
+    Args:
+        event (Event): The event, with an admission rate.
+        token (str): The buyer's queue token.
+        user_id (int): The primary key of the buyer.
+        now (float, optional): The current time in seconds.
+
+    Raises:
+        InvalidQueueToken: If the token is not valid for the event or has
+                           already been used.
+        NotAdmitted: If the buyer has not been admitted yet.
+    """
+    slug, position = read_token(token, event.slug)
+    status = _status(slug, position, event.admission_rate, time.time() if now is None else now)
+    if not status["admitted"]:
+        raise NotAdmitted(
+            f"Not admitted yet, {status['ahead']} buyers ahead in the queue"
+        )
+    cache = get_cache()
+    key = _key(slug, f"admitted:{position}")
+    cache.add(key, user_id, settings.WAITING_ROOM_TOKEN_MAX_AGE)
+    if cache.get(key) != user_id:
+        raise InvalidQueueToken("This queue token is already in use by another buyer")
+    if not cache.add(_key(slug, f"redeemed:{position}"), True, settings.WAITING_ROOM_TOKEN_MAX_AGE):
+        raise InvalidQueueToken("This queue token has already been used")
+
+
+def release(event, token):
+    """
+    Makes a redeemed queue token usable again after the purchase it was
+    redeemed for failed.
+
+    Args:
+        event (Event): The event.
+        token (str): The buyer's queue token, already checked by `admit`.
+    """
+    slug, position = read_token(token, event.slug)
+    get_cache().delete(_key(slug, f"redeemed:{position}"))
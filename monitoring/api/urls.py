@@ -0,0 +1,13 @@
+"""
+URL patterns for the monitoring API.
+
+This module defines the endpoints reporting the request timings recorded by
+`PerformanceMiddleware` and the statements run by the server.
+"""
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path("performance/", views.PerformanceReportView.as_view(), name="performance-report"),
+    path("queries/", views.QueryReportView.as_view(), name="query-report"),
+]
@@ -0,0 +1,107 @@
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.validators import ValidationError
+from rest_framework import status
+
+from event_portal.api.renderers import CustomRenderer
+from ..metrics import registry
+from ..queries import ORDERS, query_stats
+
+
+class PerformanceReportView(GenericAPIView):
+    """
+    API endpoint reporting the request timings recorded by this server
+    process, per URL name.
+
+    For each URL name (`events-list`, `event-detail`, ...), every metric
+    (`total`, `db`, `queries`, `serialize` and `render`, in milliseconds
+    except for `queries`) is summarized by its count, mean, p50, p95, p99
+    and max. Each server process keeps its own histograms.
+
+    Attributes:
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [CustomRenderer]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the timing summary.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The summary of each metric, by URL name.
+        """
+        return Response(registry.summary())
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Clears the recorded timings, e.g. before a benchmark run.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: An empty response.
+        """
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class QueryReportView(GenericAPIView):
+    """
+    API endpoint ranking the statements run by this server process, by
+    fingerprint.
+
+    Each statement is reported with its normalized SQL, the number of runs
+    and their total, maximum and mean time in milliseconds. `?order=`
+    ranks by `total` (the default), `max` or `count`, and `?limit=` sets
+    the number of statements returned.
+
+    Attributes:
+        permission_classes (list): The permissions required for this view.
+        renderer_classes (list): The renderers for the response.
+        default_limit (int): The number of statements returned by default.
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [CustomRenderer]
+    default_limit = 20
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the top statements.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The statistics of the top statements.
+
+        Raises:
+            ValidationError: If the order or limit is not valid.
+        """
+        order = request.query_params.get("order", "total")
+        if order not in ORDERS:
+            raise ValidationError({"detail": f"The order must be one of {', '.join(ORDERS)}."})
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"detail": "The limit must be a number."})
+        return Response(query_stats.top(max(limit, 1), order))
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Clears the statement statistics.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: An empty response.
+        """
+        query_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
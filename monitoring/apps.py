@@ -0,0 +1,36 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    """
+    Configuration for the 'monitoring' Django app.
+
+    This class sets up the configuration for the monitoring app. When the
+    app is ready, it times, fingerprints and logs the queries of every new
+    database connection and, when `PERFORMANCE_MONITORING` is on, times DRF
+    serializers for the requests measured by `PerformanceMiddleware`.
+
+    Attributes:
+        default_auto_field (str): The default primary key type for models.
+        name (str): The name of the application.
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'monitoring'
+
+    def ready(self) -> None:
+        """
+        Installs the query and serializer timing hooks.
+
+        This method is called by Django when the application is ready. The
+        query hooks are always installed, so slow queries are logged; they
+        only time queries for requests `PerformanceMiddleware` measures.
+        Serializers are only patched when `PERFORMANCE_MONITORING` is on.
+        """
+        from django.conf import settings
+        from django.db.backends.signals import connection_created
+        from monitoring.metrics import instrument_serializers
+        from monitoring.queries import instrument_connection
+
+        connection_created.connect(instrument_connection, dispatch_uid="monitoring.instrument_connection")
+        if settings.PERFORMANCE_MONITORING:
+            instrument_serializers()
@@ -0,0 +1,80 @@
+import glob
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from monitoring.queries import ORDERS, QueryStats
+
+
+def log_files(path):
+    """
+    Lists a log file and its rotated copies, oldest first.
+
+    Args:
+        path (str): The log file.
+
+    Returns:
+        list: The paths that exist.
+    """
+    rotated = [name for name in glob.glob(f"{glob.escape(path)}.*") if name.rsplit(".", 1)[1].isdigit()]
+    rotated.sort(key=lambda name: int(name.rsplit(".", 1)[1]), reverse=True)
+    return rotated + ([path] if os.path.exists(path) else [])
+
+
+class Command(BaseCommand):
+    """
+    Prints the statements that spent the most time in the slow query log,
+    with the plans captured for them.
+
+    Reads the log file and its rotated copies, so the report covers every
+    server process writing to it.
+    """
+    help = "Ranks the statements in the slow query log."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument("--file", default=settings.SLOW_QUERY_LOG_FILE,
+                            help="The slow query log (default: SLOW_QUERY_LOG_FILE).")
+        parser.add_argument("--limit", type=int, default=10, help="The number of statements to print.")
+        parser.add_argument("--order", choices=ORDERS, default="total",
+                            help="Rank by total time, maximum time or number of slow runs.")
+        parser.add_argument("--plans", action="store_true", help="Print the captured query plans.")
+
+    def handle(self, *args, **options):
+        """
+        Summarizes the slow query log.
+        """
+        paths = log_files(options["file"])
+        if not paths:
+            raise CommandError(f"No slow query log at {options['file']}.")
+        stats, plans, skipped = QueryStats(), {}, 0
+        for path in paths:
+            with open(path, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        entry = json.loads(line)
+                        stats.record(entry["fingerprint"], entry["sql"], float(entry["duration"]))
+                    except (ValueError, KeyError, TypeError):
+                        skipped += 1
+                        continue
+                    if entry.get("plan"):
+                        plans[entry["fingerprint"]] = entry["plan"]
+        if skipped:
+            self.stderr.write(f"Skipped {skipped} unreadable lines.")
+
+        for rank, statement in enumerate(stats.top(options["limit"], options["order"]), start=1):
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{rank}. {statement['fingerprint']}: {statement['count']} slow runs, "
+                f"{statement['total']:.1f} ms total, {statement['max']:.1f} ms max, {statement['mean']:.1f} ms mean"
+            ))
+            self.stdout.write(f"    {statement['sql']}")
+            if options["plans"]:
+                for step in plans.get(statement["fingerprint"], ["(no plan captured)"]):
+                    self.stdout.write(f"      {step}")
@@ -0,0 +1,313 @@
+"""
+In-process performance metrics.
+
+`RequestMetrics` collects the timings of the request being handled: the
+middleware makes it current for the request (in a context variable, so
+queries run from async views on worker threads are counted too), and the
+database, serializer and render hooks add to it.
+
+Finished requests are recorded into log-bucketed `Histogram`s per URL
+name. Each bucket is 10% wider than the previous one, so percentiles are
+accurate to within 10% in constant memory. Histograms are kept per process;
+with several worker processes, each reports the requests it served.
+"""
+import bisect
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from rest_framework.serializers import BaseSerializer
+
+# Bucket upper bounds, in milliseconds (or queries): 0, then from 0.01 up
+# to about 10 minutes, each 10% above the previous one.
+GROWTH = 1.1
+BOUNDS = [0.0] + [0.01 * GROWTH ** index for index in range(int(math.log(6e7) / math.log(GROWTH)) + 2)]
+
+# The metrics recorded for every request, in Server-Timing order.
+METRICS = ("total", "db", "queries", "serialize", "render")
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    The timings of one request.
+
+    Attributes:
+        path (str): The path of the request.
+        start (float): When the request started, from `time.perf_counter`.
+        total (float): The wall time of the request, in milliseconds.
+        db (float): The time spent running queries, in milliseconds.
+        queries (int): The number of queries run.
+        serialize (float): The time spent serializing data, in milliseconds.
+        render (float): The time spent rendering the response, in milliseconds.
+        active (set): The metrics being timed, so nested blocks are not
+                      counted twice.
+    """
+
+    def __init__(self, path=None):
+        """
+        Starts timing a request.
+
+        Args:
+            path (str, optional): The path of the request.
+        """
+        self.path = path
+        self.start = time.perf_counter()
+        self.total = self.db = self.serialize = self.render = 0.0
+        self.queries = 0
+        self.active = set()
+
+    def finish(self):
+        """
+        Stops timing the request.
+        """
+        self.total = (time.perf_counter() - self.start) * 1000
+
+    def as_dict(self):
+        """
+        Returns the recorded values.
+
+        Returns:
+            dict: The value of each metric.
+        """
+        return {name: getattr(self, name) for name in METRICS}
+
+    def server_timing(self):
+        """
+        Formats the timings as a `Server-Timing` header value.
+
+        Returns:
+            str: The header value.
+        """
+        return ", ".join([
+            f"total;dur={self.total:.1f}",
+            f'db;dur={self.db:.1f};desc="{self.queries} queries"',
+            f"serialize;dur={self.serialize:.1f}",
+            f"render;dur={self.render:.1f}",
+        ])
+
+
+def current():
+    """
+    Returns the metrics of the request being handled.
+
+    Returns:
+        RequestMetrics: The metrics, or None outside a request.
+    """
+    return _current.get()
+
+
+@contextmanager
+def measuring(metrics):
+    """
+    Makes the metrics current for the enclosed block.
+
+    Args:
+        metrics (RequestMetrics): The metrics of the request.
+
+    Yields:
+        RequestMetrics: The metrics.
+    """
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(name):
+    """
+    Adds the time spent in the enclosed block to a metric of the current
+    request, if any. Blocks nested in a block timing the same metric are
+    not counted again.
+
+    Args:
+        name (str): The metric, such as "serialize".
+
+    Yields:
+        None
+    """
+    metrics = _current.get()
+    if metrics is None or name in metrics.active:
+        yield
+        return
+    metrics.active.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.active.discard(name)
+        setattr(metrics, name, getattr(metrics, name) + (time.perf_counter() - start) * 1000)
+
+
+def time_query(execute, sql, params, many, context):
+    """
+    A database execute wrapper counting and timing the queries of the
+    current request.
+
+    Args:
+        execute (callable): The next wrapper, or the query execution.
+        sql (str): The SQL.
+        params (object): The query parameters.
+        many (bool): Whether this is an `executemany` call.
+        context (dict): The connection and cursor.
+
+    Returns:
+        object: The result of the execution.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db += (time.perf_counter() - start) * 1000
+        metrics.queries += 1
+
+
+def instrument_serializers():
+    """
+    Times `data` on every DRF serializer, where the representation of the
+    objects is built.
+    """
+    data = BaseSerializer.data
+    if getattr(data.fget, "timed", False):
+        return
+
+    @functools.wraps(data.fget)
+    def timed_data(serializer):
+        with timed("serialize"):
+            return data.fget(serializer)
+
+    timed_data.timed = True
+    BaseSerializer.data = property(timed_data)
+
+
+class Histogram:
+    """
+    A histogram of values in log-spaced buckets.
+
+    Attributes:
+        counts (list): The number of values in each bucket.
+        count (int): The number of values recorded.
+        total (float): The sum of the values.
+        max (float): The largest value.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty histogram.
+        """
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        """
+        Adds a value.
+
+        Args:
+            value (float): The value.
+        """
+        self.counts[bisect.bisect_left(BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        """
+        Estimates a percentile, as the upper bound of the bucket holding it.
+
+        Args:
+            fraction (float): The percentile, between 0 and 1.
+
+        Returns:
+            float: The estimated value, or None if the histogram is empty.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(BOUNDS[index] if index < len(BOUNDS) else self.max, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Summarizes the histogram.
+
+        Returns:
+            dict: The count, mean, p50, p95, p99 and max.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class Registry:
+    """
+    The histograms of every metric, per URL name.
+
+    Attributes:
+        histograms (dict): The histograms, by URL name and metric.
+        lock (Lock): Guards the histograms.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty registry.
+        """
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, metrics):
+        """
+        Records the metrics of a finished request.
+
+        Args:
+            name (str): The URL name of the request.
+            metrics (RequestMetrics): The request's metrics.
+        """
+        with self.lock:
+            histograms = self.histograms.get(name)
+            if histograms is None:
+                histograms = self.histograms[name] = {metric: Histogram() for metric in METRICS}
+            for metric, value in metrics.as_dict().items():
+                histograms[metric].record(value)
+
+    def summary(self):
+        """
+        Summarizes every histogram.
+
+        Returns:
+            dict: The summary of each metric, by URL name.
+        """
+        with self.lock:
+            return {
+                name: {metric: histogram.summary() for metric, histogram in histograms.items()}
+                for name, histograms in sorted(self.histograms.items())
+            }
+
+    def reset(self):
+        """
+        Drops every histogram.
+        """
+        with self.lock:
+            self.histograms = {}
+
+
+registry = Registry()
@@ -0,0 +1,111 @@
+"""
+Per-request performance instrumentation.
+"""
+import asyncio
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .metrics import RequestMetrics, current, measuring, registry
+
+
+class PerformanceMiddleware:
+    """
+    Measures every request and reports the timings.
+
+    The request's wall time, the number and duration of its queries, and
+    the time DRF spent serializing and rendering are sent in a
+    `Server-Timing` header, and recorded into the histograms of the
+    request's URL name. It should come first in `MIDDLEWARE`, so the time
+    spent in the rest of the chain is included. It runs natively in both
+    sync and async chains.
+
+    Attributes:
+        sync_capable (bool): The middleware runs in sync chains.
+        async_capable (bool): The middleware runs in async chains.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Initializes the middleware, switching to async mode when the next
+        handler in the chain is async.
+
+        Args:
+            get_response (callable): The next handler in the chain.
+
+        Raises:
+            MiddlewareNotUsed: If `PERFORMANCE_MONITORING` is off.
+        """
+        if not settings.PERFORMANCE_MONITORING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Like MiddlewareMixin: tells Django the instance is async.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+        else:
+            self._is_coroutine = None
+
+    def __call__(self, request):
+        """
+        Measures the request.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            HttpResponse: The response, or a coroutine in async mode.
+        """
+        if self._is_coroutine:
+            return self.__acall__(request)
+        with measuring(RequestMetrics(request.path)) as metrics:
+            response = self.get_response(request)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request):
+        with measuring(RequestMetrics(request.path)) as metrics:
+            response = await self.get_response(request)
+        return self.report(request, response, metrics)
+
+    def process_template_response(self, request, response):
+        """
+        Times the rendering of DRF responses, which Django renders after
+        this hook runs.
+
+        Args:
+            request (HttpRequest): The request object.
+            response (SimpleTemplateResponse): The unrendered response.
+
+        Returns:
+            SimpleTemplateResponse: The response.
+        """
+        metrics = current()
+        if metrics is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                metrics.render += (time.perf_counter() - start) * 1000
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def report(self, request, response, metrics):
+        """
+        Adds the `Server-Timing` header and records the request.
+
+        Args:
+            request (HttpRequest): The request object.
+            response (HttpResponse): The response.
+            metrics (RequestMetrics): The request's timings.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        metrics.finish()
+        response["Server-Timing"] = metrics.server_timing()
+        match = request.resolver_match
+        if match is not None and match.view_name:
+            registry.record(match.view_name, metrics)
+        return response
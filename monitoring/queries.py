@@ -0,0 +1,220 @@
+"""
+Query fingerprints and the slow query log.
+
+Every query is reduced to a fingerprint: its SQL with literals and
+placeholders replaced by `?` and `IN` lists collapsed, so the same ORM
+query made with different values is counted as one statement. The count,
+total and maximum time of each fingerprint are kept in process.
+
+Queries taking at least `SLOW_QUERY_MS` milliseconds are also written, as
+JSON lines, to the `monitoring.slow_queries` logger, which `settings`
+sends to a rotating file. The first slow run of each `SELECT` fingerprint
+in a process is logged with its `EXPLAIN` plan. Parameters are never
+logged. `python manage.py top_queries` summarizes the log.
+"""
+import functools
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from .metrics import current, time_query
+
+logger = logging.getLogger("monitoring.slow_queries")
+
+# The orders in which statements can be ranked.
+ORDERS = ("total", "max", "count")
+
+# How many fingerprints are remembered as explained before starting over.
+MAX_EXPLAINED = 10000
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"$.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+_explained = set()
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(sql):
+    """
+    Normalizes a query, so that runs with different values match.
+
+    Args:
+        sql (str): The SQL.
+
+    Returns:
+        tuple: A short hash identifying the statement, and the normalized SQL.
+    """
+    statement = _STRING.sub("?", sql)
+    statement = _NUMBER.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _IN_LIST.sub("IN (...)", statement)
+    statement = _SPACE.sub(" ", statement).strip()
+    return hashlib.md5(statement.encode("utf-8")).hexdigest()[:12], statement
+
+
+class QueryStats:
+    """
+    The count, total and maximum time of each statement.
+
+    Attributes:
+        statements (dict): The statistics, by fingerprint.
+        lock (Lock): Guards the statistics.
+    """
+
+    def __init__(self):
+        """
+        Creates empty statistics.
+        """
+        self.statements = {}
+        self.lock = threading.Lock()
+
+    def record(self, key, sql, duration):
+        """
+        Records a run of a statement.
+
+        Args:
+            key (str): The statement's fingerprint.
+            sql (str): The normalized SQL.
+            duration (float): The run time, in milliseconds.
+        """
+        with self.lock:
+            stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = {"fingerprint": key, "sql": sql, "count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+
+    def top(self, limit=20, order="total"):
+        """
+        Ranks the statements.
+
+        Args:
+            limit (int): The number of statements to return.
+            order (str): Rank by "total" time, "max" time or "count".
+
+        Returns:
+            list: The statistics of the top statements, with their mean time.
+        """
+        with self.lock:
+            ranked = sorted(self.statements.values(), key=lambda stats: stats[order], reverse=True)[:limit]
+            return [dict(stats, mean=stats["total"] / stats["count"]) for stats in ranked]
+
+    def reset(self):
+        """
+        Drops the statistics.
+        """
+        with self.lock:
+            self.statements = {}
+
+
+query_stats = QueryStats()
+
+
+def explain(connection, sql, params):
+    """
+    Reads the plan of a query, on a cursor of its own so the query's
+    results are left alone, and in a savepoint so a failed EXPLAIN does
+    not abort the transaction the query ran in.
+
+    Args:
+        connection (BaseDatabaseWrapper): The connection the query ran on.
+        sql (str): The SQL.
+        params (object): The query parameters.
+
+    Returns:
+        list: The lines of the plan, or None if the database cannot
+              explain the query.
+    """
+    try:
+        with transaction.atomic(using=connection.alias, savepoint=True):
+            # A bare database cursor, so the EXPLAIN is not timed or logged itself.
+            cursor = connection.create_cursor()
+            try:
+                with connection.wrap_database_errors:
+                    cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+                    return [str(row[-1]) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+    except DatabaseError:
+        return None
+
+
+def log_slow_query(key, statement, sql, params, many, connection, duration):
+    """
+    Writes a slow query to the slow query log, explaining it if its
+    fingerprint has not been explained yet.
+
+    Args:
+        key (str): The query's fingerprint.
+        statement (str): The normalized SQL.
+        sql (str): The SQL.
+        params (object): The query parameters.
+        many (bool): Whether this was an `executemany` call.
+        connection (BaseDatabaseWrapper): The connection the query ran on.
+        duration (float): The run time, in milliseconds.
+    """
+    plan = None
+    if not many and key not in _explained and statement[:6].upper() == "SELECT":
+        if len(_explained) >= MAX_EXPLAINED:
+            _explained.clear()
+        _explained.add(key)
+        plan = explain(connection, sql, params)
+    metrics = current()
+    logger.info(json.dumps({
+        "time": timezone.now().isoformat(),
+        "fingerprint": key,
+        "sql": statement,
+        "duration": round(duration, 3),
+        "path": metrics.path if metrics is not None else None,
+        "plan": plan,
+    }))
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    A database execute wrapper recording the statistics of every query and
+    logging slow ones.
+
+    Args:
+        execute (callable): The next wrapper, or the query execution.
+        sql (str): The SQL.
+        params (object): The query parameters.
+        many (bool): Whether this is an `executemany` call.
+        context (dict): The connection and cursor.
+
+    Returns:
+        object: The result of the execution.
+    """
+    start = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration = (time.perf_counter() - start) * 1000
+    key, statement = fingerprint(sql)
+    query_stats.record(key, statement, duration)
+    if duration >= settings.SLOW_QUERY_MS:
+        log_slow_query(key, statement, sql, params, many, context["connection"], duration)
+    return result
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """
+    Times, fingerprints and logs the queries of a database connection.
+    Connected to `connection_created`.
+
+    Args:
+        sender (class): The database wrapper class.
+        connection (BaseDatabaseWrapper): The new connection.
+    """
+    for position, wrapper in enumerate((time_query, record_query)):
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.insert(position, wrapper)
@@ -0,0 +1,60 @@
+from django.contrib.auth.hashers import identify_hasher
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from ..utils.setup import APITestSetup
+from authentication import hashers
+from authentication.models import CustomUser
+
+LOGIN = {"email": "test@test.com", "password": "testpassword1"}
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class PasswordHashingTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.user = self.create_test_user()
+        return super().setUp()
+
+    def iterations(self):
+        self.user.refresh_from_db()
+        return int(self.user.password.split("$")[1])
+
+    def test_passwords_use_configured_iterations(self):
+        self.assertIsInstance(identify_hasher(self.user.password), hashers.TunablePBKDF2PasswordHasher)
+        self.assertEqual(self.iterations(), 1000)
+
+    def test_login_rehashes_when_iterations_change(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1500):
+            res = self.client.post(reverse("token_obtain_pair"), LOGIN)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.iterations(), 1500)
+
+    @override_settings(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE=0, PASSWORD_HASH_QUEUE_TIMEOUT=0)
+    def test_saturated_pool_returns_503(self):
+        pool = hashers.get_pool()
+        pool.slots.acquire()
+        try:
+            res = self.client.post(reverse("token_obtain_pair"), LOGIN)
+            self.assertEqual(res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertEqual(res["Retry-After"], "1")
+            res = self.client.post(reverse("create-account"), {
+                "email": "new@test.com", "password": "testpassword1", "password2": "testpassword1",
+            })
+            self.assertEqual(res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        finally:
+            pool.slots.release()
+        self.assertFalse(CustomUser.objects.filter(email="new@test.com").exists())
+        self.assertEqual(self.client.post(reverse("token_obtain_pair"), LOGIN).status_code, status.HTTP_200_OK)
+
+    @override_settings(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE=0, PASSWORD_HASH_QUEUE_TIMEOUT=0)
+    def test_saturated_pool_outside_the_api_is_not_an_api_error(self):
+        pool = hashers.get_pool()
+        pool.slots.acquire()
+        try:
+            with self.assertRaises(hashers.HashingPoolSaturated) as raised:
+                self.user.check_password("testpassword1")
+        finally:
+            pool.slots.release()
+        self.assertNotIsInstance(raised.exception, APIException)
@@ -0,0 +1,124 @@
+from django.contrib.auth.models import update_last_login
+from django.core.checks import run_checks
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from ..utils.setup import APITestSetup
+from authentication import tokens as auth_tokens
+from authentication.models import HostUserProfile
+from authentication.tokens import ClaimsRefreshToken, ClaimsUser
+from event_portal.models import Category
+
+
+class StatelessJWTTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.user = self.create_test_user()
+        return super().setUp()
+
+    def login(self):
+        res = self.client.post(reverse("token_obtain_pair"), {"email": "test@test.com", "password": "testpassword1"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.json()
+
+    def authenticate(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def test_login_tokens_carry_user_claims(self):
+        access = AccessToken(self.login()["access"])
+        self.assertEqual(access["email"], "test@test.com")
+        self.assertFalse(access["is_staff"])
+        self.assertFalse(access["event_hoster"])
+
+    def test_claims_skip_the_user_query(self):
+        self.authenticate(self.login()["access"])
+        # The page count and the orders, but no user lookup.
+        with self.assertMaxQueries(2):
+            res = self.client.get(reverse("my-orders"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(res.wsgi_request.user, ClaimsUser)
+
+    def test_claims_user_loads_the_full_user_lazily(self):
+        user = ClaimsUser(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user, self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.date_joined, self.user.date_joined)
+            self.assertEqual(user.last_name, self.user.last_name)
+
+    def test_logout_revokes_tokens(self):
+        tokens = self.login()
+        self.authenticate(tokens["access"])
+        res = self.client.post(reverse("logout"), {"refresh": tokens["refresh"]})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(reverse("my-orders")).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        res = self.client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        tokens = self.login()
+        self.user.is_active = False
+        self.user.save()
+        self.authenticate(tokens["access"])
+        self.assertEqual(self.client.get(reverse("my-orders")).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        res = self.client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_changes_apply_before_tokens_expire(self):
+        tokens = self.login()
+        HostUserProfile.objects.create(user=self.user, company_name="Hosts Inc")
+        self.authenticate(tokens["access"])
+        res = self.client.get(reverse("my-orders"))
+        self.assertTrue(res.wsgi_request.user.event_hoster)
+        self.client.credentials()
+        res = self.client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        self.assertTrue(AccessToken(res.json()["access"])["event_hoster"])
+
+    def test_claims_user_can_write(self):
+        self.authenticate(self.login()["access"])
+        res = self.client.post(reverse("create-event"), {
+            "title": "Claims Conference", "event_start_date": "2030-10-30", "event_start_time": "12:00:00",
+            "event_end_date": "2030-11-01", "event_end_time": "06:00:00", "location": "Lagos", "about": "Talks",
+            "category": [Category.objects.create(name="Technology").pk],
+        })
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.json()["data"]["host"], "test@test.com")
+        res = self.client.patch(reverse("event-detail", args=["claims-conference"]), {"location": "Abuja"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def assertTrustsClaims(self, access, trusted=True):
+        self.authenticate(access)
+        res = self.client.get(reverse("my-orders"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(isinstance(res.wsgi_request.user, ClaimsUser), trusted)
+
+    def test_logins_do_not_make_their_tokens_stale(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1500):
+            # The password is rehashed with the new iteration count.
+            access = self.login()["access"]
+        update_last_login(None, self.user)
+        self.assertTrustsClaims(access)
+
+    def test_tokens_issued_right_after_a_change_are_trusted(self):
+        auth_tokens.mark_user_changed(self.user.pk)
+        self.assertTrustsClaims(str(ClaimsRefreshToken.for_user(self.user).access_token))
+
+    def test_password_changes_make_tokens_stale(self):
+        access = self.login()["access"]
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertTrustsClaims(access)
+        self.user.set_password("newpassword1")
+        self.user.save()
+        self.assertTrustsClaims(access, trusted=False)
+
+    def test_deploy_check_warns_about_a_process_local_token_cache(self):
+        warnings = [message.id for message in run_checks(include_deployment_checks=True)]
+        self.assertIn("authentication.W001", warnings)
+        shared = {"tokens": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "tokens"}}
+        with self.settings(CACHES=shared):
+            warnings = [message.id for message in run_checks(include_deployment_checks=True)]
+        self.assertNotIn("authentication.W001", warnings)
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.models import Category
+from TicketingSystem.middleware import AsyncWhiteNoiseMiddleware
+
+
+class AsyncReadAPITestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        self.music = Category.objects.create(name="Music")
+        self.technology = Category.objects.create(name="Technology")
+        for number in range(10):
+            create_test_event(f"Festival {number}", host=self.host, categories=[self.music, self.technology],
+                              location="Abuja" if number % 2 else "Lagos")
+        return super().setUp()
+
+    def normalize(self, body):
+        for event in body['data'].get('results', [body['data']]):
+            if 'category' in event:
+                event['category'] = sorted(event['category'])
+        return body
+
+    async def assertSameResponse(self, name, args=(), **params):
+        sync = await sync_to_async(self.client.get)(reverse(name, args=args), params)
+        res = await self.async_client.get(reverse(f"async:{name}", args=args), params)
+        self.assertEqual(res.status_code, sync.status_code)
+        # Page links point at the API they were served from.
+        body = json.loads(res.content.decode().replace("/api/async/events/", "/api/events/"))
+        self.assertEqual(self.normalize(body), self.normalize(sync.json()))
+        return res
+
+    async def test_event_list_matches_the_sync_api(self):
+        res = await self.assertSameResponse('events-list')
+        self.assertEqual(res.json()['data']['count'], 10)
+        self.assertIsNotNone(res.json()['data']['next'])
+        await self.assertSameResponse('events-list', page=2)
+        await self.assertSameResponse('events-list', location="Abuja", ordering="event_start_date")
+        await self.assertSameResponse('events-list', search="festival", **{"max-size": 3})
+
+    async def test_event_list_errors(self):
+        res = await self.assertSameResponse('events-list', page=9)
+        self.assertEqual(res.json()['status'], "Error")
+        await self.assertSameResponse('events-list', event_start_date_after="not a date")
+
+    async def test_event_detail_matches_the_sync_api(self):
+        await self.assertSameResponse('event-detail', args=["festival-3"])
+        res = await self.assertSameResponse('event-detail', args=["missing"])
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_category_list_matches_the_sync_api(self):
+        await self.assertSameResponse('category-list')
+
+    async def test_fieldsets_match_the_sync_api(self):
+        await self.assertSameResponse('events-list', fields="card", omit="slug")
+        await self.assertSameResponse('event-detail', args=["festival-3"], fields="title,host")
+        res = await self.assertSameResponse('events-list', fields="unknown")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_cached_event_list(self):
+        # The count, the events with their hosts, and their categories.
+        async with self.assertMaxQueriesAsync(3):
+            await self.async_client.get(reverse('async:events-list'))
+        async with self.assertMaxQueriesAsync(0):
+            res = await self.async_client.get(reverse('async:events-list'))
+        self.assertEqual(res.json()['data']['count'], 10)
+
+    async def test_cached_links_follow_the_scheme(self):
+        await self.async_client.get(reverse('async:events-list'))
+        res = await self.async_client.get(reverse('async:events-list'), secure=True)
+        self.assertTrue(res.json()['data']['next'].startswith("https://testserver/"))
+
+    def test_static_middleware_runs_natively_in_async_chains(self):
+        async def view(request):
+            return None
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncWhiteNoiseMiddleware(view)))
+        self.assertFalse(asyncio.iscoroutinefunction(AsyncWhiteNoiseMiddleware(lambda request: None)))
+
@@ -0,0 +1,72 @@
+from ..utils.setup import APITestSetup, create_test_event
+from django.urls import reverse
+from rest_framework import status
+from event_portal.models import Category
+
+
+class ResponseCacheTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_superuser()
+        self.category = Category.objects.create(name="Technology")
+        self.event = create_test_event("Cached event", host=self.host, categories=[self.category])
+        return super().setUp()
+
+    def test_repeated_get_is_served_without_queries(self):
+        url = reverse('event-detail', args=[self.event.slug])
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data']['title'], "Cached event")
+
+    def test_query_string_is_part_of_the_key(self):
+        url = reverse('events-list')
+        self.assertEqual(len(self.client.get(url).json()['data']['results']), 1)
+        res = self.client.get(url + "?location=Abuja")
+        self.assertEqual(len(res.json()['data']['results']), 0)
+
+    def test_scheme_and_host_are_part_of_the_key(self):
+        url = reverse('events-list') + "?max-size=1"
+        create_test_event("Second event")
+        self.assertTrue(self.client.get(url).json()['data']['next'].startswith("http://testserver/"))
+        res = self.client.get(url, secure=True)
+        self.assertTrue(res.json()['data']['next'].startswith("https://testserver/"))
+        with self.settings(ALLOWED_HOSTS=["testserver", "events.example.com"]):
+            res = self.client.get(url, HTTP_HOST="events.example.com")
+        self.assertTrue(res.json()['data']['next'].startswith("http://events.example.com/"))
+
+    def test_event_save_invalidates_detail_and_lists(self):
+        detail = reverse('event-detail', args=[self.event.slug])
+        by_category = reverse('events-by-category', args=[self.category.slug])
+        self.client.get(detail)
+        self.client.get(by_category)
+        self.event.location = "Abuja"
+        self.event.save()
+        self.assertEqual(self.client.get(detail).json()['data']['location'], "Abuja")
+        results = self.client.get(by_category).json()['data']['results']
+        self.assertEqual(results[0]['location'], "Abuja")
+
+    def test_category_relation_change_invalidates_category_events(self):
+        music = Category.objects.create(name="Music")
+        url = reverse('events-by-category', args=[music.slug])
+        self.assertEqual(len(self.client.get(url).json()['data']['results']), 0)
+        self.event.category.add(music)
+        self.assertEqual(len(self.client.get(url).json()['data']['results']), 1)
+        self.event.category.clear()
+        self.assertEqual(len(self.client.get(url).json()['data']['results']), 0)
+
+    def test_category_delete_invalidates_list_and_event_detail(self):
+        category_list = reverse('category-list')
+        detail = reverse('event-detail', args=[self.event.slug])
+        self.assertEqual(self.client.get(category_list).json()['data']['count'], 1)
+        self.assertEqual(len(self.client.get(detail).json()['data']['category']), 1)
+        self.category.delete()
+        self.assertEqual(self.client.get(category_list).json()['data']['count'], 0)
+        self.assertEqual(self.client.get(detail).json()['data']['category'], [])
+
+    def test_event_delete_invalidates_detail(self):
+        detail = reverse('event-detail', args=[self.event.slug])
+        self.client.get(detail)
+        self.event.delete()
+        self.assertEqual(self.client.get(detail).status_code, status.HTTP_404_NOT_FOUND)
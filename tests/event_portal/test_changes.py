@@ -0,0 +1,80 @@
+from datetime import timedelta
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.changes import changes_since
+from event_portal.models import Category, Tombstone
+
+
+@override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+class ChangeFeedTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.music = Category.objects.create(name="Music")
+        self.jazz = create_test_event("Jazz Night", categories=[self.music])
+        self.summit = create_test_event("Data Summit")
+        return super().setUp()
+
+    def feed(self, **params):
+        res = self.client.get(reverse('changes'), params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.json()['data']
+
+    def test_feed_pages_through_every_change_once(self):
+        seen, watermark = [], None
+        while True:
+            page = self.feed(limit=2, **({"watermark": watermark} if watermark else {}))
+            seen += [(change['kind'], change['data'].get('slug')) for change in page['changes']]
+            watermark = page['watermark']
+            if not page['has_more']:
+                break
+        self.assertCountEqual(seen, [("category", "music"), ("event", "jazz-night"), ("event", "data-summit")])
+        self.assertEqual(self.feed(watermark=watermark)['changes'], [])
+        self.assertEqual(self.feed(watermark=watermark)['watermark'], watermark)
+
+    def test_feed_reports_updates_and_deletions(self):
+        watermark = self.feed()['watermark']
+        self.summit.location = "Abuja"
+        self.summit.save()
+        self.music.delete()
+        page = self.feed(watermark=watermark)
+        changes = [(change['kind'], change['deleted'], change['data']['slug']) for change in page['changes']]
+        self.assertEqual(changes, [
+            ("event", False, "data-summit"), ("category", True, "music"), ("event", False, "jazz-night"),
+        ])
+        self.assertEqual(page['changes'][0]['data']['location'], "Abuja")
+        self.assertEqual(page['changes'][2]['data']['category'], [])
+        watermark, summit_id = page['watermark'], self.summit.pk
+        self.summit.delete()
+        page = self.feed(watermark=watermark)
+        self.assertEqual(page['changes'], [{
+            "kind": "event", "id": str(summit_id), "deleted": True,
+            "last_updated": page['changes'][0]['last_updated'], "data": {"slug": "data-summit"},
+        }])
+        self.assertEqual(Tombstone.objects.count(), 2)
+
+    def test_category_changes_mark_events_updated(self):
+        watermark = self.feed()['watermark']
+        self.summit.category.add(self.music)
+        page = self.feed(watermark=watermark)
+        self.assertEqual([change['data']['slug'] for change in page['changes']], ["data-summit"])
+        self.music.event_set.clear()
+        page = self.feed(watermark=page['watermark'])
+        self.assertCountEqual([change['data']['slug'] for change in page['changes']], ["data-summit", "jazz-night"])
+
+    def test_recent_changes_are_held_back(self):
+        with self.settings(CHANGE_FEED_SETTLE_SECONDS=60):
+            self.assertEqual(changes_since()['changes'], [])
+        later = timezone.now() + timedelta(seconds=61)
+        with self.settings(CHANGE_FEED_SETTLE_SECONDS=60):
+            self.assertEqual(len(changes_since(now=later)['changes']), 3)
+
+    def test_feed_reads_one_query_per_table(self):
+        with self.assertMaxQueries(4):
+            self.feed()
+
+    def test_invalid_watermark(self):
+        res = self.client.get(reverse('changes'), {"watermark": "nonsense"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,89 @@
+from unittest import mock
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.api.cache import get_api_cache
+from event_portal.api.views import EventAPIViewset
+from event_portal.models import Category, Event
+
+
+class ConditionalGetTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.music = Category.objects.create(name="Music")
+        self.event = create_test_event("Jazz Night", categories=[self.music])
+        return super().setUp()
+
+    def test_event_detail_not_modified(self):
+        url = reverse('event-detail', args=[self.event.slug])
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("no-cache", res["Cache-Control"])
+        etag, last_modified = res["ETag"], res["Last-Modified"]
+        with self.assertMaxQueries(1):
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag, nocache=1)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+        # A cached response is revalidated without touching the database.
+        with self.assertMaxQueries(0):
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified, nocache=2)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.event.about = "Changed"
+        self.event.save()
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.json()['data']['about'], "Changed")
+
+    def test_detail_is_only_revalidated_within_the_queryset(self):
+        url = reverse('event-detail', args=[self.event.slug])
+        etag = self.client.get(url)["ETag"]
+        upcoming = Event.objects.filter(expired=False)
+        with mock.patch.object(EventAPIViewset, "get_queryset", lambda view: upcoming):
+            Event.objects.filter(pk=self.event.pk).update(expired=True)
+            get_api_cache().clear()
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_category_detail_not_modified(self):
+        url = reverse('category-detail', args=[self.music.slug])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_event_list_etag_follows_the_filter_set(self):
+        url = reverse('events-list')
+        res = self.client.get(url, {"location": "Lagos"})
+        etag = res["ETag"]
+        self.assertNotIn("Last-Modified", res)
+        res = self.client.get(url, {"location": "Lagos"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        other = create_test_event("Opera Gala", location="Abuja")
+        res = self.client.get(url, {"location": "Lagos"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        other.location = "Lagos"
+        other.save()
+        res = self.client.get(url, {"location": "Lagos"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data']['count'], 2)
+        etag = res["ETag"]
+        other.delete()
+        res = self.client.get(url, {"location": "Lagos"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data']['count'], 1)
+
+    def test_category_events_not_modified(self):
+        url = reverse('events-by-category', args=[self.music.slug])
+        etag = self.client.get(url, {"nocache": 1})["ETag"]
+        # Answered from the validators cached with the response.
+        with self.assertMaxQueries(0):
+            res = self.client.get(url, {"nocache": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cursor_pages_have_no_validators(self):
+        res = self.client.get(reverse('events-list'), {"pagination": "cursor"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", res)
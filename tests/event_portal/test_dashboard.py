@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from authentication.tokens import ClaimsRefreshToken
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.expiry import expire_events
+from event_portal.models import Category, Event, Ticket
+
+User = get_user_model()
+
+
+class HostDashboardTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = User.objects.create_user(email="host@test.com", password="testpassword1", event_hoster=True)
+        self.other = User.objects.create_user(email="other@test.com", password="testpassword1", event_hoster=True)
+        self.music = Category.objects.create(name="Music")
+        self.technology = Category.objects.create(name="Technology")
+        self.jazz = create_test_event("Jazz Night", host=self.host, categories=[self.music], days_ahead=5)
+        create_test_event("Code Camp", host=self.host, categories=[self.music, self.technology], days_ahead=40)
+        create_test_event("Old Gig", host=self.host, categories=[self.music], days_ahead=-10)
+        create_test_event("Elsewhere", host=self.other, categories=[self.technology])
+        Ticket.objects.create(event=self.jazz, ticket_type="Regular", ticket_price=1000, capacity=100)
+        Ticket.objects.create(event=Event.objects.get(title="Code Camp"), ticket_type="Regular",
+                              ticket_price=3000, capacity=50)
+        Ticket.objects.create(event=self.jazz, ticket_type="VIP", ticket_price=9000, capacity=10)
+        self.authenticate(self.host)
+        return super().setUp()
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {ClaimsRefreshToken.for_user(user).access_token}")
+
+    def get(self, **params):
+        res = self.client.get(reverse('host-dashboard'), params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.json()['data']
+
+    def test_dashboard_aggregates(self):
+        with self.assertMaxQueries(4):
+            data = self.get()
+        self.assertEqual(data['totals'], {
+            "upcoming_count": 2, "expired_count": 1, "next_start_date": (date.today() + timedelta(days=5)).isoformat(),
+        })
+        self.assertEqual(
+            [(row['name'], row['upcoming_count'], row['expired_count']) for row in data['by_category']],
+            [("Music", 2, 1), ("Technology", 1, 0)],
+        )
+        self.assertEqual(sum(row['upcoming_count'] + row['expired_count'] for row in data['start_dates']), 3)
+        self.assertTrue(all(row['period'].endswith("-01") for row in data['start_dates']))
+        self.assertEqual(data['tickets'], [
+            {"ticket_type": "Regular", "events": 2, "min_price": 1000.0, "max_price": 3000.0,
+             "average_price": 2000.0, "capacity": 150},
+            {"ticket_type": "VIP", "events": 1, "min_price": 9000.0, "max_price": 9000.0,
+             "average_price": 9000.0, "capacity": 10},
+        ])
+
+    def test_intervals(self):
+        days = self.get(interval="day")['start_dates']
+        self.assertEqual(len(days), 3)
+        res = self.client.get(reverse('host-dashboard'), {"interval": "hour"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_dashboards_are_cached_per_host(self):
+        self.get()
+        with self.assertMaxQueries(0):
+            self.get()
+        self.authenticate(self.other)
+        self.assertEqual(self.get()['totals']['upcoming_count'], 1)
+
+    def test_host_writes_invalidate_the_dashboard(self):
+        self.get()
+        create_test_event("Rock Night", host=self.host, categories=[self.technology])
+        self.assertEqual(self.get()['totals']['upcoming_count'], 3)
+        Ticket.objects.create(event=self.jazz, ticket_type="Table", ticket_price=50000, capacity=5)
+        self.assertEqual(len(self.get()['tickets']), 3)
+        self.jazz.category.add(self.technology)
+        self.assertEqual(self.get()['by_category'][1]['upcoming_count'], 3)
+        Event.objects.filter(pk=self.jazz.pk).update(event_end_date=date.today() - timedelta(days=1))
+        expire_events()
+        self.assertEqual(self.get()['totals']['expired_count'], 2)
+        self.jazz.delete()
+        self.assertEqual(self.get()['totals']['expired_count'], 1)
+
+    def test_other_hosts_writes_keep_the_dashboard(self):
+        self.get()
+        create_test_event("Far Away", host=self.other)
+        with self.assertMaxQueries(0):
+            self.get()
+
+    def test_only_hosts_see_a_dashboard(self):
+        attendee = User.objects.create_user(email="attendee@test.com", password="testpassword1")
+        self.authenticate(attendee)
+        res = self.client.get(reverse('host-dashboard'))
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.client.credentials()
+        res = self.client.get(reverse('host-dashboard'))
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,107 @@
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from ..utils.setup import APITestSetup, TestSetup, create_test_event
+from event_portal.expiry import ended_events, expire_events, run_sweeper
+from event_portal.models import CategorySummary, Event
+
+
+def end_event(event, end_date, end_time="18:00:00"):
+    # Bypass Event.save, which would mark the event expired itself.
+    Event.objects.filter(pk=event.pk).update(event_end_date=end_date, event_end_time=end_time)
+
+
+class EventExpiryTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = create_test_event("Harvest Fair")
+
+    def test_save_keeps_expired_in_step_with_the_end(self):
+        past = create_test_event("Old Fair", days_ahead=-3)
+        self.assertTrue(past.expired)
+        past.event_end_date = date.today() + timedelta(days=2)
+        past.save()
+        self.assertFalse(past.expired)
+        self.assertFalse(self.event.expired)
+
+    def test_expire_events_flips_ended_events_once(self):
+        end_event(self.event, date.today() - timedelta(days=1))
+        create_test_event("Future Fair")
+        self.assertEqual(expire_events(batch_size=1), 1)
+        self.assertEqual(expire_events(), 0)
+        self.event.refresh_from_db()
+        self.assertTrue(self.event.expired)
+
+    def test_event_ending_today_uses_end_time(self):
+        now = timezone.make_aware(datetime.combine(date.today(), time(12, 0)))
+        end_event(self.event, date.today(), "13:00:00")
+        self.assertFalse(ended_events(now).exists())
+        end_event(self.event, date.today(), "11:59:00")
+        self.assertEqual(expire_events(now=now), 1)
+
+    def test_command_reports_events_expired(self):
+        end_event(self.event, date.today() - timedelta(days=1))
+        out = StringIO()
+        call_command("expire_events", stdout=out)
+        self.assertIn("Marked 1 events expired", out.getvalue())
+
+    def test_sweeper_runs_repeatedly(self):
+        reports = []
+        end_event(self.event, date.today() - timedelta(days=1))
+        run_sweeper(0, report=lambda expired, duration: reports.append(expired), sweeps=2)
+        self.assertEqual(reports, [1, 0])
+
+
+class ExpiredEventListTestCase(APITestSetup):
+
+    def test_expired_events_leave_cached_lists(self):
+        event = create_test_event("Harvest Fair")
+        url = reverse('events-list')
+        self.assertEqual(self.client.get(url).json()['data']['count'], 1)
+        end_event(event, date.today() - timedelta(days=1))
+        expire_events()
+        self.assertEqual(self.client.get(url).json()['data']['count'], 0)
+        self.assertEqual(self.client.get(reverse('event-detail', args=[event.slug])).json()['data']['expired'], True)
+
+
+class ExpireEndedEventsMigrationTestCase(TransactionTestCase):
+    migrate_from = [("event_portal", "0030_event_pending_expiry_idx")]
+
+    def setUp(self) -> None:
+        for cache in caches.all():
+            cache.clear()
+        executor = MigrationExecutor(connection)
+        self.latest = executor.loader.graph.leaf_nodes("event_portal")
+        executor.migrate(self.migrate_from)
+        self.apps = executor.loader.project_state(self.migrate_from).apps
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        MigrationExecutor(connection).migrate(self.latest)
+        return super().tearDown()
+
+    def test_events_ended_before_the_migration_stay_hidden(self):
+        Category = self.apps.get_model("event_portal", "Category")
+        OldEvent = self.apps.get_model("event_portal", "Event")
+        music = Category.objects.create(name="Music", slug="music")
+        for title, days_ahead in [("Old Fair", -3), ("Harvest Fair", 3)]:
+            start = date.today() + timedelta(days=days_ahead)
+            event = OldEvent.objects.create(
+                title=title, slug=title.lower().replace(" ", "-"), location="Lagos", expired=False,
+                event_start_date=start, event_end_date=start, event_start_time="12:00", event_end_time="18:00",
+            )
+            event.category.add(music)
+        MigrationExecutor(connection).migrate(self.latest)
+        self.assertTrue(Event.objects.get(title="Old Fair").expired)
+        self.assertFalse(Event.objects.get(title="Harvest Fair").expired)
+        results = APIClient().get(reverse('events-list')).json()['data']['results']
+        self.assertEqual([event['title'] for event in results], ["Harvest Fair"])
+        self.assertEqual(CategorySummary.objects.get(category__slug="music").upcoming_count, 1)
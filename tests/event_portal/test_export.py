@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.api.views import EventExportView
+from event_portal.expiry import expire_events
+from event_portal.importer import import_events, read_csv
+from event_portal.models import Category, Event
+
+
+class EventExportTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        self.music = Category.objects.create(name="Music")
+        self.technology = Category.objects.create(name="Technology")
+        create_test_event("Jazz Night", host=self.host, categories=[self.music])
+        create_test_event("Data Summit", host=self.host, categories=[self.music, self.technology], location="Abuja")
+        return super().setUp()
+
+    def export(self, **params):
+        res = self.client.get(reverse('export-events'), params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res, b"".join(res.streaming_content).decode()
+
+    def test_ndjson_export(self):
+        res, body = self.export()
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['title'] for row in rows], ["Jazz Night", "Data Summit"])
+        self.assertEqual(len(rows[1]['category']), 2)
+        self.assertEqual(rows[0]['host'], str(self.host))
+
+    def test_export_applies_filters_and_search(self):
+        _, body = self.export(location="Abuja")
+        self.assertEqual([json.loads(line)['title'] for line in body.splitlines()], ["Data Summit"])
+        _, body = self.export(search="jazz")
+        self.assertEqual([json.loads(line)['title'] for line in body.splitlines()], ["Jazz Night"])
+        res = self.client.get(reverse('export-events'), {"event_start_date_after": "not a date"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_csv_export_round_trips_through_the_importer(self):
+        res, body = self.export(format="csv")
+        self.assertEqual(res["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            row['title'] += " Again"
+        lines = StringIO()
+        writer = csv.DictWriter(lines, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+        lines.seek(0)
+        result = import_events(read_csv(lines), self.host)
+        self.assertEqual(result, {"created": 2, "errors": []})
+        self.assertEqual(Event.objects.get(slug="data-summit-again").category.count(), 2)
+
+    def test_incremental_export(self):
+        res, _ = self.export()
+        until = res["X-Export-Until"]
+        _, body = self.export(since=until)
+        self.assertEqual(body, "")
+        Event.objects.filter(slug="jazz-night").update(event_end_date="2020-01-01", event_start_date="2020-01-01")
+        expire_events()
+        create_test_event("Opera Gala")
+        _, body = self.export(since=until)
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([(row['title'], row['expired']) for row in rows], [("Jazz Night", True), ("Opera Gala", False)])
+        res = self.client.get(reverse('export-events'), {"since": "yesterday"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_reads_in_chunks(self):
+        for number in range(5):
+            create_test_event(f"Extra {number}", categories=[self.music])
+        # One query for the events, and one per chunk of 2 for their categories.
+        with mock.patch.object(EventExportView, "chunk_size", 2), self.assertMaxQueries(1 + 4):
+            res = self.client.get(reverse('export-events'))
+            lines = b"".join(res.streaming_content).splitlines()
+        self.assertEqual(len(lines), 7)
+
+    def test_export_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.csv")
+            err = StringIO()
+            call_command("export_events", "--format", "csv", "--filter", "category__name=Music",
+                         "--output", path, stderr=err)
+            with open(path, newline="", encoding="utf-8") as lines:
+                self.assertEqual(len(list(csv.DictReader(lines))), 2)
+        self.assertIn("updated up to", err.getvalue())
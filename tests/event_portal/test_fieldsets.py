@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.api.fieldsets import resolve_fieldset
+from event_portal.api.serializers import EventSerializer
+from event_portal.models import Category
+
+CARD = [
+    "title", "event_start_date", "event_start_time", "event_end_date",
+    "event_end_time", "location", "slug",
+]
+
+
+class SparseFieldsetTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.music = Category.objects.create(name="Music")
+        self.host = self.create_test_user()
+        for number in range(3):
+            create_test_event(f"Festival {number}", host=self.host, categories=[self.music])
+        return super().setUp()
+
+    def results(self, url, **params):
+        res = self.client.get(url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.json()['data']['results']
+
+    def test_card_preset_reads_only_its_columns(self):
+        # The page count, and the events without their hosts or categories.
+        with self.assertMaxQueries(2), CaptureQueriesContext(connection) as queries:
+            events = self.results(reverse('events-list'), fields="card")
+        self.assertEqual([list(event) for event in events], [CARD] * 3)
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertNotIn('"about"', page_query)
+        self.assertNotIn('"address"', page_query)
+
+    def test_fields_presets_and_omit_combine(self):
+        events = self.results(reverse('events-list'), fields="card,host", omit="event_start_time,event_end_time")
+        self.assertEqual(set(events[0]), set(CARD) - {"event_start_time", "event_end_time"} | {"host"})
+        self.assertEqual(events[0]["host"], str(self.host))
+        events = self.results(reverse('events-by-category', args=[self.music.slug]), omit="about")
+        self.assertNotIn("about", events[0])
+        self.assertEqual(events[0]["category"], [str(self.music.pk)])
+
+    def test_unknown_fields_are_rejected(self):
+        res = self.client.get(reverse('events-list'), {"fields": "title,secret", "omit": "nothing"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("secret, nothing", str(res.json()))
+        res = self.client.get(reverse('events-list'), {"fields": "title", "omit": "title"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_pages_keep_their_ordering_columns(self):
+        url = reverse('events-list')
+        res = self.client.get(url, {"fields": "title", "pagination": "cursor", "max-size": 2, "ordering": "event_start_date"})
+        data = res.json()['data']
+        self.assertEqual([list(event) for event in data['results']], [["title"], ["title"]])
+        with self.assertMaxQueries(1):
+            res = self.client.get(data['next'])
+        self.assertEqual(len(res.json()['data']['results']), 1)
+
+    def test_detail_fields(self):
+        res = self.client.get(reverse('event-detail', args=["festival-1"]), {"fields": "title,about"})
+        self.assertEqual(res.json()['data'], {"title": "Festival 1", "about": "A test event"})
+        res = self.client.get(reverse('category-detail', args=[self.music.slug]), {"fields": "card"})
+        self.assertEqual(res.json()['data'], {"name": "Music", "slug": self.music.slug})
+
+    def test_category_counts_card(self):
+        categories = self.results(reverse('category-list'), fields="card", counts="true")
+        self.assertEqual(categories[0]["counts"]["upcoming_count"], 3)
+        self.assertEqual(set(categories[0]), {"name", "slug", "counts"})
+
+    def test_selections_are_resolved_once(self):
+        resolve_fieldset.cache_clear()
+        for _ in range(2):
+            self.results(reverse('events-list'), fields="card", nocache=_)
+        self.assertEqual(resolve_fieldset.cache_info().misses, 1)
+        self.assertEqual(resolve_fieldset(EventSerializer, "card", "").columns[0], "title")
+
+    def test_writes_ignore_fieldsets(self):
+        event = create_test_event("Owned Fair", host=self.host)
+        self.client.force_authenticate(self.host)
+        res = self.client.patch(f"{reverse('event-detail', args=[event.slug])}?fields=title", {"location": "Abuja"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data']['location'], "Abuja")
@@ -0,0 +1,143 @@
+from io import StringIO
+from tempfile import NamedTemporaryFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, TestSetup, create_test_event
+from event_portal import geo
+from event_portal.geocoding import geocode, geocode_events, load_gazetteer
+from event_portal.models import Event
+
+GAZETTEER = """name,latitude,longitude
+Lagos,6.5244,3.3792
+Ikeja,6.6018,3.3515
+Ibadan,7.3775,3.9470
+Abuja,9.0765,7.3986
+Suva,-18.1248,178.4501
+Taveuni,-16.8500,-179.9667
+"""
+
+LAGOS = (6.5244, 3.3792)
+
+
+class GeometryTestCase(SimpleTestCase):
+
+    def test_distance(self):
+        self.assertAlmostEqual(geo.distance_km(*LAGOS, 7.3775, 3.9470), 113.4, delta=1)
+        self.assertEqual(geo.distance_km(*LAGOS, *LAGOS), 0)
+
+    def test_bounding_box_encloses_the_circle(self):
+        min_lat, max_lat, min_lng, max_lng = geo.bounding_box(*LAGOS, 100)
+        for bearing_lat, bearing_lng in [(max_lat, LAGOS[1]), (min_lat, LAGOS[1])]:
+            self.assertAlmostEqual(geo.distance_km(*LAGOS, bearing_lat, bearing_lng), 100, delta=0.01)
+        self.assertGreater(geo.distance_km(*LAGOS, LAGOS[0], max_lng), 100)
+
+    def test_bounding_box_reaching_a_pole_spans_every_longitude(self):
+        self.assertEqual(geo.bounding_box(89.9, 10, 50)[2:], (None, None))
+
+    def test_grid_band(self):
+        self.assertEqual(geo.grid_band(6.5244), 13)
+        self.assertEqual(geo.grid_band(-0.1), -1)
+        self.assertIsNone(geo.grid_band(None))
+
+
+class GazetteerTestCase(SimpleTestCase):
+
+    def test_geocode_matches_location_then_address_parts(self):
+        places = load_gazetteer(GAZETTEER.splitlines())
+        self.assertEqual(geocode(" lagos ", None, places), LAGOS)
+        self.assertEqual(geocode("Eko Hotel", "16, Fawobi Street, Ikeja", places), (6.6018, 3.3515))
+        self.assertIsNone(geocode("Nowhere", "Somewhere", places))
+
+    def test_rejects_invalid_gazetteers(self):
+        with self.assertRaisesMessage(ValueError, "longitude"):
+            load_gazetteer(["name,latitude", "Lagos,6.5"])
+        with self.assertRaisesMessage(ValueError, "Line 2"):
+            load_gazetteer(["name,latitude,longitude", "Lagos,north,3.3"])
+        with self.assertRaisesMessage(ValueError, "out of range"):
+            load_gazetteer(["name,latitude,longitude", "Lagos,96,3.3"])
+
+
+class GeocodeEventsTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        self.places = load_gazetteer(GAZETTEER.splitlines())
+        return super().setUp()
+
+    def test_geocodes_events_without_coordinates(self):
+        lagos = create_test_event("Lagos Gig", address=None)
+        ikeja = create_test_event("Ikeja Gig", location="Eko Hotel")
+        lost = create_test_event("Lost Gig", location="Atlantis", address=None)
+        self.assertEqual(geocode_events(self.places, batch_size=2), (2, 1))
+        lagos.refresh_from_db()
+        ikeja.refresh_from_db()
+        self.assertEqual((lagos.latitude, lagos.longitude, lagos.geo_band), (*LAGOS, 13))
+        self.assertEqual((ikeja.latitude, ikeja.longitude), (6.6018, 3.3515))
+        self.assertGreater(ikeja.last_updated, lost.last_updated)
+        self.assertIsNone(Event.objects.get(pk=lost.pk).latitude)
+        self.assertEqual(geocode_events(self.places), (0, 1))
+
+    def test_command(self):
+        create_test_event("Lagos Gig")
+        with NamedTemporaryFile("w", suffix=".csv") as file:
+            file.write(GAZETTEER)
+            file.flush()
+            out = StringIO()
+            call_command("geocode_events", file.name, stdout=out)
+        self.assertIn("Geocoded 1 events, 0 events matched no place.", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("geocode_events", "/nonexistent.csv", stdout=StringIO())
+
+
+class NearFilterTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        self.client.force_authenticate(self.host)
+        create_test_event("Lagos Gig", latitude=6.5244, longitude=3.3792)
+        create_test_event("Ikeja Gig", latitude=6.6018, longitude=3.3515)
+        create_test_event("Ibadan Gig", latitude=7.3775, longitude=3.9470)
+        create_test_event("Abuja Gig", latitude=9.0765, longitude=7.3986)
+        create_test_event("Suva Gig", latitude=-18.1248, longitude=178.4501)
+        create_test_event("Taveuni Gig", latitude=-16.8500, longitude=-179.9667)
+        create_test_event("Unplaced Gig")
+        return super().setUp()
+
+    def titles(self, **params):
+        res = self.client.get(reverse('events-list'), params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        return sorted(event['title'] for event in res.json()['data']['results'])
+
+    def test_near(self):
+        self.assertEqual(self.titles(near="6.5244,3.3792"), ["Ikeja Gig", "Lagos Gig"])
+        self.assertEqual(self.titles(near="6.5244,3.3792", radius=120), ["Ibadan Gig", "Ikeja Gig", "Lagos Gig"])
+        self.assertEqual(self.titles(near="6.5244,3.3792", radius=1), ["Lagos Gig"])
+
+    def test_near_across_the_antimeridian(self):
+        self.assertEqual(self.titles(near="-17.5,179.5", radius=300), ["Suva Gig", "Taveuni Gig"])
+
+    def test_results_carry_coordinates(self):
+        res = self.client.get(reverse('events-list'), {"near": "6.5244,3.3792", "radius": 1})
+        event = res.json()['data']['results'][0]
+        self.assertEqual((event['latitude'], event['longitude']), LAGOS)
+
+    def test_invalid_parameters(self):
+        for params in [{"near": "6.5"}, {"near": "north,east"}, {"near": "91,3"}, {"near": "6,3", "radius": 501}]:
+            res = self.client.get(reverse('events-list'), params)
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_moving_an_event_clears_its_coordinates(self):
+        event = Event.objects.get(title="Lagos Gig")
+        event.host = self.host
+        event.save()
+        url = reverse('event-detail', args=[event.slug])
+        res = self.client.patch(url, {"about": "Now with more jazz"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        event.refresh_from_db()
+        self.assertEqual(event.latitude, LAGOS[0])
+        res = self.client.patch(url, {"location": "Abuja"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        event.refresh_from_db()
+        self.assertEqual((event.latitude, event.longitude, event.geo_band), (None, None, None))
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.importer import import_events, read_ndjson
+from event_portal.models import Category, Event
+
+
+def event_row(title, **fields):
+    row = {
+        "title": title, "event_start_date": "2030-05-01", "event_start_time": "10:00:00",
+        "event_end_date": "2030-05-02", "event_end_time": "18:00:00", "location": "Lagos",
+        "category": ["Technology"],
+    }
+    row.update(fields)
+    return row
+
+
+def ndjson(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+
+class EventImportTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        self.technology = Category.objects.create(name="Technology")
+        self.music = Category.objects.create(name="Music")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.host).access_token}")
+        return super().setUp()
+
+    def post(self, body, content_type="application/x-ndjson"):
+        return self.client.generic("POST", reverse('import-events'), body, content_type=content_type)
+
+    def test_ndjson_import_reports_bad_rows(self):
+        create_test_event("Existing Summit")
+        body = ndjson(
+            event_row("Data Summit", category=["technology", str(self.music.pk)]),
+            "{not json",
+            event_row("Existing Summit"),
+            event_row("Data Summit"),
+            event_row("Jazz Night", category=["Opera"]),
+            event_row("Backwards", event_end_date="2030-04-01"),
+            event_row("Jazz Brunch", category=["Music"]),
+        )
+        res = self.post(body)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        data = res.json()['data']
+        self.assertEqual(data['created'], 2)
+        self.assertEqual([error['row'] for error in data['errors']], [2, 3, 4, 5, 6])
+        self.assertIn("category", data['errors'][3]['errors'])
+        event = Event.objects.get(slug="data-summit")
+        self.assertEqual(event.host, self.host)
+        self.assertEqual(set(event.category.all()), {self.technology, self.music})
+
+    def test_imported_events_are_listed_and_searchable(self):
+        url = reverse('events-list')
+        self.assertEqual(self.client.get(url).json()['data']['count'], 0)
+        self.post(ndjson(event_row("Data Summit")))
+        self.assertEqual(self.client.get(url).json()['data']['count'], 1)
+        self.assertEqual(self.client.get(url, {"search": "summ"}).json()['data']['count'], 1)
+        res = self.client.get(reverse('events-by-category', args=["technology"]))
+        self.assertEqual(res.json()['data']['count'], 1)
+
+    def test_csv_import(self):
+        body = (
+            "title,event_start_date,event_start_time,event_end_date,event_end_time,location,address,category\n"
+            "Data Summit,2030-05-01,10:00,2030-05-02,18:00,Lagos,,Technology;Music\n"
+            "Old Gig,2020-05-01,10:00,2020-05-01,18:00,Lagos,Ikeja,Music\n"
+        )
+        res = self.post(body, content_type="text/csv")
+        self.assertEqual(res.json()['data']['created'], 2)
+        self.assertEqual(Event.objects.get(slug="data-summit").category.count(), 2)
+        self.assertTrue(Event.objects.get(slug="old-gig").expired)
+
+    def test_all_rows_rejected(self):
+        res = self.post(ndjson(event_row("No Category", category=[])))
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json()['data']['created'], 0)
+
+    def test_queries_do_not_grow_with_rows(self):
+        rows = [event_row(f"Summit {number}", category=["Technology", "Music"]) for number in range(40)]
+        # One chunk: category and title lookups, the two inserts, the search
+        # documents and the cache tags, whatever the number of rows.
+        with self.assertMaxQueries(14):
+            result = import_events(read_ndjson(ndjson(*rows).splitlines()), self.host, chunk_size=100)
+        self.assertEqual(result["created"], 40)
+        self.assertEqual(Event.category.through.objects.count(), 80)
+
+    def test_import_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as file:
+            file.write(ndjson(event_row("Data Summit"), event_row("Data Summit")))
+        self.addCleanup(os.remove, file.name)
+        out, err = StringIO(), StringIO()
+        call_command("import_events", file.name, host=self.host.email, stdout=out, stderr=err)
+        self.assertIn("Imported 1 events, rejected 1 rows", out.getvalue())
+        self.assertIn("Row 2", err.getvalue())
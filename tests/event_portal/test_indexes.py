@@ -0,0 +1,19 @@
+from io import StringIO
+from django.core.management import call_command
+from ..utils.setup import TestSetup
+from event_portal.management.commands.explain_event_queries import event_list_queries
+
+
+class ExplainEventQueriesTestCase(TestSetup):
+
+    def test_every_list_query_uses_an_index(self):
+        out = StringIO()
+        call_command("explain_event_queries", stdout=out)
+        report = out.getvalue()
+        self.assertEqual(report.count(": index"), len(event_list_queries()), report)
+        self.assertNotIn("full scan", report)
+
+    def test_prints_plans(self):
+        out = StringIO()
+        call_command("explain_event_queries", plans=True, stdout=out)
+        self.assertIn("event_upcoming_idx", out.getvalue())
@@ -0,0 +1,221 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..utils.setup import APITestSetup, TestSetup, create_test_event
+from event_portal import inventory
+from event_portal.models import Ticket, TicketInventoryShard, TicketOrder
+
+User = get_user_model()
+
+
+class InventoryTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buyer = self.create_test_user()
+        self.event = create_test_event("Sellout Concert", host=self.create_test_superuser())
+        self.ticket = Ticket.objects.create(ticket_type="Regular", ticket_price=50, event=self.event, capacity=5)
+
+    def available(self):
+        self.ticket.refresh_from_db()
+        return self.ticket.available
+
+    def test_new_ticket_is_fully_available(self):
+        self.assertEqual(self.available(), 5)
+
+    def test_hold_takes_stock(self):
+        order = inventory.hold_tickets(self.ticket, self.buyer, 3)
+        self.assertEqual(order.status, TicketOrder.HELD)
+        self.assertEqual(self.available(), 2)
+
+    def test_hold_cannot_oversell(self):
+        inventory.hold_tickets(self.ticket, self.buyer, 4)
+        with self.assertRaises(inventory.SoldOut):
+            inventory.hold_tickets(self.ticket, self.buyer, 2)
+        self.assertEqual(self.available(), 1)
+
+    def test_expired_event_cannot_be_held(self):
+        event = create_test_event("Last Year's Concert", days_ahead=-7)
+        ticket = Ticket.objects.create(ticket_type="Regular", ticket_price=50, event=event, capacity=5)
+        with self.assertRaises(inventory.EventEnded):
+            inventory.hold_tickets(ticket, self.buyer, 1)
+        ticket.refresh_from_db()
+        self.assertEqual(ticket.available, 5)
+
+    def test_confirm_and_cancel(self):
+        order = inventory.hold_tickets(self.ticket, self.buyer, 2)
+        self.assertEqual(inventory.confirm_order(order).status, TicketOrder.CONFIRMED)
+        with self.assertRaises(inventory.InvalidOrderState):
+            inventory.cancel_order(order)
+        other = inventory.hold_tickets(self.ticket, self.buyer, 2)
+        inventory.cancel_order(other)
+        self.assertEqual(self.available(), 3)
+
+    def test_expired_holds_return_stock(self):
+        order = inventory.hold_tickets(self.ticket, self.buyer, 5)
+        TicketOrder.objects.filter(pk=order.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        with self.assertRaises(inventory.HoldExpired):
+            inventory.confirm_order(order)
+        self.assertEqual(self.available(), 5)
+        self.assertEqual(inventory.release_expired_holds(), 0)
+
+    def test_sold_out_hold_reclaims_expired_holds(self):
+        order = inventory.hold_tickets(self.ticket, self.buyer, 5)
+        TicketOrder.objects.filter(pk=order.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        inventory.hold_tickets(self.ticket, self.buyer, 5)
+        order.refresh_from_db()
+        self.assertEqual(order.status, TicketOrder.EXPIRED)
+        self.assertEqual(self.available(), 0)
+
+
+class ShardedInventoryTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buyer = self.create_test_user()
+        self.event = create_test_event("Hot Drop", host=self.create_test_superuser())
+        self.ticket = Ticket.objects.create(ticket_type="Regular", ticket_price=50, event=self.event, capacity=10)
+        self.ticket = inventory.shard_inventory(self.ticket, 4)
+
+    def test_stock_is_spread_over_shards(self):
+        shards = list(TicketInventoryShard.objects.filter(ticket=self.ticket).values_list("available", flat=True))
+        self.assertEqual(sorted(shards), [2, 2, 3, 3])
+        self.assertEqual(self.ticket.available, 0)
+        self.assertEqual(inventory.remaining_tickets(self.ticket), 10)
+
+    def test_sharded_holds_sell_out_exactly(self):
+        for _ in range(10):
+            inventory.hold_tickets(self.ticket, self.buyer, 1)
+        with self.assertRaises(inventory.SoldOut):
+            inventory.hold_tickets(self.ticket, self.buyer, 1)
+        self.assertEqual(inventory.remaining_tickets(self.ticket), 0)
+
+    def test_rebalances_when_no_shard_has_enough(self):
+        inventory.hold_tickets(self.ticket, self.buyer, 5)
+        self.assertEqual(inventory.remaining_tickets(self.ticket), 5)
+        with self.assertRaises(inventory.SoldOut):
+            inventory.hold_tickets(self.ticket, self.buyer, 6)
+
+    def test_sold_out_holds_take_no_locks(self):
+        inventory.hold_tickets(self.ticket, self.buyer, 10)
+        with mock.patch.object(TicketInventoryShard.objects, "select_for_update", side_effect=AssertionError):
+            with self.assertRaises(inventory.SoldOut):
+                inventory.hold_tickets(self.ticket, self.buyer, 1)
+
+    def test_cancel_restocks_a_shard_and_unshard(self):
+        order = inventory.hold_tickets(self.ticket, self.buyer, 3)
+        inventory.cancel_order(order)
+        self.assertEqual(inventory.remaining_tickets(self.ticket), 10)
+        ticket = inventory.shard_inventory(self.ticket, 0)
+        self.assertEqual(ticket.available, 10)
+        self.assertFalse(TicketInventoryShard.objects.filter(ticket=ticket).exists())
+
+
+class TicketPurchaseAPITestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_superuser()
+        self.buyer = self.create_test_user()
+        self.event = create_test_event("Sellout Concert", host=self.host)
+        self.ticket = Ticket.objects.create(ticket_type="VIP", ticket_price=100, event=self.event, capacity=2)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.buyer).access_token}")
+        return super().setUp()
+
+    def test_list_event_tickets(self):
+        self.client.credentials()
+        res = self.client.get(reverse('event-tickets', args=[self.event.slug]))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data'][0]['available'], 2)
+
+    def test_only_host_adds_tickets(self):
+        url = reverse('event-tickets', args=[self.event.slug])
+        data = {"ticket_type": "Regular", "ticket_price": 10, "capacity": 100}
+        self.assertEqual(self.client.post(url, data).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.host).access_token}")
+        res = self.client.post(url, data)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.json()['data']['available'], 100)
+
+    def test_hold_and_confirm(self):
+        res = self.client.post(reverse('hold-ticket', args=[self.ticket.pk]), {"quantity": 2})
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        order_id = res.json()['data']['id']
+        res = self.client.post(reverse('hold-ticket', args=[self.ticket.pk]), {"quantity": 1})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res = self.client.post(reverse('confirm-order', args=[order_id]))
+        self.assertEqual(res.json()['data']['status'], TicketOrder.CONFIRMED)
+        res = self.client.get(reverse('my-orders'))
+        self.assertEqual(res.json()['data']['count'], 1)
+
+    def test_cannot_hold_tickets_of_expired_events(self):
+        event = create_test_event("Last Year's Concert", host=self.host, days_ahead=-7)
+        ticket = Ticket.objects.create(ticket_type="VIP", ticket_price=100, event=event, capacity=2)
+        res = self.client.post(reverse('hold-ticket', args=[ticket.pk]), {"quantity": 1})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("This event has ended", res.content.decode())
+
+    def test_cannot_confirm_another_users_order(self):
+        order = inventory.hold_tickets(self.ticket, self.host, 1)
+        res = self.client.post(reverse('confirm-order', args=[order.pk]))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ConcurrentPurchaseTestCase(TransactionTestCase):
+    buyers = 24
+    capacity = 10
+    shards = 0
+
+    def setUp(self) -> None:
+        self.event = create_test_event("Stress Test Festival")
+        self.ticket = Ticket.objects.create(ticket_type="Regular", ticket_price=20, event=self.event, capacity=self.capacity)
+        if self.shards:
+            self.ticket = inventory.shard_inventory(self.ticket, self.shards)
+        self.users = [
+            User.objects.create_user(email=f"buyer{i}@test.com", password="Akpororo1")
+            for i in range(self.buyers)
+        ]
+
+    def test_parallel_buyers_never_oversell(self):
+        barrier = threading.Barrier(self.buyers)
+        results = []
+
+        def buy(user):
+            barrier.wait()
+            try:
+                while True:
+                    try:
+                        inventory.hold_tickets(self.ticket, user, 1)
+                        results.append("held")
+                        return
+                    except inventory.SoldOut:
+                        results.append("sold out")
+                        return
+                    except OperationalError:
+                        # SQLite reports "database is locked" instead of
+                        # waiting; a real client would retry the request.
+                        continue
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=buy, args=(user,)) for user in self.users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        held = TicketOrder.objects.filter(ticket=self.ticket).count()
+        self.assertEqual(results.count("held"), self.capacity)
+        self.assertEqual(results.count("sold out"), self.buyers - self.capacity)
+        self.assertEqual(held, self.capacity)
+        self.assertEqual(inventory.remaining_tickets(self.ticket), 0)
+
+
+class ConcurrentShardedPurchaseTestCase(ConcurrentPurchaseTestCase):
+    shards = 4
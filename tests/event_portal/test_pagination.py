@@ -0,0 +1,60 @@
+from ..utils.setup import APITestSetup, create_test_event
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from event_portal.models import Category
+
+
+class CursorPaginationTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_superuser()
+        self.category = Category.objects.create(name="Technology")
+        self.events = [
+            create_test_event(f"Cursor event {i}", host=self.host, categories=[self.category])
+            for i in range(5)
+        ]
+        return super().setUp()
+
+    def collect_pages(self, url):
+        titles, pages = [], 0
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            body = res.json()
+            self.assertEqual(body['status'], 'Successful')
+            titles += [event['title'] for event in body['data']['results']]
+            url = body['data']['next']
+            pages += 1
+        return titles, pages
+
+    def test_cursor_pages_cover_every_event_once(self):
+        titles, pages = self.collect_pages(reverse('events-list') + "?pagination=cursor&max-size=2")
+        self.assertEqual(pages, 3)
+        self.assertEqual(sorted(titles), sorted(event.title for event in self.events))
+
+    def test_cursor_pagination_by_category_with_ordering(self):
+        url = reverse('events-by-category', args=[self.category.slug])
+        titles, _ = self.collect_pages(url + "?pagination=cursor&max-size=2&ordering=event_start_date")
+        self.assertEqual(len(set(titles)), 5)
+
+    def test_previous_cursor_returns_previous_page(self):
+        url = reverse('events-list') + "?pagination=cursor&max-size=2"
+        first = self.client.get(url).json()['data']
+        second = self.client.get(first['next']).json()['data']
+        self.assertIsNone(first['previous'])
+        back = self.client.get(second['previous']).json()['data']
+        self.assertEqual(back['results'], first['results'])
+
+    def test_cursor_pagination_skips_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(reverse('events-list') + "?pagination=cursor")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', res.json()['data'])
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+
+    def test_invalid_cursor(self):
+        res = self.client.get(reverse('events-list') + "?cursor=not-a-cursor")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(res.json()['status'], 'Error')
@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.models import Category
+
+User = get_user_model()
+
+# Queries allowed to list a page of events: the page count, the events with
+# their hosts, and the categories of every event on the page.
+EVENT_PAGE_BUDGET = 3
+
+
+class EventListQueryBudgetTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.categories = [Category.objects.create(name=f"Genre {number}") for number in range(3)]
+        self.add_events(2)
+        return super().setUp()
+
+    def add_events(self, count):
+        start = getattr(self, "created", 0)
+        for number in range(start, start + count):
+            host = User.objects.create_user(email=f"host{number}@test.com", password="testpassword1")
+            create_test_event(f"Festival {number}", host=host, categories=self.categories)
+        self.created = start + count
+
+    def assertPageWithinBudget(self, url, budget=EVENT_PAGE_BUDGET, **params):
+        for count in (0, 13):
+            self.add_events(count)
+            with self.assertMaxQueries(budget):
+                res = self.client.get(url, {"max-size": 15, **params})
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            # Vary the query string so the second page is not a cached response.
+            params["nocache"] = count
+
+    def test_event_list(self):
+        self.assertPageWithinBudget(reverse('events-list'))
+
+    def test_event_list_with_cursor(self):
+        self.assertPageWithinBudget(reverse('events-list'), budget=2, pagination="cursor")
+
+    def test_event_search(self):
+        self.assertPageWithinBudget(reverse('events-list'), search="festival")
+
+    def test_events_by_category(self):
+        self.assertPageWithinBudget(reverse('events-by-category', args=[self.categories[0].slug]))
+
+    def test_event_detail(self):
+        event = create_test_event("Solo Show", host=User.objects.get(email="host0@test.com"), categories=self.categories)
+        with self.assertMaxQueries(2):
+            res = self.client.get(reverse('event-detail', args=[event.slug]))
+        self.assertEqual(res.json()['data']['host'], str(event.host))
@@ -0,0 +1,48 @@
+import json
+import uuid
+from datetime import datetime, time, timezone
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.response import Response
+from ..utils.setup import TestSetup
+from event_portal.api.renderers import CustomRenderer
+
+
+class CustomRendererTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        self.renderer = CustomRenderer()
+        return super().setUp()
+
+    def render(self, data, status_code=200, exception=False):
+        response = Response(data, status=status_code)
+        response.exception = exception
+        return self.renderer.render(data, renderer_context={"response": response})
+
+    def test_success_output_matches_django_encoder(self):
+        data = {
+            "id": uuid.uuid4(),
+            "title": "Café night",
+            "created": datetime(2023, 10, 26, 11, 43, 0, 123456, tzinfo=timezone.utc),
+            "day": datetime(2023, 10, 26).date(),
+            "at": time(12, 30, 15, 250000),
+            "tags": [uuid.uuid4()],
+        }
+        expected = json.dumps({"status": "Successful", "data": data}, cls=DjangoJSONEncoder)
+        self.assertEqual(self.render(data), expected.encode("utf-8"))
+
+    def test_error_status_from_status_code(self):
+        data = {"title": [ErrorDetail("This field is required.", code="required")]}
+        expected = json.dumps({"status": "Error", "data": data})
+        self.assertEqual(self.render(data, status_code=400), expected.encode("utf-8"))
+
+    def test_error_status_from_exception(self):
+        body = json.loads(self.render({"detail": "Not found."}, status_code=200, exception=True))
+        self.assertEqual(body["status"], "Error")
+
+    def test_empty_body(self):
+        self.assertEqual(self.render(None, status_code=204), b'{"status": "Successful", "data": null}')
+
+    def test_aware_time_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.render({"at": time(12, 0, tzinfo=timezone.utc)})
@@ -0,0 +1,62 @@
+from io import StringIO
+from ..utils.setup import APITestSetup, create_test_event
+from django.core.management import call_command
+from django.urls import reverse
+from event_portal.models import Category, EventSearchDocument
+
+
+class EventSearchTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_superuser()
+        self.tech = Category.objects.create(name="Technology")
+        self.music = Category.objects.create(name="Music")
+        self.summit = create_test_event("Blockchain Summit", host=self.host, categories=[self.tech])
+        self.jazz = create_test_event("Jazz Night", host=self.host, location="Abuja", categories=[self.music])
+        self.gig = create_test_event("Technology Jazz Jam", host=self.host, categories=[self.music, self.tech])
+        return super().setUp()
+
+    def search(self, term, url=None):
+        res = self.client.get((url or reverse('events-list')) + f"?search={term}")
+        return [event['title'] for event in res.json()['data']['results']]
+
+    def test_search_matches_title_location_and_category(self):
+        self.assertEqual(self.search("blockchain"), ["Blockchain Summit"])
+        self.assertEqual(self.search("abuja"), ["Jazz Night"])
+        self.assertCountEqual(self.search("music"), ["Jazz Night", "Technology Jazz Jam"])
+
+    def test_search_matches_prefixes(self):
+        self.assertEqual(self.search("block"), ["Blockchain Summit"])
+
+    def test_results_are_ranked(self):
+        self.assertEqual(self.search("technology")[0], "Technology Jazz Jam")
+
+    def test_search_with_explicit_ordering(self):
+        self.assertCountEqual(self.search("jazz&ordering=event_start_date"), ["Jazz Night", "Technology Jazz Jam"])
+
+    def test_search_by_category_endpoint(self):
+        url = reverse('events-by-category', args=[self.music.slug])
+        self.assertEqual(self.search("night", url), ["Jazz Night"])
+        # The category endpoint searches the same document as the list.
+        self.assertEqual(self.search("technology", url), ["Technology Jazz Jam"])
+
+    def test_document_follows_category_changes(self):
+        self.summit.category.add(self.music)
+        self.assertIn("Blockchain Summit", self.search("music"))
+        self.music.delete()
+        self.assertEqual(self.search("music"), [])
+
+    def test_rebuild_search_index(self):
+        EventSearchDocument.objects.all().delete()
+        self.assertEqual(self.search("jazz"), [])
+        call_command("rebuild_search_index", verbosity=0, stdout=StringIO())
+        self.assertEqual(len(self.search("jazz")), 2)
+
+    def test_search_with_cursor_pagination(self):
+        url = reverse('events-list') + "?search=jazz&pagination=cursor&max-size=1"
+        titles = []
+        while url:
+            data = self.client.get(url).json()['data']
+            titles += [event['title'] for event in data['results']]
+            url = data['next']
+        self.assertCountEqual(titles, ["Jazz Night", "Technology Jazz Jam"])
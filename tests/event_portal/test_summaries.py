@@ -0,0 +1,82 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.expiry import expire_events
+from event_portal.importer import import_events, read_ndjson
+from event_portal.models import Category, CategorySummary, Event
+
+
+class CategorySummaryTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.music = Category.objects.create(name="Music")
+        self.technology = Category.objects.create(name="Technology")
+        return super().setUp()
+
+    def assertSummary(self, category, count, next_start_date=None):
+        summary = CategorySummary.objects.get(category=category)
+        self.assertEqual((summary.upcoming_count, summary.next_start_date), (count, next_start_date))
+
+    def test_new_categories_start_empty(self):
+        self.assertSummary(self.music, 0)
+
+    def test_signals_follow_event_changes(self):
+        event = create_test_event("Jazz Night", categories=[self.music], days_ahead=5)
+        create_test_event("Rock Night", categories=[self.music], days_ahead=9)
+        self.assertSummary(self.music, 2, date.today() + timedelta(days=5))
+        event.category.set([self.technology])
+        self.assertSummary(self.music, 1, date.today() + timedelta(days=9))
+        self.assertSummary(self.technology, 1, date.today() + timedelta(days=5))
+        event.category.clear()
+        self.assertSummary(self.technology, 0)
+        event.category.add(self.technology)
+        event.event_start_date = date.today() + timedelta(days=2)
+        event.save()
+        self.assertSummary(self.technology, 1, date.today() + timedelta(days=2))
+        event.delete()
+        self.assertSummary(self.technology, 0)
+
+    def test_bulk_paths_refresh_summaries(self):
+        row = {
+            "title": "Imported", "event_start_date": "2030-05-01", "event_start_time": "10:00:00",
+            "event_end_date": "2030-05-02", "event_end_time": "18:00:00", "location": "Lagos",
+            "category": ["Music"],
+        }
+        import_events(read_ndjson([json.dumps(row)]), self.create_test_user())
+        self.assertSummary(self.music, 1, date(2030, 5, 1))
+        event = Event.objects.get(title="Imported")
+        Event.objects.filter(pk=event.pk).update(event_end_date=date.today() - timedelta(days=1))
+        expire_events()
+        self.assertSummary(self.music, 0)
+
+    def test_reconcile_command_corrects_drift(self):
+        create_test_event("Jazz Night", categories=[self.music])
+        CategorySummary.objects.update(upcoming_count=7)
+        out = StringIO()
+        call_command("reconcile_category_summaries", stdout=out)
+        self.assertIn("Corrected 2 category summaries", out.getvalue())
+        self.assertSummary(self.music, 1, date.today() + timedelta(days=7))
+
+    def test_category_list_counts_in_one_read(self):
+        create_test_event("Jazz Night", categories=[self.music])
+        url = reverse('category-list')
+        self.assertNotIn("counts", self.client.get(url).json()['data']['results'][0])
+        with self.assertMaxQueries(2):
+            response = self.client.get(url, {"counts": "true"})
+        counts = {row['name']: row['counts'] for row in response.json()['data']['results']}
+        self.assertEqual(counts["Music"], {
+            "upcoming_count": 1, "next_start_date": (date.today() + timedelta(days=7)).isoformat(),
+        })
+        self.assertEqual(counts["Technology"]["upcoming_count"], 0)
+
+    def test_counts_follow_event_changes_through_caches(self):
+        url = reverse('category-list')
+        first = self.client.get(url, {"counts": "1"})
+        create_test_event("Jazz Night", categories=[self.music])
+        second = self.client.get(url, {"counts": "1"}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        counts = {row['name']: row['counts']['upcoming_count'] for row in second.json()['data']['results']}
+        self.assertEqual(counts["Music"], 1)
@@ -0,0 +1,67 @@
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from django.urls import reverse
+from django.utils import timezone
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.api.serializers import CategorySerializer, CategoryWithCountsSerializer, EventSerializer
+from event_portal.api.values import (
+    CategoryValuesSerializer, CategoryWithCountsValuesSerializer, EventValuesSerializer,
+)
+from event_portal.models import Category, CategorySummary, Event
+
+
+def sort_categories(data):
+    return [dict(item, category=sorted(item["category"])) if "category" in item else dict(item) for item in data]
+
+
+class ValuesSerializerParityTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.music = Category.objects.create(name="Music")
+        self.technology = Category.objects.create(name="Technology")
+        self.host = self.create_test_user()
+        create_test_event("Jazz Night", host=self.host, categories=[self.music, self.technology])
+        create_test_event("No Host Fair", address=None, about=None, days_ahead=-3)
+        create_test_event("Code Camp", host=self.host, categories=[self.technology], days_ahead=30)
+        return super().setUp()
+
+    def assertSameOutput(self, serializer_class, values_serializer_class, queryset, fields=None):
+        expected = serializer_class(list(queryset), many=True, fields=fields).data
+        rows = values_serializer_class(fields=fields).rows(queryset)
+        data = values_serializer_class(rows, fields=fields).data
+        self.assertEqual(sort_categories(data), sort_categories(expected))
+        self.assertEqual([list(item) for item in data], [list(item) for item in expected])
+
+    def test_events_match_event_serializer(self):
+        queryset = Event.objects.select_related("host").prefetch_related("category").order_by("title")
+        self.assertSameOutput(EventSerializer, EventValuesSerializer, queryset)
+        with timezone.override("Africa/Lagos"):
+            self.assertSameOutput(EventSerializer, EventValuesSerializer, queryset)
+        self.assertSameOutput(EventSerializer, EventValuesSerializer, queryset, fields=("title", "host", "category"))
+        self.assertSameOutput(EventSerializer, EventValuesSerializer, queryset, fields=("slug", "about"))
+
+    def test_categories_match_category_serializers(self):
+        CategorySummary.objects.filter(category=self.music).delete()
+        queryset = Category.objects.select_related("summary").order_by("name")
+        self.assertSameOutput(CategorySerializer, CategoryValuesSerializer, queryset)
+        self.assertSameOutput(CategoryWithCountsSerializer, CategoryWithCountsValuesSerializer, queryset)
+        self.assertSameOutput(
+            CategoryWithCountsSerializer, CategoryWithCountsValuesSerializer, queryset, fields=("name", "counts"),
+        )
+
+    def test_lists_are_served_from_values(self):
+        # The page count, the events with their hosts, and their categories.
+        with self.assertMaxQueries(3):
+            res = self.client.get(reverse('events-list'), {"ordering": "title"})
+        queryset = Event.objects.filter(expired=False).prefetch_related("category").order_by("title")
+        expected = json.loads(json.dumps(EventSerializer(queryset, many=True).data, cls=DjangoJSONEncoder))
+        self.assertEqual(sort_categories(res.json()['data']['results']), sort_categories(expected))
+
+    def test_cursor_pages_over_values(self):
+        url = reverse('events-by-category', args=[self.technology.slug])
+        res = self.client.get(url, {"pagination": "cursor", "max-size": 1})
+        first = res.json()['data']
+        self.assertEqual(len(first['results']), 1)
+        second = self.client.get(first['next']).json()['data']
+        self.assertNotEqual(second['results'][0]['title'], first['results'][0]['title'])
+        self.assertIsNone(second['next'])
@@ -0,0 +1,121 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..utils.setup import APITestSetup, TestSetup, create_test_event
+from event_portal import waiting_room
+from event_portal.models import Ticket
+
+
+@override_settings(WAITING_ROOM_BURST=2)
+class WaitingRoomTestCase(TestSetup):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = create_test_event("Stadium Tour", admission_rate=60)
+
+    def join(self, now):
+        return waiting_room.join(self.event.slug, 60, now=now)
+
+    def test_burst_is_admitted_then_rate_applies(self):
+        queued = [self.join(1000) for _ in range(5)]
+        self.assertEqual([q["position"] for q in queued], [1, 2, 3, 4, 5])
+        self.assertEqual([q["admitted"] for q in queued], [True, True, False, False, False])
+        self.assertEqual(queued[4]["ahead"], 2)
+        self.assertEqual(queued[4]["estimated_wait"], 3)
+        self.assertTrue(waiting_room.get_status(queued[2]["token"], now=1001)["admitted"])
+        self.assertFalse(waiting_room.get_status(queued[4]["token"], now=1001)["admitted"])
+        self.assertTrue(waiting_room.get_status(queued[4]["token"], now=1003)["admitted"])
+
+    def test_idle_time_does_not_admit_a_later_spike(self):
+        self.join(1000)
+        queued = [self.join(5000) for _ in range(4)]
+        self.assertEqual([q["admitted"] for q in queued], [True, True, False, False])
+
+    def test_status_does_not_query_the_database(self):
+        token = self.join(1000)["token"]
+        waiting_room.get_status(token)
+        with self.assertNumQueries(0):
+            for _ in range(10):
+                waiting_room.get_status(token)
+
+    def test_rate_change_applies_immediately(self):
+        token = self.join(1000)["token"]
+        self.event.admission_rate = None
+        self.event.save()
+        self.assertEqual(waiting_room.get_status(token)["estimated_wait"], 0)
+        self.assertIsNone(waiting_room.get_admission_rate(self.event.slug))
+
+    def test_invalid_tokens(self):
+        token = self.join(1000)["token"]
+        with self.assertRaises(waiting_room.InvalidQueueToken):
+            waiting_room.read_token(token + "x")
+        with self.assertRaises(waiting_room.InvalidQueueToken):
+            waiting_room.read_token(token, "another-event")
+        with self.assertRaises(waiting_room.InvalidQueueToken):
+            waiting_room.read_token(None)
+
+    def test_admitted_token_is_bound_to_one_buyer(self):
+        token = self.join(1000)["token"]
+        waiting_room.admit(self.event, token, 1, now=1000)
+        with self.assertRaisesMessage(waiting_room.InvalidQueueToken, "another buyer"):
+            waiting_room.admit(self.event, token, 2, now=1000)
+
+    def test_admitted_token_is_used_once(self):
+        token = self.join(1000)["token"]
+        waiting_room.admit(self.event, token, 1, now=1000)
+        with self.assertRaisesMessage(waiting_room.InvalidQueueToken, "already been used"):
+            waiting_room.admit(self.event, token, 1, now=1000)
+        waiting_room.release(self.event, token)
+        waiting_room.admit(self.event, token, 1, now=1000)
+
+
+@override_settings(WAITING_ROOM_BURST=1)
+class WaitingRoomAPITestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.buyer = self.create_test_user()
+        self.event = create_test_event("Stadium Tour", admission_rate=1)
+        self.ticket = Ticket.objects.create(ticket_type="Regular", ticket_price=80, event=self.event, capacity=10)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.buyer).access_token}")
+        return super().setUp()
+
+    def test_join_and_poll(self):
+        res = self.client.post(reverse('waiting-room-join', args=[self.event.slug]))
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        data = res.json()['data']
+        self.assertEqual(data['position'], 1)
+        self.assertTrue(data['admitted'])
+        res = self.client.get(reverse('waiting-room-status'), HTTP_X_QUEUE_TOKEN=data['token'])
+        self.assertEqual(res.json()['data']['position'], 1)
+        res = self.client.get(reverse('waiting-room-status'), HTTP_X_QUEUE_TOKEN="bogus")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_join_event_without_waiting_room(self):
+        event = create_test_event("Open Gig")
+        res = self.client.post(reverse('waiting-room-join', args=[event.slug]))
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_join_unknown_event(self):
+        res = self.client.post(reverse('waiting-room-join', args=["no-such-event"]))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_hold_requires_admission(self):
+        url = reverse('hold-ticket', args=[self.ticket.pk])
+        self.assertEqual(self.client.post(url, {"quantity": 1}).status_code, status.HTTP_403_FORBIDDEN)
+        first = self.client.post(reverse('waiting-room-join', args=[self.event.slug])).json()['data']
+        second = self.client.post(reverse('waiting-room-join', args=[self.event.slug])).json()['data']
+        res = self.client.post(url, {"quantity": 1}, HTTP_X_QUEUE_TOKEN=second['token'])
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        res = self.client.post(url, {"quantity": 1}, HTTP_X_QUEUE_TOKEN=first['token'])
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        res = self.client.post(url, {"quantity": 1}, HTTP_X_QUEUE_TOKEN=first['token'])
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_failed_hold_keeps_the_token(self):
+        url = reverse('hold-ticket', args=[self.ticket.pk])
+        token = self.client.post(reverse('waiting-room-join', args=[self.event.slug])).json()['data']['token']
+        res = self.client.post(url, {"quantity": 11}, HTTP_X_QUEUE_TOKEN=token)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res = self.client.post(url, {"quantity": 1}, HTTP_X_QUEUE_TOKEN=token)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
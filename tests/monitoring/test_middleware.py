@@ -0,0 +1,91 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.models import Category
+from monitoring.metrics import Histogram, registry
+
+
+def parse_server_timing(header):
+    timings = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        timings[name] = dict(param.split("=", 1) for param in params)
+    return timings
+
+
+class PerformanceMiddlewareTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        music = Category.objects.create(name="Music")
+        for number in range(3):
+            create_test_event(f"Festival {number}", host=self.host, categories=[music])
+        registry.reset()
+        return super().setUp()
+
+    def test_server_timing_header(self):
+        with self.assertMaxQueries(10) as context:
+            res = self.client.get(reverse('events-list'))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        timings = parse_server_timing(res["Server-Timing"])
+        self.assertEqual(set(timings), {"total", "db", "serialize", "render"})
+        self.assertEqual(timings["db"]["desc"], f'"{len(context.captured_queries)} queries"')
+        self.assertGreater(float(timings["serialize"]["dur"]), 0)
+        self.assertGreater(float(timings["render"]["dur"]), 0)
+        self.assertGreaterEqual(float(timings["total"]["dur"]), float(timings["db"]["dur"]))
+
+    def test_requests_are_recorded_per_url_name(self):
+        for _ in range(3):
+            self.client.get(reverse('events-list'))
+        self.client.get(reverse('event-detail', args=["festival-1"]))
+        summary = registry.summary()
+        self.assertEqual(summary["events-list"]["total"]["count"], 3)
+        self.assertEqual(summary["event-detail"]["total"]["count"], 1)
+
+    async def test_async_requests_are_recorded(self):
+        res = await self.async_client.get(reverse('async:events-list'))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("Server-Timing", res)
+        # Queries run by async views on worker threads are counted too.
+        self.assertGreater(registry.summary()["async:events-list"]["queries"]["max"], 0)
+
+    def test_report_is_staff_only(self):
+        self.client.get(reverse('events-list'))
+        url = reverse('performance-report')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        admin = self.create_test_superuser()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(admin).access_token}")
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        total = res.json()['data']["events-list"]["total"]
+        self.assertEqual(total["count"], 1)
+        self.assertLessEqual(total["p50"], total["p99"])
+
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("events-list", registry.summary())
+
+    @override_settings(PERFORMANCE_MONITORING=False)
+    def test_monitoring_can_be_turned_off(self):
+        res = self.client.get(reverse('events-list'))
+        self.assertNotIn("Server-Timing", res)
+        self.assertEqual(registry.summary(), {})
+
+
+class HistogramTestCase(SimpleTestCase):
+
+    def test_percentiles_are_within_a_bucket(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 1000)
+        self.assertEqual(summary["max"], 1000)
+        for name, expected in (("p50", 500), ("p95", 950), ("p99", 990)):
+            self.assertGreaterEqual(summary[name], expected)
+            self.assertLessEqual(summary[name], expected * 1.1)
+
+    def test_empty_histogram(self):
+        self.assertEqual(Histogram().summary()["p99"], None)
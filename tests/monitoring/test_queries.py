@@ -0,0 +1,129 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..utils.setup import APITestSetup, create_test_event
+from event_portal.models import Category
+from monitoring import queries
+from monitoring.queries import fingerprint, query_stats
+
+
+class FingerprintTestCase(SimpleTestCase):
+
+    def test_literals_are_normalized(self):
+        key, sql = fingerprint(
+            'SELECT "event"."id" FROM "event" WHERE "event"."location" = \'Lagos\'  AND "event"."capacity" > 10'
+        )
+        self.assertEqual(sql, 'SELECT "event"."id" FROM "event" WHERE "event"."location" = ? AND "event"."capacity" > ?')
+        self.assertEqual(key, fingerprint(
+            'SELECT "event"."id" FROM "event" WHERE "event"."location" = \'It\'\'s\' AND "event"."capacity" > 2.5'
+        )[0])
+
+    def test_placeholders_and_in_lists_are_normalized(self):
+        key, sql = fingerprint('SELECT "t1"."id" FROM "t1" WHERE "t1"."id" IN (%s, %s, %s) LIMIT 21')
+        self.assertEqual(sql, 'SELECT "t1"."id" FROM "t1" WHERE "t1"."id" IN (...) LIMIT ?')
+        self.assertEqual(key, fingerprint('SELECT "t1"."id" FROM "t1" WHERE "t1"."id" IN (%s) LIMIT 5')[0])
+
+
+class SlowQueryLogTestCase(APITestSetup):
+
+    def setUp(self) -> None:
+        self.host = self.create_test_user()
+        music = Category.objects.create(name="Music")
+        Category.objects.create(name="Comedy")
+        for number in range(3):
+            create_test_event(f"Festival {number}", host=self.host, categories=[music])
+        query_stats.reset()
+        queries._explained.clear()
+        return super().setUp()
+
+    def test_statements_are_aggregated_by_fingerprint(self):
+        self.client.get(reverse('events-list'), {"location": "Lagos"})
+        self.client.get(reverse('events-list'), {"location": "Abuja"})
+        statement = next(stats for stats in query_stats.top(100) if "event_portal_event" in stats["sql"]
+                         and '"location" = ?' in stats["sql"] and stats["sql"].startswith("SELECT COUNT"))
+        self.assertEqual(statement["count"], 2)
+        self.assertGreaterEqual(statement["total"], statement["max"])
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_slow_queries_are_logged_with_plans(self):
+        with self.assertLogs("monitoring.slow_queries", "INFO") as logs:
+            self.client.get(reverse('events-by-category', args=["music"]))
+            self.client.get(reverse('events-by-category', args=["comedy"]))
+        entries = [json.loads(record.getMessage()) for record in logs.records]
+        # The count behind the list's ETag, run once per request.
+        lookups = [entry for entry in entries
+                   if entry["sql"].startswith("SELECT COUNT") and '"event_portal_category"."slug" = ?' in entry["sql"]]
+        self.assertEqual(len(lookups), 2)
+        self.assertEqual(lookups[0]["fingerprint"], lookups[1]["fingerprint"])
+        self.assertEqual(lookups[0]["path"], reverse('events-by-category', args=["music"]))
+        # Each statement is explained once.
+        self.assertTrue(lookups[0]["plan"])
+        self.assertIsNone(lookups[1]["plan"])
+        self.assertNotIn("music", " ".join(entry["sql"] for entry in entries))
+
+    def test_failed_explain_leaves_the_transaction_usable(self):
+        with transaction.atomic():
+            self.assertIsNone(queries.explain(connection, "SELECT * FROM missing_table", ()))
+            self.assertFalse(connection.needs_rollback)
+            self.assertEqual(Category.objects.count(), 2)
+        self.assertTrue(queries.explain(connection, 'SELECT * FROM "event_portal_category"', ()))
+
+    def test_query_report_is_staff_only(self):
+        self.client.get(reverse('events-list'))
+        url = reverse('query-report')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        admin = self.create_test_superuser()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(admin).access_token}")
+        res = self.client.get(url, {"order": "count", "limit": 3})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        counts = [statement["count"] for statement in res.json()['data']]
+        self.assertEqual(len(counts), 3)
+        self.assertEqual(counts, sorted(counts, reverse=True))
+        self.assertEqual(self.client.get(url, {"order": "slowest"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TopQueriesCommandTestCase(SimpleTestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "slow_queries.log")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, path, *entries):
+        with open(path, "w", encoding="utf-8") as log:
+            for key, duration, plan in entries:
+                log.write(json.dumps({"fingerprint": key, "sql": f"SELECT {key}", "duration": duration, "plan": plan}))
+                log.write("\n")
+
+    def test_statements_are_ranked(self):
+        self.write(f"{self.path}.1", ("aaa", 150, ["SCAN event_portal_event"]), ("bbb", 400, None))
+        self.write(self.path, ("aaa", 300, None), ("aaa", 120, None))
+        with open(self.path, "a", encoding="utf-8") as log:
+            log.write("not json\n")
+        out, err = StringIO(), StringIO()
+        call_command("top_queries", file=self.path, plans=True, stdout=out, stderr=err)
+        report = out.getvalue()
+        self.assertLess(report.index("1. aaa: 3 slow runs, 570.0 ms total"), report.index("2. bbb"))
+        self.assertIn("SCAN event_portal_event", report)
+        self.assertIn("(no plan captured)", report)
+        self.assertIn("Skipped 1", err.getvalue())
+
+        out = StringIO()
+        call_command("top_queries", file=self.path, order="max", limit=1, stdout=out)
+        self.assertIn("1. bbb", out.getvalue())
+        self.assertNotIn("aaa", out.getvalue())
+
+    def test_missing_log(self):
+        with self.assertRaises(CommandError):
+            call_command("top_queries", file=self.path)
@@ -1,18 +1,84 @@
 from django.test import TestCase  
 from django.contrib.auth import get_user_model 
+from django.core.cache import caches
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+from unittest import mock
+from django.db.backends.utils import CursorWrapper
 from authentication.models import CustomUser
 from rest_framework.test import APITestCase
 from typing import Dict, Any 
+from datetime import date, timedelta
 from authentication.api.serializers import * 
+from event_portal.models import Event
 
 User = get_user_model()
 
 
-class TestSetup(TestCase):
+def create_test_event(title: str, host: CustomUser = None, categories=(), days_ahead: int = 7, **kwargs: Dict[str, Any]) -> Event:
+    start = date.today() + timedelta(days=days_ahead)
+    fields = {
+        "event_start_date": start,
+        "event_end_date": start + timedelta(days=1),
+        "event_start_time": "12:00:00",
+        "event_end_time": "18:00:00",
+        "location": "Lagos",
+        "address": "16, Fawobi Street, Allen Avenue, Ikeja",
+        "about": "A test event",
+    }
+    fields.update(kwargs)
+    event = Event.objects.create(title=title, host=host, **fields)
+    if categories:
+        event.category.set(categories)
+    return event
+
+
+class QueryBudgetMixin:
+    """
+    Adds `assertMaxQueries`, which fails a test when a block of code runs
+    more database queries than its budget, listing the queries it ran, and
+    `assertMaxQueriesAsync`, its counterpart for async tests.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, budget: int, using: str = "default"):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        self.checkQueryBudget(context, budget)
+
+    @asynccontextmanager
+    async def assertMaxQueriesAsync(self, budget: int):
+        # Async views reach the database from worker threads, each with its
+        # own connection, so count the queries of every cursor.
+        context = SimpleNamespace(captured_queries=[])
+
+        def execute(cursor, sql, params=None):
+            context.captured_queries.append({"sql": sql})
+            return real_execute(cursor, sql, params)
+
+        real_execute = CursorWrapper.execute
+        with mock.patch.object(CursorWrapper, "execute", execute):
+            yield context
+        self.checkQueryBudget(context, budget)
+
+    def checkQueryBudget(self, context: Any, budget: int) -> None:
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = "\n".join(
+                f"{number}. {query['sql']}" for number, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{executed} queries executed, the budget is {budget}:\n{queries}")
+
+
+class TestSetup(QueryBudgetMixin, TestCase):
     
     def setUp(self) -> None:
         print(f"Starting test for {str(self)}...")
         print("---------------")
+        for cache in caches.all():
+            cache.clear()
         return super().setUp()
         
     def create_test_user(self, **kwargs: Dict[str, Any]) -> CustomUser:
@@ -42,11 +108,13 @@ class TestSetup(TestCase):
         return super().tearDown()
         
 
-class APITestSetup(APITestCase):
+class APITestSetup(QueryBudgetMixin, APITestCase):
     
     def setUp(self) -> None:
         print(f"Starting test for {str(self)}...")
         print("---------------")
+        for cache in caches.all():
+            cache.clear()
         return super().setUp()
     
     def create_test_user(self, **kwargs: Dict[str, Any]) -> CustomUser: